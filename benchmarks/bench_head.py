@@ -0,0 +1,48 @@
+"""Benchmark decoding the heads of the test Eventories.
+
+Compares the pure-Python YAML loader, the libyaml loader (if available) and JSON heads.
+
+Usage::
+
+    python benchmarks/bench_head.py [iterations]
+"""
+
+import glob
+import json
+import sys
+import timeit
+from os import path
+
+import yaml
+
+from eventory.parser import EventoryParser, decode_head
+
+HERE = path.dirname(path.abspath(__file__))
+STORIES = sorted(glob.glob(path.join(HERE, "..", "tests", "*.evory")))
+
+
+def main(iterations: int = 2000):
+    heads = []
+    for location in STORIES:
+        with open(location, "r") as f:
+            head, _ = EventoryParser.preload(f)
+        heads.append(head)
+    json_heads = [json.dumps(yaml.safe_load(head)) for head in heads]
+
+    candidates = [("yaml (pure Python)", lambda head: yaml.load(head, Loader=yaml.SafeLoader), heads)]
+    if hasattr(yaml, "CSafeLoader"):
+        candidates.append(("yaml (libyaml)", lambda head: yaml.load(head, Loader=yaml.CSafeLoader), heads))
+    candidates.append(("decode_head (YAML head)", decode_head, heads))
+    candidates.append(("decode_head (JSON head)", decode_head, json_heads))
+
+    print(f"decoding {len(heads)} heads {iterations} times")
+    baseline = None
+    for name, decoder, data in candidates:
+        duration = timeit.timeit(lambda: [decoder(head) for head in data], number=iterations)
+        throughput = len(data) * iterations / duration
+        baseline = baseline or throughput
+        print(f"{name:<26} {throughput:>12.0f} heads/s ({throughput / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,73 @@
+"""Benchmark the ink backends on The Intercept (or another story).
+
+Compares creating a Story and playing through the story (always taking the first choice) with the .NET runtime and pink. Raw ink is compiled
+once beforehand, so "inklecate.exe" is needed unless the story is already compiled (like "tests/compiled.evory"). A backend is skipped if it
+can't be loaded or can't run the story. pink only runs inkVersion 18, which is what inklecate 0.8 produces.
+
+Usage::
+
+    python benchmarks/bench_pink.py [iterations] [story]
+"""
+
+import sys
+import timeit
+from os import path
+
+import eventory
+
+HERE = path.dirname(path.abspath(__file__))
+STORY = path.join(HERE, "..", "tests", "the_intercept.evory")
+MAX_TURNS = 500
+
+
+def play(story) -> int:
+    lines = 0
+    for _ in range(MAX_TURNS):
+        while story.canContinue:
+            story.Continue()
+            lines += 1
+        if story.currentChoices.Count == 0:
+            break
+        story.ChooseChoiceIndex(0)
+    return lines
+
+
+def main(iterations: int = 20, story_location: str = STORY):
+    eventory.load_ext("inktory")
+    from eventory.ext.inktory import BACKENDS, InklecateNotFound, get_story_class
+
+    with open(story_location, "r", encoding="utf-8") as f:
+        try:
+            compiled = eventory.load(f).content.compiled
+        except InklecateNotFound as e:
+            print(f"can't compile {path.basename(story_location)} ({e})")
+            return
+
+    print(f"loading and playing {path.basename(story_location)} {iterations} times")
+    baseline = None
+    for backend in BACKENDS:
+        try:
+            story_cls = get_story_class(backend)
+            lines = play(story_cls(compiled))
+        except (ImportError, FileNotFoundError) as e:
+            print(f"{backend:<8} skipped ({e})")
+            continue
+        except Exception as e:
+            # pink raises StoryException, the .NET runtime System.Exception (e.g. when the story was compiled by an incompatible inklecate)
+            print(f"{backend:<8} skipped, can't run the story ({e})")
+            continue
+        load_duration = timeit.timeit(lambda: story_cls(compiled), number=iterations) / iterations
+        story = story_cls(compiled)
+
+        def reset_and_play():
+            story.ResetState()
+            play(story)
+
+        play_duration = timeit.timeit(reset_and_play, number=iterations) / iterations
+        baseline = baseline or play_duration
+        print(f"{backend:<8} load {1000 * load_duration:>8.1f} ms, play {1000 * play_duration:>8.1f} ms for {lines} lines "
+              f"({baseline / play_duration:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) if i == 0 else arg for i, arg in enumerate(sys.argv[1:])))
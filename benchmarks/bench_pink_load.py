@@ -0,0 +1,86 @@
+"""Benchmark loading compiled ink with pink.
+
+Compares turning the tokens of the compiled test stories into runtime objects using the lookup tables of Json.j_token_to_runtime_object with the
+chain of checks it used before and measures how long creating a Story takes, with all of its content and lazily. "compiled.evory" is always
+used, the other test stories are only used if "inklecate.exe" can compile them.
+
+Usage::
+
+    python benchmarks/bench_pink_load.py [iterations]
+"""
+
+import glob
+import json
+import sys
+import timeit
+from os import path
+
+import eventory
+from eventory.ext.inktory.pink.engine.control_command import CommandType, ControlCommand
+from eventory.ext.inktory.pink.engine.json_serialisation import Json
+from eventory.ext.inktory.pink.engine.native_function_call import NativeFunctionCall
+from eventory.ext.inktory.pink.engine.story import Story
+
+HERE = path.dirname(path.abspath(__file__))
+STORIES = path.join(HERE, "..", "tests", "*.evory")
+
+
+def chain_token_to_runtime_object(token):
+    if isinstance(token, str):
+        if token[0] == "^" or token == "\n" or token == "<>":
+            return Json.j_token_to_runtime_object(token)
+        for i, name in enumerate(Json._control_command_names):
+            if token == name:
+                return ControlCommand(CommandType(i))
+        name = "^" if token == "L^" else token
+        if NativeFunctionCall.call_exists_with_name(name):
+            return NativeFunctionCall.call_with_name(name)
+    elif isinstance(token, dict):
+        for key in ("^->", "^var", "->", "f()", "->t->", "x()", "*", "VAR?", "CNT?", "VAR=", "temp=", "#", "list", "originalChoicePath"):
+            if key in token:
+                return Json._dict_tokens[key](token, key)
+    return Json.j_token_to_runtime_object(token)
+
+
+def collect_tokens(token, tokens: list):
+    if isinstance(token, list):
+        for child in token[:-1]:
+            collect_tokens(child, tokens)
+        if isinstance(token[-1], dict):
+            for key, value in token[-1].items():
+                if key not in ("#f", "#n"):
+                    collect_tokens(value, tokens)
+    elif token is not None:
+        tokens.append(token)
+
+
+def load_stories() -> dict:
+    stories = {}
+    for filename in sorted(glob.glob(STORIES)):
+        with open(filename, "r") as f:
+            try:
+                eventory_obj = eventory.load(f)
+            except Exception as e:
+                print(f"{path.basename(filename):<24} skipped ({type(e).__name__})")
+                continue
+        content = getattr(eventory_obj.content, "compiled", None)
+        if content:
+            stories[path.basename(filename)] = content
+    return stories
+
+
+def main(iterations: int = 50):
+    eventory.load_ext("inktory")
+    for name, compiled in load_stories().items():
+        tokens = []
+        collect_tokens(json.loads(compiled)["root"], tokens)
+        chain_duration = timeit.timeit(lambda: [chain_token_to_runtime_object(token) for token in tokens], number=iterations) / iterations
+        table_duration = timeit.timeit(lambda: [Json.j_token_to_runtime_object(token) for token in tokens], number=iterations) / iterations
+        story_duration = timeit.timeit(lambda: Story(compiled), number=iterations) / iterations
+        lazy_duration = timeit.timeit(lambda: Story(compiled, lazy=True), number=iterations) / iterations
+        print(f"{name:<24} {len(tokens):>6} tokens: chain {1000 * chain_duration:>7.2f} ms, tables {1000 * table_duration:>7.2f} ms "
+              f"({chain_duration / table_duration:.2f}x), Story {1000 * story_duration:>7.2f} ms, lazy Story {1000 * lazy_duration:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
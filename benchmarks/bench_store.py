@@ -0,0 +1,53 @@
+"""Benchmark creating the store of a session.
+
+Compares deep copying the store of an Eventory (what Eventructors used to do) with wrapping it in a CopyOnWriteDict. Each session reads and
+changes a few values like a typical playthrough would.
+
+Usage::
+
+    python benchmarks/bench_store.py [iterations] [size]
+"""
+
+import sys
+import timeit
+from copy import deepcopy
+
+from eventory.store import CopyOnWriteDict
+
+
+def build_store(size: int) -> dict:
+    return {
+        "counter": 0,
+        "flags": {f"flag_{i}": False for i in range(size)},
+        "inventory": [f"item_{i}" for i in range(size)],
+        "characters": {f"character_{i}": {"name": f"Character {i}", "health": 100, "items": [i, i + 1]} for i in range(size)},
+    }
+
+
+def play(store):
+    store["counter"] += 1
+    store["flags"]["flag_1"] = True
+    store["characters"]["character_1"]["health"] -= 10
+
+
+def main(iterations: int = 1000, size: int = 1000):
+    store = build_store(size)
+    candidates = [
+        ("deepcopy", deepcopy),
+        ("CopyOnWriteDict", CopyOnWriteDict)
+    ]
+
+    print(f"creating {iterations} sessions with a store of {size} entries per section")
+    baseline = None
+    for name, create in candidates:
+        duration = timeit.timeit(lambda: create(store), number=iterations)
+        played = timeit.timeit(lambda: play(create(store)), number=iterations)
+        throughput = iterations / duration
+        baseline = baseline or throughput
+        print(f"{name:<16} {throughput:>12.0f} sessions/s ({throughput / baseline:.1f}x), {iterations / played:>12.0f} played sessions/s")
+
+    assert store == build_store(size), "the base store was modified"
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -6,8 +6,8 @@ from .eventorial import Eventorial, get_eventory
 from .eventory import Eventory, EventoryMeta
 from .exceptions import *
 from .instructor import Eventructor
-from .narrator import Eventarrator, StreamEventarrator
-from .parser import Eventoriment, EventoryParser, load, register_parser
+from .narrator import Eventarrator, StreamEventarrator, Turn, split_text
+from .parser import Eventoriment, EventoryParser, load, load_async, load_bundle, load_lazy, load_many, register_head_decoder, register_parser
 
 log = logging.getLogger(__name__)
 
@@ -0,0 +1,181 @@
+"""This module contains the binary bundle format for Eventories.
+
+A bundle stores the head of an Eventory and its content in separate sections so that the content doesn't have to be parsed again when loading
+the Eventory. The layout of a bundle is as follows:
+
+    ======== ============================================================================================
+    Bytes    Description
+    ======== ============================================================================================
+    8        Magic number (BUNDLE_MAGIC)
+    2        Format version (little endian)
+    4        Length of the header (little endian)
+    n        Header encoded as UTF-8 JSON. Contains the head of the Eventory and the location of all sections
+    ...      Sections
+    ======== ============================================================================================
+
+Each section is described in the header by its offset (from the start of the bundle), its length and its compression. Which sections a bundle
+contains depends on the Eventructor of the Eventory (see Eventructor.bundle_content). By default the serialised content is stored in a
+"content" section, the InkEventructor stores the compiled ink in a "compiled" section and the raw ink (if there is any) in a "raw" section.
+
+Attributes:
+    BUNDLE_MAGIC (bytes): Bytes every bundle starts with
+    BUNDLE_VERSION (int): Version of the bundle format
+"""
+
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import Any, BinaryIO, Dict, Mapping
+
+from .exceptions import MalformattedEventory
+
+BUNDLE_MAGIC = b"EVORYBDL"
+BUNDLE_VERSION = 1
+_PREAMBLE = struct.Struct("<8sHI")
+
+
+class Bundle:
+    """A readable bundle.
+
+    Sections are only decompressed when they're read. When the bundle is opened from a file it's memory-mapped so reading the header doesn't
+    require reading the entire file.
+
+    Args:
+        buffer: Buffer containing the bundle
+
+    Attributes:
+        head (dict): Head of the Eventory
+        sections (Dict[str, dict]): Description (offset, length and compression) of all sections
+
+    Raises:
+        MalformattedEventory: When the buffer doesn't contain a valid bundle
+    """
+
+    def __init__(self, buffer: Any):
+        self._buffer = buffer
+        with memoryview(buffer) as view:
+            if len(view) < _PREAMBLE.size:
+                raise MalformattedEventory("Bundle is too short!")
+            magic, version, header_length = _PREAMBLE.unpack_from(view)
+            if magic != BUNDLE_MAGIC:
+                raise MalformattedEventory("Not a bundle!")
+            if version != BUNDLE_VERSION:
+                raise MalformattedEventory(f"Unsupported bundle version {version}")
+            if len(view) < _PREAMBLE.size + header_length:
+                raise MalformattedEventory("Bundle is truncated!")
+            try:
+                header = json.loads(bytes(view[_PREAMBLE.size:_PREAMBLE.size + header_length]).decode("utf-8"))
+                head, sections = header["head"], header["sections"]
+                end = max((section["offset"] + section["length"] for section in sections.values()), default=0)
+            except (ValueError, TypeError, KeyError, AttributeError) as e:
+                raise MalformattedEventory(f"Bundle has an invalid header: {e!r}") from e
+            if len(view) < end:
+                raise MalformattedEventory("Bundle is truncated!")
+
+        self.head = head
+        self.sections = sections
+
+    def __enter__(self) -> "Bundle":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sections
+
+    @classmethod
+    def open(cls, location: str) -> "Bundle":
+        """Open a bundle file using mmap.
+
+        Args:
+            location: Path to the bundle
+
+        Returns:
+            Bundle
+
+        Raises:
+            MalformattedEventory: When the file doesn't contain a valid bundle
+        """
+        with open(location, "rb") as f:
+            # empty files can't be memory-mapped
+            if os.fstat(f.fileno()).st_size < _PREAMBLE.size:
+                raise MalformattedEventory("Bundle is too short!")
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer)
+        except Exception:
+            buffer.close()
+            raise
+
+    def close(self):
+        """Release the underlying buffer."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def read(self, name: str) -> bytes:
+        """Read a section.
+
+        Args:
+            name: Name of the section
+
+        Returns:
+            bytes: Decompressed data of the section
+
+        Raises:
+            KeyError: If there's no section with that name
+        """
+        section = self.sections[name]
+        start = section["offset"]
+        with memoryview(self._buffer)[start:start + section["length"]] as data:
+            if section.get("compression") == "zlib":
+                return zlib.decompress(data)
+            return bytes(data)
+
+    def read_all(self) -> Dict[str, bytes]:
+        """Read all sections.
+
+        Returns:
+            Dict[str, bytes]: Decompressed data of all sections by their name
+        """
+        return {name: self.read(name) for name in self.sections}
+
+
+def write_bundle(fp: BinaryIO, head: Mapping, sections: Mapping[str, bytes], *, compress: bool = True, level: int = 6):
+    """Write a bundle.
+
+    Args:
+        fp: Binary file to write to
+        head: Head of the Eventory
+        sections: Data of the sections by their name
+        compress: Whether to compress the sections using zlib
+        level: Compression level
+    """
+    blobs = {}
+    for name, data in sections.items():
+        if compress:
+            blobs[name] = (zlib.compress(data, level), "zlib")
+        else:
+            blobs[name] = (bytes(data), None)
+
+    def build_header(base: int) -> bytes:
+        described = {}
+        offset = base
+        for name, (blob, compression) in blobs.items():
+            described[name] = {"offset": offset, "length": len(blob), "compression": compression}
+            offset += len(blob)
+        return json.dumps({"head": head, "sections": described}).encode("utf-8")
+
+    # the offsets depend on the length of the header which in turn depends on the offsets
+    base = _PREAMBLE.size
+    header = build_header(base)
+    while _PREAMBLE.size + len(header) != base:
+        base = _PREAMBLE.size + len(header)
+        header = build_header(base)
+
+    fp.write(_PREAMBLE.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(header)))
+    fp.write(header)
+    for blob, _ in blobs.values():
+        fp.write(blob)
@@ -2,6 +2,12 @@
 
 Attributes:
     FILE_SUFFIX: File ending/suffix an Eventory file needs to have to be recognised as such
+    BUNDLE_SUFFIX: File ending/suffix of binary Eventory bundles
+    CATALOG_FILENAME: Name of the file an Eventorial uses to keep track of the Eventories in its directory
+    HTTP_CACHE_DIRECTORY: Name of the directory (inside its directory) an Eventorial stores downloaded Eventories in
 """
 
 FILE_SUFFIX = ".evory"
+BUNDLE_SUFFIX = ".evoryb"
+CATALOG_FILENAME = ".eventorial.json"
+HTTP_CACHE_DIRECTORY = ".http_cache"
@@ -3,24 +3,52 @@
 Attributes:
     URL_REGEX (Pattern): Regex used to check if a string is a url
     SANITISE_REGEX_STEPS (Tuple[Pattern]): Regex applied to a string in order to obtain a sanitised version of said string.
+    CATALOG_VERSION (int): Version of the catalog format. Catalogs with a different version are ignored.
+    DEFAULT_LOAD_CONCURRENCY (int): Default amount of sources Eventorial.load_many retrieves at the same time
+    DEFAULT_SEARCH_LIMIT (int): Default maximum amount of results of Eventorial.search
+    MAX_DOWNLOAD_SIZE (int): Default maximum size (in bytes) of a downloaded Eventory
+    DOWNLOAD_TIMEOUT (float): Default amount of seconds after which a download is aborted
+    DOWNLOAD_CHUNK_SIZE (int): Size of the chunks a download is read in
+    MAX_HEAD_SIZE (int): Amount of characters after which a download stops looking for the head of the Eventory
+    HASH_CHUNK_SIZE (int): Size of the chunks a file is read in to hash it
+    WATCH_INTERVAL (float): Default amount of seconds between two scans of the directory when watching it without inotify
+    WATCH_DELAY (float): Seconds to wait for further changes after inotify reported a change before reloading
 """
 
 import asyncio
+import codecs
+import functools
+import hashlib
+import importlib
+import itertools
+import json
 import logging
 import os
 import re
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from io import TextIOBase
 from os import path
 from tempfile import TemporaryDirectory
-from typing import Any, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, Union
 
-from aiohttp import ClientSession
+from aiohttp import ClientResponse, ClientSession
 from yarl import URL
 
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
 from . import constants
 from .eventory import Eventory
-from .exceptions import EventoryAlreadyLoaded
-from .parser import load
+from .exceptions import EventoryAlreadyLoaded, EventoryTooLarge
+from .executor import FairExecutor, get_shared_executor
+from .http_cache import HTTPCache
+from .index import EventoryIndex
+from .parser import EventoryParser, HEAD_DELIMITER, PARSER_MAP, find_parser, load, load_async, load_bundle, load_lazy, load_many, read_head
+from .storage import SQLiteStorage
+from .utils import atomic_open
 
 URL_REGEX = re.compile(r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+")
 SANITISE_REGEX_STEPS = (
@@ -28,7 +56,19 @@ SANITISE_REGEX_STEPS = (
     (re.compile(r"[ _]+"), " "),  # reduce space
     (re.compile(r"(^ +)|( +$)"), "")  # trim ends
 )
+CATALOG_VERSION = 1
+DEFAULT_LOAD_CONCURRENCY = 8
+DEFAULT_SEARCH_LIMIT = 5
+MAX_DOWNLOAD_SIZE = 32 * 1024 * 1024
+DOWNLOAD_TIMEOUT = 60
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MAX_HEAD_SIZE = 64 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+WATCH_INTERVAL = 2
+WATCH_DELAY = .1
 _DEFAULT = object()
+# decoded head, parser and index of the content in the text of an Eventory whose head was decoded while it was being downloaded
+_ReceivedHead = Tuple[Mapping, Type[EventoryParser], int]
 
 log = logging.getLogger(__name__)
 
@@ -38,7 +78,21 @@ class Eventorial:
 
     Args:
         directory: Directory path to store data in. If not provided the Eventorial uses a temporary directory which will be destroyed at the end.
-            When provided with a path, the Eventorial loads all files that already exist in the directory.
+            When provided with a path, the Eventorial loads all files (including bundles) that already exist in the directory.
+        lazy: When loading the files from the directory only parse their heads. The content of an Eventory is then loaded the first time it's
+            needed.
+        use_catalog: Keep a catalog of the files in the directory (see CATALOG_FILENAME in constants). When loading lazily, files which haven't
+            changed since the catalog was written aren't opened at all.
+        processes: Amount of processes used to parse the files in the directory in parallel. If not provided the files are parsed in this
+            process. Has no effect when loading lazily.
+        use_http_cache: Keep the Eventories downloaded from urls in a cache (see HTTP_CACHE_DIRECTORY in constants) so they're only
+            downloaded again if they changed.
+        max_download_size: Maximum size (in bytes) of a downloaded Eventory. None for no limit.
+        download_timeout: Seconds after which downloading an Eventory is aborted. None for no timeout.
+        storage: Store the Eventories in a SQLite database (either the storage itself or the path to the database) instead of the directory.
+            Multiple Eventorials (even in different processes) can share the same database, the Eventories they add and remove are picked up
+            by the others when they sync. The files in the directory aren't loaded when using a storage.
+        executor: Executor for the Eventructors of the Eventories. Uses the executor shared by the process if not specified.
         loop: Loop to use for various async operations. Uses asyncio.get_event_loop() if not specified.
 
     Attributes:
@@ -46,22 +100,58 @@ class Eventorial:
         loop (AbstractEventLoop): Loop being used
         aiosession (ClientSession): ClientSession used for internet access
         directory (str): Path to directory used to store data
+        lazy (bool): Whether the Eventories in the directory are loaded lazily
+        use_catalog (bool): Whether the catalog is used
+        processes (Optional[int]): Amount of processes used to parse the files in the directory
+        catalog (Dict[str, dict]): Catalog entries (sanitised title, filename, mtime, size, content hash, parser, meta, stores and options) by
+            filename
+        index (EventoryIndex): Index mapping the sanitised titles, filenames and aliases to the keys of eventories
+        http_cache (Optional[HTTPCache]): Cache for downloaded Eventories
+        max_download_size (Optional[int]): Maximum size (in bytes) of a downloaded Eventory
+        download_timeout (Optional[float]): Seconds after which downloading an Eventory is aborted
+        storage (Optional[SQLiteStorage]): Database the Eventories are stored in
+        executor (FairExecutor): Executor for the Eventructors of the Eventories
     """
 
-    def __init__(self, directory: str = None, *, loop=None):
+    def __init__(self, directory: str = None, *, lazy: bool = False, use_catalog: bool = True, processes: int = None, use_http_cache: bool = True,
+                 max_download_size: Optional[int] = MAX_DOWNLOAD_SIZE, download_timeout: Optional[float] = DOWNLOAD_TIMEOUT,
+                 storage: Union[str, SQLiteStorage] = None, executor: FairExecutor = None, loop=None):
         self.eventories = {}
+        self._filenames = {}
+        self.index = EventoryIndex()
+        self.storage = SQLiteStorage(storage) if isinstance(storage, str) else storage
+        self.executor = executor or get_shared_executor()
+        self.lazy = lazy
+        self.use_catalog = use_catalog and not self.storage
+        self.processes = processes
+        self.catalog = {}
+        self._hashes = {}
+        self._stats = {}
+        self._watcher = None
+        self._revision = 0
+        self._revisions = {}
+        # Eventories by the url they were downloaded from
+        self._downloaded = weakref.WeakValueDictionary()
+        self.max_download_size = max_download_size
+        self.download_timeout = download_timeout
 
         self.loop = loop or asyncio.get_event_loop()
         self.aiosession = ClientSession(loop=self.loop)
 
         if directory:
             self.directory = directory
-            self._load_directory()
+            if not self.storage:
+                self._load_directory()
         else:
             self._tempdir = TemporaryDirectory(prefix="Eventory_")
             self.directory = self._tempdir.name
             log.debug(f"{self} created temporary directory in {self.directory}")
 
+        self.http_cache = HTTPCache(path.join(self.directory, constants.HTTP_CACHE_DIRECTORY)) if use_http_cache else None
+
+        if self.storage:
+            self.sync()
+
     def __str__(self):
         return f"<Eventorial {len(self.eventories)} Eventory/ies loaded>"
 
@@ -72,7 +162,7 @@ class Eventorial:
         self.cleanup()
 
     def __contains__(self, item):
-        return (item in self.eventories.keys()) or bool(self.get(item))
+        return self.get(item, None) is not None
 
     def __delitem__(self, key):
         return self.remove(key)
@@ -84,20 +174,238 @@ class Eventorial:
         return iter(self.eventories)
 
     def _load_directory(self):
-        names = os.listdir(self.directory)
-        loaded_eventories = 0
-        for name in names:
-            if name.endswith(constants.FILE_SUFFIX):
-                with open(path.join(self.directory, name), "r") as f:
-                    self.add(load(f))
-                    loaded_eventories += 1
-        log.info(f"{self} loaded {loaded_eventories} Eventory/ies from directory")
+        catalog = self._read_catalog() if self.use_catalog else {}
+        changed = 0
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith((constants.FILE_SUFFIX, constants.BUNDLE_SUFFIX)):
+                continue
+            stat = os.stat(path.join(self.directory, name))
+            entry = catalog.get(name)
+            if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                if self.lazy:
+                    self._register(self._load_catalog_entry(entry), name)
+                    self.catalog[name] = entry
+                    self._hashes[name] = entry["hash"]
+                    self._stats[name] = (stat.st_mtime_ns, stat.st_size)
+                else:
+                    # the content still has to be parsed but there's no need to hash the file again
+                    files.append((name, stat, entry["hash"]))
+            else:
+                changed += 1
+                files.append((name, stat, None))
+        log.debug(f"{self} {changed} file(s) changed since the catalog was written")
+
+        results = self._load_files([(name, digest) for name, _, digest in files])
+        # the files are already on disk, they're only written again when the Eventory changes
+        for (name, stat, _), (eventory, digest) in zip(files, results):
+            self._register(eventory, name)
+            self._stored(name, eventory, stat, digest)
+
+        if self.use_catalog and (changed or len(catalog) != len(self.catalog)):
+            self.save_catalog()
+        log.info(f"{self} loaded {len(self.eventories)} Eventory/ies from directory")
+
+    def _hash(self, name: str) -> str:
+        digest = hashlib.sha256()
+        with open(path.join(self.directory, name), "rb") as f:
+            for chunk in iter(functools.partial(f.read, HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        stats = {}
+        for name in os.listdir(self.directory):
+            if not name.endswith((constants.FILE_SUFFIX, constants.BUNDLE_SUFFIX)):
+                continue
+            try:
+                stat = os.stat(path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            stats[name] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def _load_files(self, files: Sequence[Tuple[str, Optional[str]]], *,
+                    return_exceptions: bool = False) -> List[Tuple[Union[Eventory, Exception], Optional[str]]]:
+        # files are read one at a time, files whose digest isn't known yet are hashed while they're read
+        results = [None] * len(files)
+        digests = [digest for _, digest in files]
+        texts = []
+        for i, (name, digest) in enumerate(files):
+            location = path.join(self.directory, name)
+            try:
+                if name.endswith(constants.BUNDLE_SUFFIX):
+                    digests[i] = digest or self._hash(name)
+                    # bundles are only written by Eventorials, there's no need to store them again
+                    results[i] = load_bundle(location, lazy=self.lazy)
+                elif self.lazy:
+                    digests[i] = digest or self._hash(name)
+                    # only the head is read, the content is loaded from the file when it's needed
+                    with open(location, "r", encoding="utf-8") as f:
+                        head, _ = read_head(f)
+                    # the file is already on disk, saving it again would only load the content
+                    results[i] = load_lazy(location, head=EventoryParser.decode_head(head))
+                else:
+                    with open(location, "rb") as f:
+                        data = f.read()
+                    digests[i] = digest or hashlib.sha256(data).hexdigest()
+                    texts.append((i, data.decode("utf-8")))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[i] = e
+
+        if texts:
+            decoded = [text for _, text in texts]
+            if self.processes and self.processes > 1 and len(texts) > 1:
+                eventories = self._load_parallel(decoded, return_exceptions=return_exceptions)
+            else:
+                eventories = load_many(decoded, return_exceptions=return_exceptions)
+            for (i, _), eventory in zip(texts, eventories):
+                results[i] = eventory
+        return list(zip(results, digests))
+
+    def _load_parallel(self, texts: List[str], *, return_exceptions: bool = False) -> List[Union[Eventory, Exception]]:
+        workers = min(self.processes, len(texts))
+        chunk_size = -(-len(texts) // workers)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        # the workers need to import the parsers (and their extensions) in order to parse
+        modules = sorted({cls.__module__ for cls, _ in PARSER_MAP})
+        log.debug(f"{self} parsing {len(texts)} file(s) in {len(chunks)} process(es)")
+        with ProcessPoolExecutor(len(chunks)) as executor:
+            results = executor.map(_load_chunk, [modules] * len(chunks), chunks, [return_exceptions] * len(chunks))
+            return [eventory for chunk in results for eventory in chunk]
+
+    def _index_keys(self, sane_title: str, filename: str, eventory: Eventory) -> List[str]:
+        keys = [sane_title, sanitise_string(path.splitext(filename)[0])]
+        keys.extend(sanitise_string(alias) for alias in eventory.aliases)
+        return keys
+
+    def _register(self, eventory: Eventory, filename: str = None):
+        sane_title = sanitise_string(eventory.title)
+        if sane_title in self.eventories:
+            raise EventoryAlreadyLoaded(eventory.title)
+        self.eventories[sane_title] = eventory
+        self._filenames[sane_title] = filename or eventory.filename
+        self.index.add(sane_title, self._index_keys(sane_title, self._filenames[sane_title], eventory))
+
+    def _write(self, filename: str, data: bytes, digest: str) -> Optional[os.stat_result]:
+        location = path.join(self.directory, filename)
+        if self._hashes.get(filename) == digest and path.isfile(location):
+            log.debug(f"{self} {filename} didn't change, not writing it")
+            return None
+        with atomic_open(location, "wb") as f:
+            f.write(data)
+        return os.stat(location)
+
+    def _stored(self, name: str, eventory: Eventory, stat: os.stat_result, digest: str):
+        self._hashes[name] = digest
+        self._stats[name] = (stat.st_mtime_ns, stat.st_size)
+        self._update_catalog(name, eventory, stat, digest)
+
+    def _put(self, eventory: Eventory) -> bool:
+        title = sanitise_string(eventory.title)
+        revision = self.storage.put(title, eventory, self._filenames[title])
+        if revision is None:
+            return False
+        self._revisions[title] = revision
+        return True
+
+    def _store(self, eventory: Eventory) -> bool:
+        if self.storage:
+            return self._put(eventory)
+        filename = self._filenames[sanitise_string(eventory.title)]
+        data = eventory.serialise().encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        stat = self._write(filename, data, digest)
+        if stat is None:
+            return False
+        self._stored(filename, eventory, stat, digest)
+        return True
+
+    async def _store_async(self, eventory: Eventory) -> bool:
+        if self.storage:
+            return await self.loop.run_in_executor(None, self._put, eventory)
+        filename = self._filenames[sanitise_string(eventory.title)]
+        data = (await self.loop.run_in_executor(None, eventory.serialise)).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        stat = await self.loop.run_in_executor(None, self._write, filename, data, digest)
+        if stat is None:
+            return False
+        self._stored(filename, eventory, stat, digest)
+        return True
+
+    def _read_catalog(self) -> Dict[str, dict]:
+        location = path.join(self.directory, constants.CATALOG_FILENAME)
+        try:
+            with open(location, "r", encoding="utf-8") as f:
+                catalog = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            log.warning(f"{self} couldn't read catalog {location}, ignoring it")
+            return {}
+        if catalog.get("version") != CATALOG_VERSION:
+            log.info(f"{self} catalog {location} has a different version, ignoring it")
+            return {}
+        return catalog["files"]
+
+    def _update_catalog(self, name: str, eventory: Eventory, stat: os.stat_result, digest: str):
+        if not self.use_catalog:
+            return
+        entry = {
+            "title": sanitise_string(eventory.title),
+            "filename": name,
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": digest,
+            "parser": eventory.parser,
+            "meta": eventory.meta.to_dict(),
+            "store": eventory.store,
+            "global_store": eventory.global_store,
+            "options": eventory.options
+        }
+        try:
+            json.dumps(entry)
+        except (TypeError, ValueError):
+            log.debug(f"{self} can't add {name} to the catalog (head isn't JSON serialisable)")
+            self.catalog.pop(name, None)
+        else:
+            self.catalog[name] = entry
+
+    def _load_catalog_entry(self, entry: dict) -> Eventory:
+        head = {key: entry.get(key) for key in ("parser", "meta", "store", "global_store", "options")}
+        location = path.join(self.directory, entry["filename"])
+        if location.endswith(constants.BUNDLE_SUFFIX):
+            return load_bundle(location, lazy=True, head=head)
+        return load_lazy(location, head=head)
+
+    def _write_catalog(self, data: str):
+        with atomic_open(path.join(self.directory, constants.CATALOG_FILENAME), "w", encoding="utf-8") as f:
+            f.write(data)
+        log.debug(f"{self} saved catalog")
+
+    def save_catalog(self):
+        """Write the catalog to the directory.
+
+        The catalog is written to a temporary file first which then replaces the old catalog.
+        """
+        self._write_catalog(json.dumps({"version": CATALOG_VERSION, "files": self.catalog}))
+
+    async def save_catalog_async(self):
+        """Write the catalog to the directory without blocking the loop.
+
+        The catalog is serialised in the loop (so it can't change while it's being serialised) but written in an executor.
+        """
+        data = json.dumps({"version": CATALOG_VERSION, "files": self.catalog})
+        await self.loop.run_in_executor(None, self._write_catalog, data)
 
     def cleanup(self):
         """Clean the Eventorial.
 
         Closes the ClientSession and removes the temporary directory if one has been created.
         """
+        self.stop_watching()
         if hasattr(self, "_tempdir"):
             self._tempdir.cleanup()
             log.debug(f"{self} removed temporary directory")
@@ -106,9 +414,210 @@ class Eventorial:
         ))
         log.debug("{self} cleaned up")
 
+    def sync(self) -> List[str]:
+        """Apply the changes other Eventorials made to the storage.
+
+        Only the changes since the last sync are read from the database. Like reload, the changes are swapped into eventories all at once and
+        Eventories which are being played keep using their version. The content of the new Eventories is only read when it's needed.
+
+        Returns:
+            List[str]: Sanitised titles of the Eventories which were added, changed or removed
+        """
+        rows = self.storage.changes(self._revision)
+        if rows:
+            self._revision = rows[-1]["revision"]
+        rows = [row for row in rows if self._revisions.get(row["title"]) != row["revision"]]
+        if not rows:
+            return []
+
+        eventories = dict(self.eventories)
+        filenames = dict(self._filenames)
+        index = self.index.copy()
+        synced = []
+        for row in rows:
+            title = row["title"]
+            self._revisions[title] = row["revision"]
+            if title in eventories:
+                del eventories[title]
+                del filenames[title]
+                index.remove(title)
+            if row["deleted"]:
+                synced.append(title)
+                continue
+            try:
+                eventory = self.storage.load(row)
+            except Exception as e:
+                log.warning(f"{self} couldn't load {title} from {self.storage}: {e!r}")
+                continue
+            eventories[title] = eventory
+            filenames[title] = row["filename"]
+            index.add(title, self._index_keys(title, row["filename"], eventory))
+            synced.append(title)
+        self.eventories, self._filenames, self.index = eventories, filenames, index
+        log.info(f"{self} synced {len(synced)} Eventory/ies with {self.storage}")
+        return synced
+
+    async def reload(self, names: Iterable[str] = None) -> List[str]:
+        """Reload the files in the directory which changed.
+
+        Only files which were added, modified (their mtime, size and content hash changed) or removed since they were loaded are considered.
+        The new Eventories are loaded in an executor and then swapped into eventories all at once. Eventories which are being played aren't
+        affected, they keep using the version they were started with.
+
+        If a modified file can't be loaded or its new title is already taken by another Eventory the old version is kept.
+
+        When using a storage this syncs with the storage instead (see sync).
+
+        Args:
+            names: Filenames to check. If not provided the entire directory is scanned.
+
+        Returns:
+            List[str]: Filenames which were (re)loaded or removed
+        """
+        if self.storage:
+            return self.sync()
+        stats = await self.loop.run_in_executor(None, self._scan)
+        candidates = set(stats).union(self._stats) if names is None else set(names)
+        changed = sorted(name for name in candidates if name in stats and stats[name] != self._stats.get(name))
+        removed = sorted(name for name in candidates if name not in stats and name in self._stats)
+        if not (changed or removed):
+            return []
+
+        files = []
+        for name in changed:
+            try:
+                stat = await self.loop.run_in_executor(None, os.stat, path.join(self.directory, name))
+                digest = await self.loop.run_in_executor(None, self._hash, name)
+            except FileNotFoundError:
+                continue
+            if self._hashes.get(name) == digest:
+                self._stats[name] = (stat.st_mtime_ns, stat.st_size)
+                continue
+            files.append((name, stat, digest))
+        load = functools.partial(self._load_files, [(name, digest) for name, _, digest in files], return_exceptions=True)
+        results = await self.loop.run_in_executor(None, load) if files else []
+
+        loaded = []
+        for (name, stat, _), (eventory, digest) in zip(files, results):
+            if isinstance(eventory, Exception):
+                log.warning(f"{self} couldn't reload {name}, keeping the old version: {eventory!r}")
+                self._stats[name] = (stat.st_mtime_ns, stat.st_size)
+            else:
+                loaded.append((name, stat, digest, eventory))
+
+        owners = {filename: title for title, filename in self._filenames.items()}
+        loaded = self._without_collisions(loaded, removed, owners)
+
+        # the new versions are built on copies which are swapped in at once so nobody sees a partially reloaded Eventorial
+        eventories = dict(self.eventories)
+        filenames = dict(self._filenames)
+        index = self.index.copy()
+        for name in removed + [name for name, *_ in loaded]:
+            title = owners.get(name)
+            if title is not None:
+                del eventories[title]
+                del filenames[title]
+                index.remove(title)
+        for name, _, _, eventory in loaded:
+            title = sanitise_string(eventory.title)
+            eventories[title] = eventory
+            filenames[title] = name
+            index.add(title, self._index_keys(title, name, eventory))
+        self.eventories, self._filenames, self.index = eventories, filenames, index
+
+        for name in removed:
+            self._stats.pop(name, None)
+            self._hashes.pop(name, None)
+            self.catalog.pop(name, None)
+        for name, stat, digest, eventory in loaded:
+            self._stored(name, eventory, stat, digest)
+        reloaded = removed + [name for name, *_ in loaded]
+
+        log.info(f"{self} reloaded {len(reloaded)} file(s)")
+        if self.use_catalog and reloaded:
+            await self.save_catalog_async()
+        return reloaded
+
+    def _without_collisions(self, loaded: List[tuple], removed: List[str], owners: Dict[str, str]) -> List[tuple]:
+        # files which keep their title come first so a file can't lose its title to another one which was renamed
+        loaded = sorted(loaded, key=lambda entry: sanitise_string(entry[3].title) != owners.get(entry[0]))
+        while True:
+            # a file whose new version can't be used keeps its old one (and its title) which might in turn collide with another file
+            vacated = {owners[name] for name in removed + [name for name, *_ in loaded] if name in owners}
+            taken = set(self.eventories) - vacated
+            for entry in loaded:
+                name, stat, _, eventory = entry
+                title = sanitise_string(eventory.title)
+                if title in taken:
+                    log.warning(f"{self} couldn't reload {name}, keeping the old version: {EventoryAlreadyLoaded(eventory.title)}")
+                    self._stats[name] = (stat.st_mtime_ns, stat.st_size)
+                    loaded.remove(entry)
+                    break
+                taken.add(title)
+            else:
+                return sorted(loaded, key=lambda entry: entry[0])
+
+    def watch(self, interval: float = WATCH_INTERVAL):
+        """Watch the directory and reload the files which change.
+
+        If inotify_simple is installed inotify is used to get notified about changes, otherwise the directory is scanned every interval seconds.
+        When using a storage it's synced every interval seconds instead.
+
+        Args:
+            interval: Seconds between two scans of the directory (only used if inotify isn't available)
+        """
+        if self._watcher and not self._watcher.done():
+            return
+        if inotify_simple and not self.storage:
+            self._watcher = self.loop.create_task(self._watch_inotify())
+        else:
+            self._watcher = self.loop.create_task(self._watch_poll(interval))
+        log.debug(f"{self} watching {self.directory}")
+
+    def stop_watching(self):
+        """Stop watching the directory."""
+        if self._watcher:
+            self._watcher.cancel()
+            self._watcher = None
+            log.debug(f"{self} stopped watching {self.directory}")
+
+    async def _watch_poll(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reload()
+            except Exception:
+                log.exception(f"{self} couldn't reload directory")
+
+    async def _watch_inotify(self):
+        flags = inotify_simple.flags
+        inotify = inotify_simple.INotify()
+        inotify.add_watch(self.directory, flags.CLOSE_WRITE | flags.MOVED_TO | flags.MOVED_FROM | flags.DELETE)
+        changes = asyncio.Event()
+        self.loop.add_reader(inotify.fd, changes.set)
+        try:
+            while True:
+                await changes.wait()
+                # wait a bit so that a burst of changes is handled at once
+                await asyncio.sleep(WATCH_DELAY)
+                changes.clear()
+                names = {event.name for event in inotify.read(timeout=0)}
+                names = [name for name in names if name.endswith((constants.FILE_SUFFIX, constants.BUNDLE_SUFFIX))]
+                if not names:
+                    continue
+                try:
+                    await self.reload(names)
+                except Exception:
+                    log.exception(f"{self} couldn't reload {names}")
+        finally:
+            self.loop.remove_reader(inotify.fd)
+            inotify.close()
+
     def add(self, source: Union[Eventory, str, TextIOBase]):
         """Add an Eventory to this Eventorial.
 
+        The Eventory is saved to the directory unless the file already contains exactly the same Eventory.
+
         Args:
             source: Can be an Eventory to add, a string containing a serialised Eventory or an open file to load the Eventory from
 
@@ -119,11 +628,9 @@ class Eventorial:
             eventory = source
         else:
             eventory = load(source)
-        sane_title = sanitise_string(eventory.title)
-        if sane_title in self.eventories:
-            raise EventoryAlreadyLoaded(eventory.title)
-        self.eventories[sane_title] = eventory
-        eventory.save(path.join(self.directory, "{filename}"))
+        self._register(eventory)
+        if self._store(eventory) and self.use_catalog:
+            self.save_catalog()
 
     def remove(self, item: Eventory):
         """Remove an Eventory from the Eventorial.
@@ -136,11 +643,24 @@ class Eventorial:
         """
         title = sanitise_string(item.title)
         self.eventories.pop(title)
-        os.remove(path.join(self.directory, item.filename))
+        self.index.remove(title)
+        filename = self._filenames.pop(title, item.filename)
+        if self.storage:
+            revision = self.storage.remove(title)
+            if revision is not None:
+                self._revisions[title] = revision
+            return
+        self._hashes.pop(filename, None)
+        self._stats.pop(filename, None)
+        os.remove(path.join(self.directory, filename))
+        if self.catalog.pop(filename, None):
+            self.save_catalog()
 
     def get(self, title: str, default: Any = _DEFAULT) -> Eventory:
         """Get an Eventory from this Eventorial.
 
+        Apart from its title an Eventory can also be retrieved by its filename or one of its aliases.
+
         Args:
             title: Name of the Eventory to retrieve
             default: Default value to return if no Eventory found
@@ -151,8 +671,13 @@ class Eventorial:
         Raises:
             KeyError: If no Eventory with that title was found and default wasn't specified.
         """
-        sane_title = sanitise_string(title)
-        story = self.eventories.get(sane_title)
+        story = self.eventories.get(title)
+        if story is None:
+            name = self.index.get(sanitise_string(title))
+            if name is None and self.storage and self.sync():
+                # another Eventorial might have added it
+                name = self.index.get(sanitise_string(title))
+            story = self.eventories.get(name) if name else None
         if story is None:
             if default is _DEFAULT:
                 raise KeyError(f"No Eventory with title \"{title}\"")
@@ -161,6 +686,21 @@ class Eventorial:
         else:
             return story
 
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Eventory]:
+        """Search for Eventories.
+
+        Exact matches (see get) come first, followed by Eventories whose title, filename or alias starts with the query and finally Eventories
+        with a similar title, filename or alias (to account for typos).
+
+        Args:
+            query: Query to search for
+            limit: Maximum amount of Eventories to return
+
+        Returns:
+            List[Eventory]: Eventories matching the query
+        """
+        return [self.eventories[name] for name in self.index.search(sanitise_string(query), limit)]
+
     async def load_data(self, source: Union[str, URL, TextIOBase], **kwargs) -> str:
         """Retrieve text from a source.
 
@@ -180,13 +720,18 @@ class Eventorial:
             if not URL_REGEX.match(source):
                 with open(path.join(self.directory, source), "r", encoding="utf-8") as f:
                     return await self.load_data(f, **kwargs)
-        return await get_data(source, session=self.aiosession, **kwargs)
+        return await get_data(source, session=self.aiosession, cache=self.http_cache, max_size=self.max_download_size,
+                              timeout=self.download_timeout, **kwargs)
 
     async def load(self, source: Union[str, URL, TextIOBase], **kwargs) -> Eventory:
         """Load an Eventory from a source into this Eventorial.
 
         Contrary to the get_eventory function this method doesn't assume that all strings are urls. It checks whether the string is a url using the
         URL_REGEX and if it isn't a url it treats it as the name of a file relative to the directory of the Eventorial.
+        Saving the Eventory to the directory happens in an executor so the loop isn't blocked.
+
+        Urls are requested conditionally if the http_cache has a response for them. If the server reports that the Eventory hasn't changed and
+        the Eventory previously loaded from the url is still part of the Eventorial, it's returned without parsing anything.
 
         Args:
             source: Source to load Eventory from
@@ -197,16 +742,104 @@ class Eventorial:
         Raises:
             TODO
         """
-        data = await self.load_data(source, **kwargs)
-        eventory = load(data, **kwargs)
-        self.add(eventory)
+        data, eventory, received = await self._fetch(source, **kwargs)
+        if eventory:
+            return eventory
+        if received:
+            # the head has already been decoded while downloading
+            head, kwargs["parser"], content_start = received
+            eventory = await load_async(data[content_start:], loop=self.loop, head=head, **kwargs)
+        else:
+            eventory = await load_async(data, loop=self.loop, **kwargs)
+        self._register(eventory)
+        if _is_url(source):
+            self._downloaded[str(source)] = eventory
+        if await self._store_async(eventory) and self.use_catalog:
+            await self.save_catalog_async()
         return eventory
 
+    async def load_many(self, sources: Sequence[Union[str, URL, TextIOBase]], *, concurrency: int = DEFAULT_LOAD_CONCURRENCY,
+                        **kwargs) -> List[Union[Eventory, Exception]]:
+        """Load multiple Eventories into this Eventorial.
+
+        Up to concurrency sources are retrieved at the same time. The Eventories are then parsed together (see the load_many function of the
+        parser module) in an executor and saved to the directory. A source which fails doesn't affect the others, its exception is returned
+        instead.
+
+        Args:
+            sources: Sources to load Eventories from. They're interpreted in the same way as in load.
+            concurrency: Amount of sources which are retrieved at the same time
+
+        Returns:
+            List[Union[Eventory, Exception]]: The Eventory added to the Eventorial or the exception raised while loading it for every source
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(source):
+            async with semaphore:
+                return await self._fetch(source, **kwargs)
+
+        results = await asyncio.gather(*(fetch(source) for source in sources), return_exceptions=True)
+        pending = [i for i, result in enumerate(results) if not isinstance(result, Exception) and result[1] is None]
+        log.debug(f"{self} retrieved {len(sources)} source(s), parsing {len(pending)}")
+        if pending:
+            parse = functools.partial(load_many, [results[i][0] for i in pending], return_exceptions=True, **kwargs)
+            eventories = await self.loop.run_in_executor(None, parse)
+        else:
+            eventories = []
+        for i, eventory in zip(pending, eventories):
+            if not isinstance(eventory, Exception):
+                try:
+                    self._register(eventory)
+                except EventoryAlreadyLoaded as e:
+                    eventory = e
+            results[i] = eventory
+
+        added = [i for i in pending if isinstance(results[i], Eventory)]
+        for i in added:
+            if _is_url(sources[i]):
+                self._downloaded[str(sources[i])] = results[i]
+        stored = await asyncio.gather(*(self._store_async(results[i]) for i in added), return_exceptions=True)
+        for i, result in zip(added, stored):
+            if isinstance(result, Exception):
+                results[i] = result
+        if self.use_catalog and any(result is True for result in stored):
+            await self.save_catalog_async()
+
+        results = [result[1] if isinstance(result, tuple) else result for result in results]
+        log.info(f"{self} loaded {sum(isinstance(result, Eventory) for result in results)}/{len(results)} Eventory/ies")
+        return results
+
+    async def _fetch(self, source: Union[str, URL, TextIOBase], **kwargs) -> Tuple[str, Optional[Eventory], Optional[_ReceivedHead]]:
+        if _is_url(source):
+            data, modified, received = await _fetch_data(source, self.aiosession, cache=self.http_cache, max_size=self.max_download_size,
+                                                         timeout=self.download_timeout, parser=kwargs.get("parser"))
+            eventory = self._downloaded.get(str(source))
+            # the Eventory with the same title might come from somewhere else, only the one loaded from this url is still up to date
+            if not modified and eventory is not None and self.eventories.get(sanitise_string(eventory.title)) is eventory:
+                log.debug(f"{self} {source} wasn't modified, using loaded {eventory}")
+                return data, eventory, None
+            return data, None, received
+        data = await self.load_data(source, **kwargs)
+        return data, None, None
+
 
+def _is_url(source: Any) -> bool:
+    return isinstance(source, URL) or (isinstance(source, str) and bool(URL_REGEX.match(source)))
+
+
+def _load_chunk(modules: Sequence[str], texts: Sequence[str], return_exceptions: bool = False) -> List[Union[Eventory, Exception]]:
+    for module in modules:
+        importlib.import_module(module)
+    return load_many(texts, return_exceptions=return_exceptions)
+
+
+@functools.lru_cache(maxsize=1024)
 def sanitise_string(title: str) -> str:
     """Sanitise a string.
 
     Removes all non-alphanumeric characters, trims both ends of redundant spacing and replaces multiple spaces with a single one.
+    The results are cached because the same strings (i.e. titles of Eventories) are sanitised over and over again.
 
     Args:
         title: String to sanitise
@@ -220,12 +853,111 @@ def sanitise_string(title: str) -> str:
     return title
 
 
-async def get_data(source: Union[str, URL, TextIOBase], session: ClientSession = None, **kwargs) -> str:
+def _check_head(text: str, parser: Type[EventoryParser] = None) -> Tuple[bool, Optional[_ReceivedHead]]:
+    # only complete lines are considered, the delimiter might not have been received entirely
+    complete = text[:text.rfind("\n") + 1]
+    delimiters = list(itertools.islice(HEAD_DELIMITER.finditer(complete), 2))
+    if len(delimiters) == 2:
+        head = complete[delimiters[0].end():delimiters[1].start()]
+    elif len(delimiters) == 1 and complete[:delimiters[0].start()].strip():
+        head = complete[:delimiters[0].start()]
+    else:
+        # give up if there's no head in sight, the parser will complain later
+        return len(text) > MAX_HEAD_SIZE, None
+    head = EventoryParser.decode_head(head)
+    parser = parser or find_parser(head.get("parser"))
+    log.debug(f"received head, {parser} will parse the Eventory")
+    # with a single delimiter a later one could still change where the head ends (see EventoryParser.split)
+    return True, (head, parser, delimiters[1].end()) if len(delimiters) == 2 else None
+
+
+async def _read_response(resp: ClientResponse, *, max_size: Optional[int],
+                         parser: Type[EventoryParser] = None) -> Tuple[str, Optional[_ReceivedHead]]:
+    if max_size is not None and resp.content_length is not None and resp.content_length > max_size:
+        raise EventoryTooLarge(f"{resp.url} is {resp.content_length} bytes long, the limit is {max_size}")
+    try:
+        decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")()
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+    parts = []
+    size = 0
+    head = ""
+    head_checked = False
+    received = None
+    async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if max_size is not None and size > max_size:
+            raise EventoryTooLarge(f"{resp.url} is more than {max_size} bytes long")
+        text = decoder.decode(chunk)
+        parts.append(text)
+        if not head_checked:
+            head += text
+            head_checked, received = _check_head(head, parser)
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts), received
+
+
+async def _fetch_data(url: Union[str, URL], session: ClientSession, *, cache: Optional[HTTPCache], max_size: Optional[int],
+                      timeout: Optional[float], parser: Optional[Type[EventoryParser]]) -> Tuple[str, bool, Optional[_ReceivedHead]]:
+    loop = asyncio.get_event_loop()
+
+    async def fetch() -> Tuple[str, bool, Optional[_ReceivedHead]]:
+        entry = await loop.run_in_executor(None, cache.get, url) if cache else None
+        async with session.get(url, headers=HTTPCache.conditional_headers(entry)) as resp:
+            if resp.status == 304 and entry:
+                log.debug(f"{url} wasn't modified, using cached response")
+                return entry["data"], False, None
+            data, received = await _read_response(resp, max_size=max_size, parser=parser)
+            if cache and resp.status == 200:
+                await loop.run_in_executor(None, functools.partial(cache.set, url, data, etag=resp.headers.get("ETag"),
+                                                                   last_modified=resp.headers.get("Last-Modified")))
+        return data, True, received
+
+    return await asyncio.wait_for(fetch(), timeout)
+
+
+async def fetch_data(url: Union[str, URL], session: ClientSession, *, cache: HTTPCache = None, max_size: Optional[int] = MAX_DOWNLOAD_SIZE,
+                     timeout: Optional[float] = DOWNLOAD_TIMEOUT, parser: Type[EventoryParser] = None) -> Tuple[str, bool]:
+    """Download text from a url.
+
+    If the cache has a response for the url the request is made conditional. When the server responds with "304 Not Modified" the cached
+    text is returned.
+
+    The response is read in chunks and decoded while it's being downloaded. As soon as the head of the Eventory has been received it's decoded
+    and the parser is determined so the download is aborted early if the Eventory can't be loaded anyway.
+
+    Args:
+        url: Url to download
+        session: Session used to make the request
+        cache: Cache to revalidate and store the response in
+        max_size: Maximum size of the response in bytes. None for no limit.
+        timeout: Seconds after which the download is aborted. None for no timeout.
+        parser: Parser which will be used for the Eventory. If not provided it's determined from the head.
+
+    Returns:
+        Tuple[str, bool]: The text and whether it was downloaded (False if the cached text was used)
+
+    Raises:
+        EventoryTooLarge: When the response is larger than max_size
+        asyncio.TimeoutError: When the download took longer than timeout
+        EventoryParserHeadError: When the head can't be decoded
+        EventoryNoParserFound: When there's no parser for the Eventory
+    """
+    data, modified, _ = await _fetch_data(url, session, cache=cache, max_size=max_size, timeout=timeout, parser=parser)
+    return data, modified
+
+
+async def get_data(source: Union[str, URL, TextIOBase], session: ClientSession = None, *, cache: HTTPCache = None,
+                   max_size: Optional[int] = MAX_DOWNLOAD_SIZE, timeout: Optional[float] = DOWNLOAD_TIMEOUT, **kwargs) -> str:
     """Retrieve text from a source.
 
     Args:
         source: Source to get the text from
         session: Used to fetch online resources
+        cache: Cache used for online resources (see fetch_data)
+        max_size: Maximum size of online resources in bytes (see fetch_data)
+        timeout: Seconds after which downloading an online resource is aborted (see fetch_data)
 
     Returns:
         str: Retrieved text
@@ -237,8 +969,7 @@ async def get_data(source: Union[str, URL, TextIOBase], session: ClientSession =
     if isinstance(source, (str, URL)):
         if session is None or not isinstance(session, ClientSession):
             raise ValueError(f"You need to pass a {ClientSession} in order to download Eventories")
-        async with session.get(source) as resp:
-            data = await resp.text()
+        data, _ = await fetch_data(source, session, cache=cache, max_size=max_size, timeout=timeout, parser=kwargs.get("parser"))
     elif isinstance(source, TextIOBase):
         data = source.read()
     else:
@@ -246,12 +977,13 @@ async def get_data(source: Union[str, URL, TextIOBase], session: ClientSession =
     return data
 
 
-async def get_eventory(source: Union[str, URL, TextIOBase], session: ClientSession = None, **kwargs) -> Eventory:
+async def get_eventory(source: Union[str, URL, TextIOBase], session: ClientSession = None, *, cache: HTTPCache = None, **kwargs) -> Eventory:
     """Get an Eventory from a source.
 
     Args:
         source: Source to fetch Eventory from (open file, url)
         session: Used to fetch online resources
+        cache: Cache used for online resources (see fetch_data)
 
     Returns:
         Eventory: Eventory that was loaded from source
@@ -260,5 +992,5 @@ async def get_eventory(source: Union[str, URL, TextIOBase], session: ClientSessi
         ValueError: When no session was provided but source was a url
         TypeError: When source isn't of the correct type
     """
-    data = await get_data(source, session)
-    return load(data, **kwargs)
+    data = await get_data(source, session, cache=cache)
+    return await load_async(data, **kwargs)
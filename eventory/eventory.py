@@ -4,13 +4,17 @@ Attributes:
     FILENAME_REGEX (Pattern): Regex to match everything that's not suited for filenames in order to replace it.
 """
 
+import json
 import re
-from io import TextIOBase
-from typing import Any, Dict, Sequence, TYPE_CHECKING, Type, Union
+from io import BufferedIOBase, TextIOBase
+from types import ModuleType
+from typing import Any, Callable, Dict, Sequence, TYPE_CHECKING, Type, Union
 
 import yaml
 
 from . import constants
+from .bundle import write_bundle
+from .utils import atomic_open
 
 if TYPE_CHECKING:
     from .parser import Eventoriment
@@ -29,6 +33,7 @@ class EventoryMeta:
         version: Version of the Eventory
         author: Name of the author of the Eventory
         requirements: List of requirements needed to run the Eventory
+        aliases: Alternative names the Eventory can be found by
 
     Attributes:
         title
@@ -36,15 +41,18 @@ class EventoryMeta:
         version
         author
         requirements
+        aliases
     """
 
-    def __init__(self, title: str, description: str, version: int, author: str, requirements: Sequence["Eventoriment"]):
+    def __init__(self, title: str, description: str, version: int, author: str, requirements: Sequence["Eventoriment"],
+                 aliases: Sequence[str] = ()):
         self.title = title
         self.description = description
         self.version = version
         self.author = author
 
         self.requirements = requirements
+        self.aliases = list(aliases)
 
     def __repr__(self) -> str:
         return f"\"{self.title}\" - {self.author} ({self.version})"
@@ -55,7 +63,7 @@ class EventoryMeta:
         Returns:
             dict: Dictionary representing the instance
         """
-        data = vars(self)
+        data = dict(vars(self))
         data["requirements"] = [req.to_dict() for req in data["requirements"]]
         return data
 
@@ -76,42 +84,83 @@ class Eventory:
 
     Instead of calling "eventory.meta.title" you can also use "eventory.title". All attributes of EventoryMeta are available from the Eventory.
 
+    An Eventory can be lazy, in which case its content is only loaded (using content_loader) the first time it's accessed.
+
     Args:
         meta: Meta object for the Eventory
         content: Actual content that will be used by the Eventructor
         eventructor_cls: Eventructor type that should be used to instruct this Eventory
+        parser: Name of the parser the Eventory was parsed with
         store: Default store that will be passed to the Eventructor
         global_store: Global store of the Eventory
+        options: Keyword arguments the parser was created with (i.e. the backend of ink Eventories)
+        content_loader: Function returning the content. If provided the content is loaded the first time it's needed.
 
     Attributes:
         meta (EventoryMeta): Meta object for the Eventory
         content (Any): Actual content that will be used by the Eventructor
         eventructor_cls (Type[Eventructor]): Eventructor type that should be used to instruct this Eventory
+        parser (Optional[str]): Name of the parser the Eventory was parsed with
         store (dict): Default store that will be passed to the Eventructor
         global_store (dict): Global store of the Eventory
+        options (dict): Keyword arguments the parser was created with. They're stored in the head so the Eventory is parsed the same way
+            when it's loaded again.
 
     """
 
-    def __init__(self, meta: EventoryMeta, content: Any, eventructor_cls: Type["Eventructor"], *, store: dict = None, global_store: dict = None):
+    def __init__(self, meta: EventoryMeta, content: Any, eventructor_cls: Type["Eventructor"], *, parser: str = None, store: dict = None,
+                 global_store: dict = None, options: dict = None, content_loader: Callable[[], Any] = None):
         self.meta = meta
-        self.content = content
+        self._content = content
+        self._content_loader = content_loader
         self.eventructor_cls = eventructor_cls
+        self.parser = parser
 
         self.store = store or {}
         self.global_store = global_store or {}
+        self.options = options or {}
 
     def __repr__(self) -> str:
         return f"{self.meta}: {self.eventructor_cls}"
 
     def __getattr__(self, item) -> Any:
+        if item.startswith("_"):
+            raise AttributeError(item)
         return getattr(self.meta, item)
 
+    @property
+    def content(self) -> Any:
+        """Actual content that will be used by the Eventructor.
+
+        If the Eventory is lazy the content is loaded when accessing it for the first time.
+        """
+        if self._content_loader is not None:
+            self._content = self._content_loader()
+            self._content_loader = None
+        return self._content
+
+    @content.setter
+    def content(self, value: Any):
+        self._content = value
+        self._content_loader = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the content of the Eventory has been loaded."""
+        return self._content_loader is None
+
     @property
     def filename(self) -> str:
         """A filename made from the title of the Eventory."""
         title = FILENAME_REGEX.sub("_", self.title.lower())
         return f"{title}{constants.FILE_SUFFIX}"
 
+    @property
+    def bundle_filename(self) -> str:
+        """A filename for the bundle of this Eventory made from the title of the Eventory."""
+        title = FILENAME_REGEX.sub("_", self.title.lower())
+        return f"{title}{constants.BUNDLE_SUFFIX}"
+
     def narrate(self, eventarrator: "Eventarrator", **kwargs) -> "Eventructor":
         """Get an Eventructor to instruct this Eventory.
 
@@ -127,16 +176,54 @@ class Eventory:
         """
         return self.eventructor_cls(self, eventarrator, **kwargs)
 
-    def serialise(self) -> str:
+    def get_head(self) -> Dict[str, Any]:
+        """Get the head (parser, meta, stores and options) of this Eventory.
+
+        Returns:
+            Dict[str, Any]: Dictionary which can be parsed as the head of an Eventory
+        """
+        head = {}
+        if self.parser:
+            head["parser"] = self.parser
+        head["meta"] = self.meta.to_dict()
+        if self.store:
+            head["store"] = self.store
+        # the Eventructor stores loaded requirements and internal flags in the global store, those can't be serialised
+        global_store = {key: value for key, value in self.global_store.items() if not (key.startswith("_") or isinstance(value, ModuleType))}
+        if global_store:
+            head["global_store"] = global_store
+        if self.options:
+            head["options"] = self.options
+        return head
+
+    def serialise_head(self, json_head: bool = False) -> str:
+        """Serialise the head (parser, meta, stores and options) of this Eventory into YAML.
+
+        Args:
+            json_head: Serialise the head as JSON instead. JSON is valid YAML but it can be decoded a lot faster.
+
+        Returns:
+            str: YAML (or JSON) data representing the head
+        """
+        head = self.get_head()
+        if json_head:
+            return json.dumps(head, indent=2)
+        return yaml.dump(head, default_flow_style=False)
+
+    def serialise(self, json_head: bool = False) -> str:
         """Serialise this Eventory into a string.
 
-        The resulting string can be used to reconstruct the same Eventory.
+        The resulting string can be used to reconstruct the same Eventory. Serialising a reconstructed Eventory again yields the same string
+        (leading blank lines of the content aren't preserved).
+
+        Args:
+            json_head: Serialise the head as JSON instead of YAML
 
         Returns:
             str: Serialised Eventory
         """
-        head = self.meta.serialise()
-        content = self.eventructor_cls.serialise_content(self.content)
+        head = self.serialise_head(json_head)
+        content = self.eventructor_cls.serialise_content(self.content).lstrip("\n")
         return f"---\n{head}\n---\n\n{content}"
 
     def save(self, fp: Union[str, TextIOBase] = None) -> TextIOBase:
@@ -144,7 +231,7 @@ class Eventory:
 
         Args:
             fp: The location to save to. If the location is provided as a string it'll be formatted with filename=self.filename
-                so you may use {filename} and it will be replaced with the actual filename.
+                so you may use {filename} and it will be replaced with the actual filename. The file is replaced atomically.
 
         Returns:
             TextIOBase: The object that was written to
@@ -154,9 +241,36 @@ class Eventory:
 
         if isinstance(fp, str):
             fp = fp.format(filename=self.filename)
-            with open(fp, "w+", encoding="utf-8") as f:
-                return self.save(f)
+            with atomic_open(fp, "w+", encoding="utf-8") as f:
+                self.save(f)
+            return f
 
         data = self.serialise()
         fp.write(data)
         return fp
+
+    def save_bundle(self, fp: Union[str, BufferedIOBase] = None, *, compress: bool = True) -> BufferedIOBase:
+        """Save this Eventory as a binary bundle.
+
+        Bundles contain the parsed content (for example compiled ink) so loading them is a lot faster than loading the text format.
+
+        Args:
+            fp: The location to save to. If the location is provided as a string it'll be formatted with filename=self.bundle_filename
+                so you may use {filename} and it will be replaced with the actual filename. The file is replaced atomically.
+            compress: Whether to compress the sections of the bundle
+
+        Returns:
+            BufferedIOBase: The object that was written to
+        """
+        if not fp:
+            fp = self.bundle_filename
+
+        if isinstance(fp, str):
+            fp = fp.format(filename=self.bundle_filename)
+            with atomic_open(fp, "wb+") as f:
+                self.save_bundle(f, compress=compress)
+            return f
+
+        sections = self.eventructor_cls.bundle_content(self.content)
+        write_bundle(fp, self.get_head(), sections, compress=compress)
+        return fp
@@ -38,6 +38,9 @@ class EventoryParserKeyError(EventoryParserHeadError, KeyError):
         super().__init__(f"{key} is missing!", *args)
         self.key = key
 
+    def __reduce__(self):
+        return type(self), (self.key, *self.args[1:])
+
 
 class EventoryParserValueError(EventoryParserHeadError, ValueError):
     """When a key is present, but the value isn't valid in the head of an Eventory."""
@@ -47,6 +50,9 @@ class EventoryParserValueError(EventoryParserHeadError, ValueError):
         self.key = key
         self.value = value
 
+    def __reduce__(self):
+        return type(self), (self.key, self.value, *self.args[1:])
+
 
 class EventoryParserContentError(EventoryParserError):
     """For Errors concerning the content of an Eventory"""
@@ -63,3 +69,12 @@ class EventoryAlreadyLoaded(EventorialException):
 
     def __init__(self, eventory: str):
         super().__init__(f"\"{eventory}\" is already loaded!")
+        self.eventory = eventory
+
+    def __reduce__(self):
+        return type(self), (self.eventory,)
+
+
+class EventoryTooLarge(EventorialException):
+    """When an Eventory is larger than allowed."""
+    pass
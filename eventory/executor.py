@@ -0,0 +1,214 @@
+"""This module contains the executor shared by all Eventructors.
+
+Attributes:
+    DEFAULT_MAX_WORKERS (int): Default amount of worker threads of a FairExecutor
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future
+from typing import Callable, Hashable
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_shared_executor = None
+_shared_lock = threading.Lock()
+
+log = logging.getLogger(__name__)
+
+
+class FairExecutor(Executor):
+    """A thread pool which schedules the work of its sessions fairly.
+
+    Work is submitted through sessions (see session). Every session has its own queue and the workers take turns between the sessions so a
+    session which submits a lot of work can't starve the others. Work submitted to the executor directly belongs to a default session.
+
+    The threads are started when they're needed, up to max_workers.
+
+    Args:
+        max_workers: Maximum amount of worker threads
+        thread_name_prefix: Prefix for the names of the threads
+
+    Attributes:
+        max_workers (int): Maximum amount of worker threads
+    """
+
+    def __init__(self, max_workers: int = None, thread_name_prefix: str = "Eventory"):
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self._thread_name_prefix = thread_name_prefix
+        self._queues = OrderedDict()
+        self._condition = threading.Condition()
+        self._threads = []
+        self._idle = 0
+        self._shutdown = False
+
+    def __repr__(self) -> str:
+        return f"<FairExecutor {len(self._threads)}/{self.max_workers} threads, {len(self._queues)} session(s) waiting>"
+
+    def _submit(self, key: Hashable, fn: Callable, args: tuple, kwargs: dict) -> Future:
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future = Future()
+            self._queues.setdefault(key, deque()).append((future, fn, args, kwargs))
+            if not self._idle and len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._work, name=f"{self._thread_name_prefix}_{len(self._threads)}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            self._condition.notify()
+        return future
+
+    def _work(self):
+        while True:
+            with self._condition:
+                self._idle += 1
+                while not (self._queues or self._shutdown):
+                    self._condition.wait()
+                self._idle -= 1
+                if not self._queues:
+                    return
+                # take the first session's oldest item and put the session at the back of the line
+                key, queue = next(iter(self._queues.items()))
+                future, fn, args, kwargs = queue.popleft()
+                if queue:
+                    self._queues.move_to_end(key)
+                else:
+                    del self._queues[key]
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Submit work to the default session.
+
+        Args:
+            fn: Callable to call
+            *args: Arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future: Future representing the result
+        """
+        return self._submit(None, fn, args, kwargs)
+
+    def session(self, key: Hashable = None) -> "ExecutorSession":
+        """Get a session of this executor.
+
+        Args:
+            key: Key identifying the session. Sessions with the same key share their queue. If not provided a new session is created.
+
+        Returns:
+            ExecutorSession
+        """
+        return ExecutorSession(self, object() if key is None else key)
+
+    def cancel(self, key: Hashable) -> int:
+        """Cancel the work of a session which hasn't started yet.
+
+        Args:
+            key: Key of the session
+
+        Returns:
+            int: Amount of cancelled items
+        """
+        with self._condition:
+            queue = self._queues.pop(key, ())
+        for future, *_ in queue:
+            future.cancel()
+        return len(queue)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stop accepting new work and stop the threads once all work is done.
+
+        Args:
+            wait: Wait for the threads to exit
+            cancel_futures: Cancel the work which hasn't started yet instead of doing it
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for queue in self._queues.values():
+                    for future, *_ in queue:
+                        future.cancel()
+                self._queues.clear()
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        log.debug(f"{self} shut down")
+
+
+class ExecutorSession(Executor):
+    """A session of a FairExecutor.
+
+    The session can be used like any other executor (i.e. with loop.run_in_executor). Shutting it down only cancels the work of this session.
+
+    Args:
+        executor: Executor doing the work
+        key: Key identifying the session
+
+    Attributes:
+        executor (FairExecutor): Executor doing the work
+        key (Hashable): Key identifying the session
+    """
+
+    def __init__(self, executor: FairExecutor, key: Hashable):
+        self.executor = executor
+        self.key = key
+        self._shutdown = False
+
+    def __repr__(self) -> str:
+        return f"<ExecutorSession {self.key!r} of {self.executor}>"
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Submit work to this session.
+
+        Args:
+            fn: Callable to call
+            *args: Arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future: Future representing the result
+        """
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        return self.executor._submit(self.key, fn, args, kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = True):
+        """Stop accepting work for this session.
+
+        Args:
+            wait: Ignored, the threads belong to the executor
+            cancel_futures: Cancel the work of this session which hasn't started yet
+        """
+        self._shutdown = True
+        if cancel_futures:
+            self.executor.cancel(self.key)
+
+
+def get_shared_executor() -> FairExecutor:
+    """Get the executor shared by everything in this process.
+
+    It's created the first time it's needed and shut down when the interpreter exits.
+
+    Returns:
+        FairExecutor
+    """
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = FairExecutor()
+            atexit.register(_shared_executor.shutdown, cancel_futures=True)
+    return _shared_executor
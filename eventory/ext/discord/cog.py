@@ -1,9 +1,11 @@
+import json
 import logging
 from typing import Dict, Optional, Union
 
 from discord.ext.commands import Bot, Context, group
 
-from eventory import Eventorial, Eventructor
+from eventory import Eventorial, Eventory, Eventructor
+from eventory.snapshots import SnapshotStore
 from .compat import DiscordTextChannel, add_embed
 from .narrator import DiscordEventarrator
 
@@ -21,9 +23,10 @@ class EventoryCog:
     ERROR_COLOUR = 0xFF0000
     INFO_COLOUR = 0xC8FF6A
 
-    def __init__(self, bot: Bot, *, directory: str = None):
+    def __init__(self, bot: Bot, *, directory: str = None, lazy: bool = False, snapshots: str = None):
         self.bot = bot
-        self.eventorial = Eventorial(directory=directory, loop=self.bot.loop)
+        self.eventorial = Eventorial(directory=directory, lazy=lazy, loop=self.bot.loop)
+        self.snapshots = SnapshotStore(snapshots, executor=self.eventorial.executor, loop=self.bot.loop) if snapshots else None
         self.instructors = {}
 
     def get_instructor(self, channel: Union[int, Context, DiscordTextChannel]) -> Optional[Eventructor]:
@@ -40,6 +43,12 @@ class EventoryCog:
                 return instructor
         return None
 
+    def not_found_message(self, name: str) -> str:
+        suggestions = self.eventorial.search(name, limit=3)
+        if suggestions:
+            return f"No Eventory \"{name}\" found. Did you mean " + " or ".join(f"\"{story.title}\"" for story in suggestions) + "?"
+        return f"No Eventory \"{name}\" found"
+
     @group(pass_context=True)
     async def eventory(self, ctx: Context):
         """Yay"""
@@ -65,12 +74,39 @@ class EventoryCog:
             return
         story = self.eventorial.get(name, None)
         if not story:
-            await add_embed(ctx, f"No Eventory \"{name}\" found", self.ERROR_COLOUR)
+            await add_embed(ctx, self.not_found_message(name), self.ERROR_COLOUR)
+            return
+        await self.start(ctx, story)
+
+    @eventory.command(pass_context=True)
+    async def resume(self, ctx: Context):
+        """Resume the Eventory which was running in this channel before the bot restarted"""
+        if self.get_instructor(ctx):
+            await add_embed(ctx, "There's already an Eventory running in this chat!", self.ERROR_COLOUR)
+            return
+        state = None
+        if self.snapshots:
+            state = await self.bot.loop.run_in_executor(None, self.snapshots.load, str(ctx.message.channel.id))
+        if not state:
+            await add_embed(ctx, "No Eventory to resume in this chat", self.ERROR_COLOUR)
+            return
+        title = json.loads(state).get("title")
+        story = self.eventorial.get(title, None) if title else None
+        if not story:
+            await add_embed(ctx, f"The Eventory \"{title}\" isn't available anymore", self.ERROR_COLOUR)
             return
+        await self.start(ctx, story, state)
+
+    async def start(self, ctx: Context, story: Eventory, state: str = None):
+        if not story.loaded:
+            # make sure loading the content doesn't block the loop
+            await self.bot.loop.run_in_executor(None, getattr, story, "content")
         narrator = DiscordEventarrator(self.bot, ctx.message.channel)
-        instructor = story.narrate(narrator)
+        instructor = story.narrate(narrator, executor=self.eventorial.executor, snapshots=self.snapshots, session_id=str(ctx.message.channel.id))
+        if state:
+            instructor.resume(state)
         self.instructors[ctx.message.channel.id] = instructor
-        await add_embed(ctx, f"Playing \"{story.title}\" by {story.author}", self.SUCCESS_COLOUR)
+        await add_embed(ctx, f"{'Resuming' if state else 'Playing'} \"{story.title}\" by {story.author}", self.SUCCESS_COLOUR)
         await instructor.play()
         log.info(f"playing {story} in {ctx.message.channel}")
 
@@ -84,9 +120,9 @@ class EventoryCog:
                 return
             story = instructor.eventory
         else:
-            story = self.eventorial.get(story, None)
+            name, story = story, self.eventorial.get(story, None)
             if not story:
-                await add_embed(ctx, f"No Eventory \"{story}\" found", self.ERROR_COLOUR)
+                await add_embed(ctx, self.not_found_message(name), self.ERROR_COLOUR)
                 return
         await add_embed(ctx, title=story.title, description=story.description, footer=f"Version {story.version}", author=story.author,
                         colour=self.INFO_COLOUR)
@@ -97,6 +133,7 @@ class EventoryCog:
         instructor = self.get_instructor(ctx)
         if instructor:
             instructor.stop()
+            await instructor.discard_snapshot()
             log.info(f"stopped {instructor} in {ctx.message.channel}")
         else:
             await add_embed(ctx, "No Eventory currently running in this chat", self.ERROR_COLOUR)
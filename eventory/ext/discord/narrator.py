@@ -28,7 +28,9 @@ class DiscordEventarrator(Eventarrator):
         message_check (Optional[Callable[[Message], Union[bool, Awaitable[bool]]])
         options (dict): Leftover keyword arguments passed to the constructor
         sent_messages (deque): Deque containing the ids of the last 10 messages sent by the Eventarrator
+        max_turn_length (int): Turns are split up so they fit into a single message (2000 characters)
     """
+    max_turn_length = 2000
 
     def __init__(self, client: Client, channel: DiscordTextChannel, **options):
         self.client = client
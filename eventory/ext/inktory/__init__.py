@@ -3,39 +3,125 @@
 The module uses some external binaries/libraries to run, namely "ink-engine-runtime.dll" to run the stories and "inklecate.exe" to compile them.
 These files can be downloaded from the ink repository (https://github.com/inkle/ink/releases).
 In order for the extension to work properly you should put both files in the CWD of your script.
+
+Instead of the .NET runtime the stories can also be run by pink, a pure Python port of the runtime, using the backend option of the parser
+(i.e. eventory.load(f, backend="pink")). The backend is stored with the Eventory (see Eventory.options). pink only runs ink compiled by
+inklecate 0.8 (inkVersion 18) and can load the knots of a story lazily (lazy_knots option). The .NET runtime is only loaded once a Story of it
+is needed.
+
+Attributes:
+    BACKENDS (Tuple[str, ...]): Names of the runtimes which can run the stories
+    DEFAULT_BACKEND (str): Runtime used when the parser isn't told otherwise
+    INKLECATE_CMD (List[str]): Command used to run "inklecate.exe"
+    INKLECATE_VERSION (Optional[str]): Identifier of the installed "inklecate.exe" or None if it couldn't be found
+    compile_cache (Optional[InkCompileCache]): Cache used to store compiled ink across restarts. None if caching is disabled.
+    MAX_CONCURRENT_COMPILES (int): Amount of "inklecate.exe" processes that may run at the same time when compiling asynchronously
 """
 
-import clr
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import shutil
 import subprocess
 import sys
+from asyncio import AbstractEventLoop, Semaphore
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from os import path
 from tempfile import TemporaryDirectory
-from typing import Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+from weakref import WeakKeyDictionary
 
-# noinspection PyUnresolvedReferences, PyPackageRequirements
-from System.IO import FileNotFoundException
+from eventory import EventoryParser, EventoryParserError, Eventructor, Turn, register_parser, split_text
+from eventory.store import CopyOnWriteDict
+from .cache import InkCompileCache
+from .pool import StoryPool
 
-from eventory import EventoryParser, EventoryParserError, Eventructor, register_parser
+BACKENDS = ("dotnet", "pink")
+DEFAULT_BACKEND = "dotnet"
 
-try:
-    clr.AddReference("ink-engine-runtime")
-except FileNotFoundException:
-    raise FileNotFoundError(f"Couldn't find \"ink-engine-runtime.dll\", please add it to the CWD ({os.getcwd()}) in order to use inktory. You can "
-                            "download it from here: https://github.com/inkle/ink/releases") from None
-else:
-    # noinspection PyUnresolvedReferences, PyPackageRequirements
-    from Ink.Runtime import Story
+Story = None
 
 if sys.platform == "linux":
     INKLECATE_CMD = ["mono", "inklecate.exe"]
 else:
     INKLECATE_CMD = ["inklecate.exe"]
 
+MAX_CONCURRENT_COMPILES = max(1, (os.cpu_count() or 1) // 2)
+_compile_semaphores: Dict[AbstractEventLoop, Semaphore] = WeakKeyDictionary()
+
 log = logging.getLogger(__name__)
 
+
+def load_runtime() -> type:
+    """Load the .NET runtime.
+
+    This happens the first time a Story of the "dotnet" backend is created, so using only the "pink" backend doesn't require pythonnet or
+    "ink-engine-runtime.dll".
+
+    Returns:
+        type: Ink.Runtime.Story
+
+    Raises:
+        FileNotFoundError: When "ink-engine-runtime.dll" couldn't be found
+    """
+    global Story
+    if Story is None:
+        import clr
+        # noinspection PyUnresolvedReferences, PyPackageRequirements
+        from System.IO import FileNotFoundException
+
+        try:
+            clr.AddReference("ink-engine-runtime")
+        except FileNotFoundException:
+            raise FileNotFoundError(f"Couldn't find \"ink-engine-runtime.dll\", please add it to the CWD ({os.getcwd()}) in order to use the "
+                                    "dotnet backend. You can download it from here: https://github.com/inkle/ink/releases") from None
+        # noinspection PyUnresolvedReferences, PyPackageRequirements
+        from Ink.Runtime import Story as _Story
+        Story = _Story
+        log.debug("loaded the .NET runtime")
+    return Story
+
+
+def get_story_class(backend: str) -> type:
+    """Get the Story class of a backend.
+
+    Args:
+        backend: One of BACKENDS
+
+    Returns:
+        type: Ink.Runtime.Story for "dotnet" and PinkStory for "pink"
+
+    Raises:
+        ValueError: When the backend doesn't exist
+    """
+    if backend == "dotnet":
+        return load_runtime()
+    elif backend == "pink":
+        from .pink import PinkStory
+        return PinkStory
+    raise ValueError(f"Unknown ink backend \"{backend}\", expected one of {BACKENDS}")
+
+
+def _inklecate_version(usage: bytes) -> str:
+    """Identify the installed "inklecate.exe" so compiled ink can be cached per compiler.
+
+    The executable itself is hashed because inklecate doesn't report a reliable version number. If the file can't be found, the usage output is
+    used instead.
+    """
+    h = hashlib.sha256(usage)
+    location = shutil.which(INKLECATE_CMD[-1]) or path.abspath(INKLECATE_CMD[-1])
+    if path.isfile(location):
+        with open(location, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+INKLECATE_VERSION = None
+
 try:
     resp = subprocess.run(INKLECATE_CMD, stdout=subprocess.PIPE)
 except FileNotFoundError:
@@ -53,9 +139,12 @@ except OSError:
 else:
     if "Usage: inklecate" in resp.stdout.decode("utf-8"):
         log.info("\"inklecate.exe\" passed check!")
+        INKLECATE_VERSION = _inklecate_version(resp.stdout)
     else:
         log.warning("Found \"inklecate.exe\" but it's not responding properly. Compiling raw ink might not work")
 
+compile_cache = InkCompileCache(version=INKLECATE_VERSION) if INKLECATE_VERSION else None
+
 
 class EventoryInkContent:
     """The object that is passed to the Eventory as content.
@@ -63,15 +152,32 @@ class EventoryInkContent:
     Args:
         raw: Uncompiled ink of the story
         compiled: Compiled ink
+        backend: Runtime used to run the story (one of BACKENDS)
+        lazy_knots: Whether the Stories only load the knots and stitches once they're needed (only supported by pink)
 
     Attributes:
         raw (str): Uncompiled ink of the story
         compiled (str): Compiled ink
+        backend (str): Runtime used to run the story
+        lazy_knots (bool): Whether the Stories only load the knots and stitches once they're needed
     """
 
-    def __init__(self, raw: Optional[str], compiled: str):
+    def __init__(self, raw: Optional[str], compiled: str, backend: str = DEFAULT_BACKEND, lazy_knots: bool = False):
         self.raw = raw
         self.compiled = compiled
+        self.backend = backend
+        self.lazy_knots = lazy_knots
+        self._pool = None
+
+    @property
+    def pool(self) -> StoryPool:
+        """Pool of Stories of the compiled ink. It's created when it's first needed."""
+        if self._pool is None:
+            factory = partial(get_story_class(self.backend), self.compiled)
+            if self.lazy_knots:
+                factory = partial(factory, lazy=True)
+            self._pool = StoryPool(factory)
+        return self._pool
 
     def __repr__(self):
         content_str = "raw, compiled" if self.raw else "compiled"
@@ -84,19 +190,77 @@ class EventoryInkContent:
 class InkEventructor(Eventructor):
     """Special Eventructor to instruct ink Eventories.
 
+    The Story is either an Ink.Runtime.Story or a PinkStory depending on the backend of the content, both provide the same interface.
+
     Attributes:
         content: The content of the Eventory
         story: Story that's being instructed
+        batch_output (bool): Whether to output everything up to the next choice as one Turn (see Eventarrator.output_turn) instead of outputting
+            every line on its own. True by default.
     """
     content: EventoryInkContent
-    story: Story
+    story: Any
+    batch_output = True
+
+    @classmethod
+    def bundle_content(cls, content: EventoryInkContent) -> Dict[str, bytes]:
+        """Store the compiled (and if available the raw) ink in separate sections of the bundle.
+
+        Args:
+            content: Content to bundle
+
+        Returns:
+            Dict[str, bytes]: The "compiled" and optionally the "raw" section
+        """
+        sections = {"compiled": content.compiled.encode("utf-8")}
+        if content.raw:
+            sections["raw"] = content.raw.encode("utf-8")
+        return sections
 
     def init(self):
         """Initialise the Eventructor.
 
-        Create the Story object to make sure that it won't affect the initial Eventory instance.
+        The Story is taken from the pool of the content so the compiled ink doesn't have to be parsed again for every session.
+        """
+        self.story = self.content.pool.acquire()
+        self._playing = False
+
+    def stop(self):
+        """Stop the Eventructor.
+
+        The Story is returned to the pool right away unless the Eventory is still being played in which case play returns it once it stops.
         """
-        self.story = Story(self.content.compiled)
+        super().stop()
+        if not self._playing:
+            self.release_story()
+
+    def release_story(self):
+        """Return the Story to the pool of the content. The Eventructor can't be played afterwards."""
+        story, self.story = self.story, None
+        if story is not None:
+            self.content.pool.release(story)
+
+    def serialise(self) -> str:
+        """Serialise the state of the Story and the store.
+
+        Returns:
+            str: JSON object containing the title of the Eventory, the state of the Story and the store
+        """
+        return json.dumps({
+            "title": self.eventory.title,
+            "state": json.loads(self.story.state.ToJson()),
+            "store": self.store.to_dict()
+        })
+
+    def resume(self, state: str):
+        """Restore a state returned by serialise.
+
+        Args:
+            state: State to restore
+        """
+        data = json.loads(state)
+        self.story.state.LoadJson(json.dumps(data["state"]))
+        self.store = CopyOnWriteDict(data.get("store", {}))
 
     async def index_input(self, max_index: int) -> int:
         """Wrapper around input function to receive the index of the choice the user wants to make.
@@ -119,21 +283,90 @@ class InkEventructor(Eventructor):
                     return num - 1
             await self.narrator.output(f"Please use a number between 1 and {max_index}\n")
 
+    async def output_lines(self):
+        """Output the story up to the next choice line by line."""
+        while self.story.canContinue:
+            out = self.story.Continue()
+            await self.narrator.output(out)
+
+        if self.story.currentChoices.Count > 0:
+            out = "\n".join(f"{i}. {choice.text}" for i, choice in enumerate(self.story.currentChoices, 1)) + "\n"
+            await self.narrator.output(out)
+
+    async def output_turn(self):
+        """Output the story up to the next choice as a Turn.
+
+        The turn is split into multiple parts if it exceeds the max_turn_length or max_turn_delay of the narrator (see Turn for how lines and
+        choices which don't fit are split).
+        """
+        max_length = self.narrator.max_turn_length
+        max_delay = self.narrator.max_turn_delay
+        turn = Turn(complete=False)
+        length = 0
+        started = self.loop.time()
+
+        async def flush():
+            nonlocal turn, length, started
+            await self.narrator.output_turn(turn)
+            turn, length, started = Turn(complete=False), 0, self.loop.time()
+
+        while self.story.canContinue:
+            line = self.story.Continue()
+            for part in split_text(line, max_length) if max_length is not None else (line,):
+                if turn and max_length is not None and length + len(part) > max_length:
+                    await flush()
+                turn.lines.append(part)
+                length += len(part)
+            turn.tags.extend(self.story.currentTags)
+            if max_delay is not None and self.loop.time() - started >= max_delay:
+                await flush()
+
+        choices = [choice.text for choice in self.story.currentChoices]
+        if max_length is None or length + len(Turn(choices=choices).choices_text) <= max_length:
+            turn.choices = choices
+        else:
+            for number, choice in enumerate(choices, 1):
+                entry = Turn(choices=[choice], first_choice=number).choices_text
+                if length + len(entry) > max_length and turn:
+                    await flush()
+                if len(entry) > max_length:
+                    for part in split_text(entry, max_length):
+                        turn.lines.append(part)
+                        await flush()
+                    continue
+                if not turn.choices:
+                    turn.first_choice = number
+                turn.choices.append(choice)
+                length += len(entry)
+        turn.complete = True
+        await self.narrator.output_turn(turn)
+
     async def play(self):
-        """Start playing the Eventory."""
+        """Start playing the Eventory.
+
+        If the Eventructor has a snapshots store a snapshot is saved every time the Eventory waits for input and removed once it's over.
+        """
         await self.prepare()
-        while True:
-            while self.story.canContinue:
-                out = self.story.Continue()
-                await self.narrator.output(out)
-
-            if self.story.currentChoices.Count > 0:
-                out = "\n".join(f"{i}. {choice.text}" for i, choice in enumerate(self.story.currentChoices, 1)) + "\n"
-                await self.narrator.output(out)
-                index = await self.index_input(self.story.currentChoices.Count)
-                self.story.ChooseChoiceIndex(index)
-            else:
-                break
+        self._playing = True
+        try:
+            while not self.stopped:
+                if self.batch_output:
+                    await self.output_turn()
+                else:
+                    await self.output_lines()
+
+                if self.story.currentChoices.Count > 0:
+                    self.checkpoint()
+                    index = await self.index_input(self.story.currentChoices.Count)
+                    if self.stopped:
+                        break
+                    self.story.ChooseChoiceIndex(index)
+                else:
+                    break
+            await self.discard_snapshot()
+        finally:
+            self._playing = False
+            self.release_story()
 
 
 class InklecateNotFound(EventoryParserError, FileNotFoundError):
@@ -141,15 +374,66 @@ class InklecateNotFound(EventoryParserError, FileNotFoundError):
     pass
 
 
+def _write_file(location: str, data: str):
+    with open(location, "w+") as f:
+        f.write(data)
+
+
+def _read_file(location: str) -> str:
+    with open(location, "r", encoding="utf-8-sig") as f:
+        return f.read()
+
+
+def _compile_file(location: str) -> str:
+    try:
+        subprocess.run([*INKLECATE_CMD, location], check=True)
+    except FileNotFoundError:
+        raise _inklecate_not_found() from None
+    return _read_file(location + ".json")
+
+
+def _get_compile_semaphore(loop: AbstractEventLoop) -> Semaphore:
+    semaphore = _compile_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _compile_semaphores[loop] = Semaphore(MAX_CONCURRENT_COMPILES)
+    return semaphore
+
+
+def _inklecate_not_found() -> InklecateNotFound:
+    return InklecateNotFound(
+        f"Couldn't find \"inklecate.exe\", please add it to your PATH or to the CWD ({os.getcwd()}) in order to compile ink. You can "
+        "download it from here: https://github.com/inkle/ink/releases")
+
+
 class EventoryInkParser(EventoryParser):
     """An Eventory parser capable of compiling raw ink into compiled, ready to use ink.
 
     Since the parser doesn't convert the ink into a Eventory-friendly format the InkEventructor instructor is needed to run ink-based Eventories.
+
+    Args:
+        backend: Runtime used to run the stories (one of BACKENDS). Defaults to DEFAULT_BACKEND.
+        lazy_knots: Only load the knots and stitches of a Story once they're needed, so creating a Story doesn't load the entire story. Only
+            supported by the "pink" backend.
+
+    Attributes:
+        backend (str): Runtime used to run the stories
+        lazy_knots (bool): Whether the Stories only load the knots and stitches once they're needed
+
+    Raises:
+        ValueError: When the backend doesn't exist or doesn't support lazy_knots
     """
     instructor = InkEventructor
 
-    @staticmethod
-    def parse_content(content: str) -> EventoryInkContent:
+    def __init__(self, *, backend: str = None, lazy_knots: bool = False):
+        backend = backend or DEFAULT_BACKEND
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown ink backend \"{backend}\", expected one of {BACKENDS}")
+        if lazy_knots and backend != "pink":
+            raise ValueError(f"The {backend} backend can't load knots lazily")
+        self.backend = backend
+        self.lazy_knots = lazy_knots
+
+    def parse_content(self, content: str) -> EventoryInkContent:
         """Creates the content object from either raw or compiled ink.
 
         Args:
@@ -174,12 +458,29 @@ class EventoryInkParser(EventoryParser):
             raw = None
             compiled = content
 
-        return EventoryInkContent(raw, compiled)
+        return EventoryInkContent(raw, compiled, self.backend, self.lazy_knots)
+
+    def unbundle_content(self, sections: Mapping[str, bytes]) -> EventoryInkContent:
+        """Create the content object from the sections of a bundle.
+
+        The ink in the bundle is already compiled so neither compiling it nor checking whether it's valid JSON is necessary.
+
+        Args:
+            sections: Sections created by InkEventructor.bundle_content
+
+        Returns:
+            EventoryInkContent: Content object
+        """
+        raw = sections.get("raw")
+        return EventoryInkContent(raw.decode("utf-8") if raw else None, sections["compiled"].decode("utf-8"), self.backend, self.lazy_knots)
 
     @staticmethod
     def compile(ink: str) -> str:
         """Compile raw ink into compiled ink using "inklecate.exe".
 
+        Ink that has already been compiled by the same version of "inklecate.exe" is taken from the compile_cache instead. You can set
+        compile_cache to None in order to disable caching or replace it with your own InkCompileCache.
+
         Args:
             ink: raw ink to compile
 
@@ -189,20 +490,197 @@ class EventoryInkParser(EventoryParser):
         Raises:
             InklecateNotFound: When "inklecate.exe" couldn't be found or used.
         """
+        cache = compile_cache
+        if cache is not None:
+            data = cache.get(ink)
+            if data is not None:
+                log.debug("Using cached compiled ink")
+                return data
+
+        data = EventoryInkParser._run_inklecate(ink)
+        if cache is not None:
+            cache.set(ink, data)
+        return data
+
+    @staticmethod
+    def _run_inklecate(ink: str) -> str:
         with TemporaryDirectory() as directory:
             in_dir = path.join(directory, "input.ink")
+            _write_file(in_dir, ink)
+            return _compile_file(in_dir)
+
+    def parse_contents(self, contents: Sequence[str], *, return_exceptions: bool = False) -> List[Union[EventoryInkContent, Exception]]:
+        """Create the content objects for multiple contents at once.
+
+        All raw ink is compiled together using compile_many.
+
+        Args:
+            contents: Raw or compiled ink to parse
+            return_exceptions: If True exceptions are returned in place of the content that caused them instead of being raised
+
+        Returns:
+            List[Union[EventoryInkContent, Exception]]: Content objects in the same order as contents
+        """
+        results = []
+        raw_indices = []
+        for content in contents:
+            try:
+                json.loads(content)
+            except json.JSONDecodeError:
+                raw_indices.append(len(results))
+                results.append(None)
+            else:
+                results.append(EventoryInkContent(None, content, self.backend, self.lazy_knots))
+
+        log.debug(f"{len(raw_indices)} of {len(contents)} contents need to be compiled")
+        compiled = EventoryInkParser.compile_many([contents[i] for i in raw_indices], return_exceptions=return_exceptions)
+        for i, data in zip(raw_indices, compiled):
+            results[i] = data if isinstance(data, Exception) else EventoryInkContent(contents[i], data, self.backend, self.lazy_knots)
+        return results
+
+    @staticmethod
+    def compile_many(inks: Sequence[str], *, workers: int = None, return_exceptions: bool = False) -> List[Union[str, Exception]]:
+        """Compile multiple raw inks at once.
+
+        "inklecate.exe" only compiles a single story per run, so instead of creating a temporary directory for every story all inks are written
+        to one work directory and compiled by a small pool of workers. Duplicate inks are only compiled once and inks already present in the
+        compile_cache aren't compiled at all.
+
+        Args:
+            inks: Raw inks to compile
+            workers: Amount of "inklecate.exe" processes to run at the same time. Defaults to MAX_CONCURRENT_COMPILES.
+            return_exceptions: If True exceptions are returned in place of the ink that caused them instead of being raised
+
+        Returns:
+            List[Union[str, Exception]]: Compiled inks in the same order as inks
+
+        Raises:
+            InklecateNotFound: When "inklecate.exe" couldn't be found or used.
+        """
+        cache = compile_cache
+        compiled = {}
+        pending = []
+        for ink in inks:
+            if ink in compiled:
+                continue
+            data = cache.get(ink) if cache is not None else None
+            if data is None:
+                pending.append(ink)
+            compiled[ink] = data
+
+        if pending:
+            log.debug(f"compiling {len(pending)} ink(s)")
+            with TemporaryDirectory() as directory:
+                locations = []
+                for i, ink in enumerate(pending):
+                    location = path.join(directory, f"input_{i}.ink")
+                    _write_file(location, ink)
+                    locations.append(location)
+                with ThreadPoolExecutor(min(workers or MAX_CONCURRENT_COMPILES, len(pending))) as executor:
+                    futures = [executor.submit(_compile_file, location) for location in locations]
+                for ink, future in zip(pending, futures):
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        compiled[ink] = e
+                    else:
+                        compiled[ink] = data
+                        if cache is not None:
+                            cache.set(ink, data)
+
+        results = []
+        for ink in inks:
+            data = compiled[ink]
+            if isinstance(data, Exception) and not return_exceptions:
+                raise data
+            results.append(data)
+        return results
+
+    async def parse_content_async(self, content: str, *, loop: AbstractEventLoop = None) -> EventoryInkContent:
+        """Asynchronous version of parse_content which doesn't block the loop while the ink is being compiled.
+
+        Args:
+            content: Raw or compiled ink to parse
+            loop: Loop to use. Uses asyncio.get_event_loop() if not specified.
+
+        Returns:
+            EventoryInkContent: Content object
+
+        Raises:
+            InklecateNotFound: When content needs to be compiled but "inklecate.exe" couldn't be found or used.
+        """
+        loop = loop or asyncio.get_event_loop()
+        try:
+            # check if it's already compiled
+            await loop.run_in_executor(None, json.loads, content)
+        except json.JSONDecodeError:
+            log.debug("Content needs to be compiled")
+            raw = content
+            compiled = await EventoryInkParser.compile_async(content, loop=loop)
+        else:
+            log.debug("Content provided as JSON")
+            raw = None
+            compiled = content
+
+        return EventoryInkContent(raw, compiled, self.backend, self.lazy_knots)
+
+    @staticmethod
+    async def compile_async(ink: str, *, loop: AbstractEventLoop = None) -> str:
+        """Asynchronous version of compile.
+
+        "inklecate.exe" is run as an asyncio subprocess and all file I/O happens in the default executor of the loop. At most
+        MAX_CONCURRENT_COMPILES compilations run at the same time.
+
+        Args:
+            ink: raw ink to compile
+            loop: Loop to use. Uses asyncio.get_event_loop() if not specified.
+
+        Returns:
+            str: compiled ink
+
+        Raises:
+            InklecateNotFound: When "inklecate.exe" couldn't be found or used.
+        """
+        loop = loop or asyncio.get_event_loop()
+        cache = compile_cache
+        if cache is not None:
+            data = await loop.run_in_executor(None, cache.get, ink)
+            if data is not None:
+                log.debug("Using cached compiled ink")
+                return data
+
+        async with _get_compile_semaphore(loop):
+            data = await EventoryInkParser._run_inklecate_async(ink, loop)
+        if cache is not None:
+            await loop.run_in_executor(None, cache.set, ink, data)
+        return data
+
+    @staticmethod
+    async def _run_inklecate_async(ink: str, loop: AbstractEventLoop) -> str:
+        directory = await loop.run_in_executor(None, TemporaryDirectory)
+        try:
+            in_dir = path.join(directory.name, "input.ink")
             out_dir = in_dir + ".json"
-            with open(in_dir, "w+") as f:
-                f.write(ink)
+            await loop.run_in_executor(None, _write_file, in_dir, ink)
             try:
-                subprocess.run([*INKLECATE_CMD, in_dir], check=True)
+                process = await asyncio.create_subprocess_exec(*INKLECATE_CMD, in_dir)
             except FileNotFoundError:
-                raise InklecateNotFound(
-                    f"Couldn't find \"inklecate.exe\", please add it to your PATH or to the CWD ({os.getcwd()}) in order to compile ink. You can "
-                    "download it from here: https://github.com/inkle/ink/releases") from None
-            with open(out_dir, "r", encoding="utf-8-sig") as f:
-                data = f.read()
-            return data
+                raise _inklecate_not_found() from None
+            try:
+                return_code = await process.wait()
+            except asyncio.CancelledError:
+                # don't leave inklecate running (and writing to the directory which is about to be removed)
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+                raise
+            if return_code:
+                raise subprocess.CalledProcessError(return_code, [*INKLECATE_CMD, in_dir])
+            return await loop.run_in_executor(None, _read_file, out_dir)
+        finally:
+            await loop.run_in_executor(None, directory.cleanup)
 
 
 register_parser(EventoryInkParser, ("Ink",))
@@ -0,0 +1,159 @@
+"""Persistent cache for compiled ink.
+
+Compiling raw ink with "inklecate.exe" is slow (most of the time is spent starting the executable) so compiled ink is stored on disk. The entries are
+addressed by a hash of the raw ink and the version of the compiler which means that changing either of them results in a new entry.
+
+Attributes:
+    DEFAULT_CACHE_DIRECTORY (str): Directory used to store the compiled ink if none is specified
+    DEFAULT_MAX_SIZE (int): Default size (in bytes) the cache may grow to before the least recently used entries are evicted
+"""
+
+import hashlib
+import logging
+import os
+from os import path
+from tempfile import NamedTemporaryFile
+from typing import List, Optional, Tuple
+
+DEFAULT_CACHE_DIRECTORY = path.join(path.expanduser("~"), ".eventory", "ink_cache")
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+_ENTRY_SUFFIX = ".json"
+
+log = logging.getLogger(__name__)
+
+
+class InkCompileCache:
+    """A content-addressed, size-bounded cache for compiled ink.
+
+    Every entry is a file in the directory of the cache. When the total size exceeds max_size the least recently used entries are removed.
+
+    Args:
+        directory: Directory to store the compiled ink in. It's created when the first entry is stored.
+        max_size: Size (in bytes) the cache may grow to
+        version: Version of the compiler. This is part of the key so entries of a different compiler are never used.
+
+    Attributes:
+        directory (str): Directory to store the compiled ink in
+        max_size (int): Size (in bytes) the cache may grow to
+        version (str): Version of the compiler
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIRECTORY, max_size: int = DEFAULT_MAX_SIZE, *, version: str = ""):
+        self.directory = directory
+        self.max_size = max_size
+        self.version = version
+        self._size = None
+
+    def __repr__(self) -> str:
+        return f"<InkCompileCache {self.directory}>"
+
+    def __contains__(self, ink: str) -> bool:
+        return path.isfile(self._path(self.key(ink)))
+
+    @property
+    def size(self) -> int:
+        """Total size of all entries in bytes."""
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._entries())
+        return self._size
+
+    def _path(self, key: str) -> str:
+        return path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        entries = []
+        if not path.isdir(self.directory):
+            return entries
+        for name in os.listdir(self.directory):
+            if not name.endswith(_ENTRY_SUFFIX):
+                continue
+            location = path.join(self.directory, name)
+            try:
+                stat = os.stat(location)
+            except FileNotFoundError:
+                continue
+            entries.append((location, stat.st_mtime, stat.st_size))
+        return entries
+
+    def key(self, ink: str) -> str:
+        """Get the key for raw ink.
+
+        Args:
+            ink: Raw ink
+
+        Returns:
+            str: Hex digest identifying the ink compiled by the current version of the compiler
+        """
+        h = hashlib.sha256(self.version.encode("utf-8"))
+        h.update(b"\0")
+        h.update(ink.encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, ink: str) -> Optional[str]:
+        """Get the compiled version of raw ink.
+
+        Args:
+            ink: Raw ink to look up
+
+        Returns:
+            Optional[str]: Compiled ink or None if it isn't in the cache
+        """
+        location = self._path(self.key(ink))
+        try:
+            with open(location, "r", encoding="utf-8") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(location)  # mark as recently used
+        except FileNotFoundError:
+            pass
+        log.debug(f"{self} hit for {location}")
+        return data
+
+    def set(self, ink: str, compiled: str):
+        """Store compiled ink.
+
+        The entry is written to a temporary file first and then moved into place so other processes never see partial entries.
+
+        Args:
+            ink: Raw ink which was compiled
+            compiled: Compiled ink
+        """
+        location = self._path(self.key(ink))
+        data = compiled.encode("utf-8")
+        if self._size is not None and path.isfile(location):
+            self._size -= path.getsize(location)
+        os.makedirs(self.directory, exist_ok=True)
+        with NamedTemporaryFile("wb", dir=self.directory, suffix=".tmp", delete=False) as f:
+            f.write(data)
+        os.replace(f.name, location)
+        if self._size is not None:
+            self._size += len(data)
+        log.debug(f"{self} stored {location}")
+        if self.size > self.max_size:
+            self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits into max_size."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size = sum(entry[2] for entry in entries)
+        for location, _, entry_size in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(location)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+            log.debug(f"{self} evicted {location}")
+        self._size = size
+
+    def clear(self):
+        """Remove all entries."""
+        for location, _, _ in self._entries():
+            try:
+                os.remove(location)
+            except FileNotFoundError:
+                pass
+        self._size = 0
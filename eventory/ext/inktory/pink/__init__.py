@@ -0,0 +1,82 @@
+"""pink is a pure Python port of the ink runtime.
+
+It runs compiled ink without .NET. Raw ink still has to be compiled by "inklecate.exe". pink is a port of version 0.8 of the runtime and only
+runs ink compiled to inkVersion 18 (by inklecate 0.8), older ink (like the inkVersion 17 produced by inklecate 0.7) is rejected with a
+StoryException and has to be compiled again.
+
+PinkStory wraps the Story of the engine in the interface of the .NET runtime (Ink.Runtime.Story) which is used by the InkEventructor, so both
+runtimes can be used interchangeably (see the backend option of EventoryInkParser).
+"""
+
+from typing import List
+
+from .engine.choice import Choice
+from .engine.story import Story
+
+__all__ = ["PinkStory", "Story"]
+
+
+class _ChoiceList(list):
+    @property
+    def Count(self) -> int:
+        return len(self)
+
+
+class _PinkState:
+    __slots__ = ("_story",)
+
+    def __init__(self, story: Story):
+        self._story = story
+
+    def ToJson(self) -> str:
+        return self._story.state.to_json()
+
+    def LoadJson(self, json: str):
+        self._story.state.load_json(json)
+
+
+class PinkStory:
+    """A Story of the pink engine with the interface of Ink.Runtime.Story.
+
+    Only the part of the interface used by the InkEventructor is provided, the engine Story itself is available as story.
+
+    Args:
+        json: Compiled ink
+        lazy: Only load the knots and stitches of the story once they're needed instead of all of them up front
+
+    Attributes:
+        story (Story): Story of the pink engine
+    """
+    __slots__ = ("story", "state")
+
+    def __init__(self, json: str, lazy: bool = False):
+        self.story = Story(json, lazy)
+        self.state = _PinkState(self.story)
+
+    def __repr__(self) -> str:
+        return f"<PinkStory {self.story.state.current_path_string}>"
+
+    @property
+    def canContinue(self) -> bool:
+        return self.story.can_continue
+
+    @property
+    def currentChoices(self) -> List[Choice]:
+        return _ChoiceList(self.story.current_choices)
+
+    @property
+    def currentTags(self) -> List[str]:
+        return self.story.current_tags
+
+    @property
+    def currentText(self) -> str:
+        return self.story.current_text
+
+    def Continue(self) -> str:
+        return self.story.continue_story()
+
+    def ChooseChoiceIndex(self, index: int):
+        self.story.choose_choice_index(index)
+
+    def ResetState(self):
+        self.story.reset_state()
@@ -1,97 +1,84 @@
 from .path import Path
+from .pointer import Pointer
 from .push_pop import PushPopType
 from .story_exception import StoryException
+from .utils import late_import_from
 
 
 class Element:
-    def __init__(self, element_type, container, content_index, in_expression_evaluation=False):
-        self.current_container = container
-        self.current_content_index = content_index
+    def __init__(self, element_type, pointer, in_expression_evaluation=False):
+        self.current_pointer = pointer
         self.in_expression_evaluation = in_expression_evaluation
         self.temporary_variables = {}
         self.element_type = element_type
         self.evaluation_stack_height_when_pushed = 0
-
-    @property
-    def current_object(self):
-        if self.current_container and self.current_content_index < len(self.current_container.content):
-            return self.current_container.content[self.current_content_index]
-
-    @current_object.setter
-    def current_object(self, value):
-        if not value:
-            self.current_container = None
-            self.current_content_index = 0
-            return
-        self.current_container = value.parent
-        if self.current_container:
-            self.current_content_index = self.current_container.content.index(value)
-        if self.current_container or self.current_content_index == -1:
-            self.current_container = value
-            self.current_content_index = 0
+        self.function_start_in_output_stream = 0
 
     def copy(self) -> "Element":
-        copy = Element(self.element_type, self.current_container, self.current_content_index, self.in_expression_evaluation)
+        copy = Element(self.element_type, self.current_pointer, self.in_expression_evaluation)
         copy.temporary_variables = self.temporary_variables.copy()
         copy.evaluation_stack_height_when_pushed = self.evaluation_stack_height_when_pushed
+        copy.function_start_in_output_stream = self.function_start_in_output_stream
         return copy
 
 
 class Thread:
     def __init__(self, j_thread_obj=None, story_context=None):
         self.callstack = []
-        self.previous_content_object = None
-        if not all((j_thread_obj, story_context)):
-            self.thread_index = None
-            self.j_thread_callstack = None
+        self.thread_index = 0
+        self.previous_pointer = Pointer.Null
+        if j_thread_obj is None:
             return
-        self.thread_index = j_thread_obj["thread_index"]
-        self.j_thread_callstack = j_thread_obj["callstack"]
-        for j_element_obj in self.j_thread_callstack:
-            push_pop_type = j_element_obj["type"]  # TODO: convert to PushPopType Enum
-            current_container = None
-            content_index = 0
-            current_container_path_str_token = j_element_obj.get("c_path")
-            if current_container_path_str_token:
-                current_container_path_str = str(current_container_path_str_token)
-                current_container = story_context.content_at_path(Path(current_container_path_str))
-                content_index = j_element_obj["idx"]
-            in_expression_evaluation = j_element_obj["exp"]
-            el = Element(push_pop_type, current_container, content_index, in_expression_evaluation)
-            j_obj_temps = j_element_obj["temp"]
-            el.temporary_variables = j_obj_temps
+
+        json = late_import_from(".json_serialisation", "Json")
+        self.thread_index = j_thread_obj["threadIndex"]
+        for j_element_obj in j_thread_obj["callstack"]:
+            push_pop_type = PushPopType(j_element_obj["type"])
+            pointer = Pointer.Null
+            current_container_path_str = j_element_obj.get("cPath")
+            if current_container_path_str is not None:
+                thread_pointer_result = story_context.content_at_path(Path(current_container_path_str))
+                pointer = Pointer(thread_pointer_result.container, j_element_obj["idx"])
+                if thread_pointer_result.obj is None:
+                    raise StoryException(f"When loading state, internal story location couldn't be found: {current_container_path_str}. "
+                                         "Has the story changed since this save data was created?")
+                elif thread_pointer_result.approximate:
+                    story_context.warning(f"When loading state, exact internal story location couldn't be found: '{current_container_path_str}', so "
+                                          f"it was approximated to '{pointer.container.path}' to recover. "
+                                          "Has the story changed since this save data was created?")
+            el = Element(push_pop_type, pointer, j_element_obj["exp"])
+            el.temporary_variables = json.j_object_to_dictionary_runtime_objs(j_element_obj["temp"])
             self.callstack.append(el)
 
-        prev_content_obj_path = j_thread_obj.get("previous_content_object")
-        if prev_content_obj_path:
-            prev_path = Path(prev_content_obj_path)
-            self.previous_content_object = story_context.content_at_path(prev_path)
+        prev_content_obj_path = j_thread_obj.get("previousContentObject")
+        if prev_content_obj_path is not None:
+            self.previous_pointer = story_context.pointer_at_path(Path(prev_content_obj_path))
 
     def copy(self):
         copy = Thread()
         copy.thread_index = self.thread_index
         for e in self.callstack:
             copy.callstack.append(e.copy())
-        copy.previous_content_object = self.previous_content_object
+        copy.previous_pointer = self.previous_pointer
         return copy
 
     @property
     def json_token(self):
-        thread_j_obj = {}
+        json = late_import_from(".json_serialisation", "Json")
         j_thread_callstack = []
         for el in self.callstack:
             j_obj = {}
-            if el.current_container:
-                j_obj["c_path"] = el.current_container.path.components_string
-                j_obj["idx"] = el.current_content_index
+            if not el.current_pointer.is_null:
+                j_obj["cPath"] = el.current_pointer.container.path.components_string
+                j_obj["idx"] = el.current_pointer.index
             j_obj["exp"] = el.in_expression_evaluation
-            j_obj["type"] = el.element_type
-            j_obj["temp"] = el.temporary_variables
+            j_obj["type"] = int(el.element_type)
+            j_obj["temp"] = json.dictionary_runtime_objs_to_j_object(el.temporary_variables)
             j_thread_callstack.append(j_obj)
-        thread_j_obj["callstack"] = j_thread_callstack
-        thread_j_obj["thread_index"] = self.thread_index
-        if self.previous_content_object:
-            thread_j_obj["previous_content_object"] = str(self.previous_content_object.path)
+
+        thread_j_obj = {"callstack": j_thread_callstack, "threadIndex": self.thread_index}
+        if not self.previous_pointer.is_null:
+            thread_j_obj["previousContentObject"] = str(self.previous_pointer.resolve().path)
         return thread_j_obj
 
 
@@ -102,9 +89,10 @@ class CallStack:
         if isinstance(root_content_container, CallStack):
             for other_thread in root_content_container._threads:
                 self._threads.append(other_thread.copy())
+            self._thread_counter = root_content_container._thread_counter
         else:
             self._threads.append(Thread())
-            self._threads[0].call_stack.append(Element(PushPopType.Tunnel, root_content_container, 0))
+            self._threads[0].callstack.append(Element(PushPopType.Tunnel, Pointer.start_of(root_content_container)))
 
     @property
     def elements(self):
@@ -128,6 +116,7 @@ class CallStack:
 
     @current_thread.setter
     def current_thread(self, value):
+        assert len(self._threads) == 1, "Shouldn't be directly setting the current thread when we have a stack of them"
         self._threads.clear()
         self._threads.append(value)
 
@@ -145,7 +134,7 @@ class CallStack:
 
     @property
     def can_pop_thread(self):
-        return len(self.call_stack) > 1 and not self.element_is_evaluate_from_game
+        return len(self._threads) > 1 and not self.element_is_evaluate_from_game
 
     @property
     def call_stack_trace(self):
@@ -160,33 +149,24 @@ class CallStack:
                 else:
                     sb += "  [TUNNEL] "
 
-                obj = item.current_object
-                if not obj:
-                    if item.current_container:
-                        sb += "<SOMEWHERE IN {0}>\n".format(item.current_container.path)
-                    else:
-                        sb += "<UNKNOWN STACK ELEMENT>\n"
+                pointer = item.current_pointer
+                if not pointer.is_null:
+                    sb += "<SOMEWHERE IN {0}>\n".format(pointer.container.path)
                 else:
-                    sb += "{0}\n".format(obj.path)
+                    sb += "<UNKNOWN STACK ELEMENT>\n"
         return sb
 
     def set_json_token(self, j_object, story_context):
         self._threads.clear()
-        j_threads = j_object["threads"]
-        for j_thread_obj in j_threads:
-            thread = Thread(j_thread_obj, story_context)
-            self._threads.append(thread)
-        self._thread_counter = j_object["thread_counter"]
+        for j_thread_obj in j_object["threads"]:
+            self._threads.append(Thread(j_thread_obj, story_context))
+        self._thread_counter = j_object["threadCounter"]
 
     def get_json_token(self):
-        j_object = {}
-        j_threads = []
-        for thread in self._threads:
-            j_threads.append(thread.json_token)
-
-        j_object["threads"] = j_threads
-        j_object["thread_counter"] = self._thread_counter
-        return j_object
+        return {
+            "threads": [thread.json_token for thread in self._threads],
+            "threadCounter": self._thread_counter
+        }
 
     def push_thread(self):
         new_thread = self.current_thread.copy()
@@ -200,9 +180,11 @@ class CallStack:
         else:
             raise IndexError("Can't pop thread")
 
-    def push(self, _type, external_evaluation_stack_height=0):
-        element = Element(_type, self.current_element.current_container, self.current_element.current_content_index, in_expression_evaluation=False)
+    def push(self, _type, external_evaluation_stack_height=0, output_stream_length_with_pushed=0):
+        # keep the current position but jump out of expressions
+        element = Element(_type, self.current_element.current_pointer, in_expression_evaluation=False)
         element.evaluation_stack_height_when_pushed = external_evaluation_stack_height
+        element.function_start_in_output_stream = output_stream_length_with_pushed
         self.call_stack.append(element)
 
     def can_pop_type(self, _type=None):
@@ -237,8 +219,9 @@ class CallStack:
             raise StoryException("Could not find temporary variable to set: " + name)
 
         old_value = context_element.temporary_variables.get(name)
-        if old_value:
-            pass  # TODO: https://github.com/inkle/ink/blob/master/ink-engine-runtime/CallStack.cs#L345
+        if old_value is not None:
+            list_value = late_import_from(".value", "ListValue")
+            list_value.retain_list_origins_for_assignment(old_value, value)
         context_element.temporary_variables[name] = value
 
     def context_for_variable_named(self, name):
@@ -248,4 +231,4 @@ class CallStack:
             return 0
 
     def thread_with_index(self, index):
-        return next(thread for thread in self._threads if thread.thread_index == index)
+        return next((thread for thread in self._threads if thread.thread_index == index), None)
@@ -1,9 +1,9 @@
 from typing import TYPE_CHECKING
 
 from .object import Object
+from .path import Path
 
 if TYPE_CHECKING:
-    from .path import Path
     from .container import Container
 
 
@@ -41,7 +41,7 @@ class ChoicePoint(Object):
 
     @property
     def choice_target(self) -> "Container":
-        return self.resolve_path(self._path_on_choice)
+        return self.resolve_path(self._path_on_choice).container
 
     @property
     def path_string_on_choice(self) -> str:
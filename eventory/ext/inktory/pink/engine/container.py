@@ -1,10 +1,13 @@
 from enum import IntFlag
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING, Union
 
 from .named_content import NamedContent
 from .object import Object
 from .path import Component, Path
 
+if TYPE_CHECKING:
+    from .search_result import SearchResult
+
 
 class CountFlags(IntFlag):
     Visits = 1
@@ -16,6 +19,8 @@ class Container(Object, NamedContent):
     _content: List[Object]
     _path_to_first_leaf_content: "Path"
     named_content: Dict[str, NamedContent]
+    # named containers which haven't been turned into runtime objects yet (see Json.j_array_to_container)
+    unloaded_named_content: Optional[Dict[str, List[Any]]]
 
     def __init__(self):
         super().__init__()
@@ -23,6 +28,7 @@ class Container(Object, NamedContent):
         self._path_to_first_leaf_content = None
         self.name = ""
         self.named_content = {}
+        self.unloaded_named_content = None
         self.visits_should_be_counted = False
         self.turn_index_should_be_counted = False
         self.counting_at_start_only = False
@@ -37,14 +43,10 @@ class Container(Object, NamedContent):
 
     @property
     def named_only_content(self) -> Dict[str, Object]:
-        named_only_content_dict = {}
-        for key, value in self.named_content.values():
-            named_only_content_dict[key] = value
-
-        c: NamedContent
+        named_only_content_dict = dict(self.named_content)
         for c in self.content:
-            if c and c.has_valid_name:
-                named_only_content_dict.pop(c.name)
+            if isinstance(c, NamedContent) and c.has_valid_name:
+                named_only_content_dict.pop(c.name, None)
 
         if not named_only_content_dict:
             named_only_content_dict = None
@@ -58,8 +60,8 @@ class Container(Object, NamedContent):
                 self.named_content.pop(key)
         if not value:
             return
-        for key, val in value:
-            if val:
+        for key, val in value.items():
+            if isinstance(val, NamedContent):
                 self.add_to_named_content_only(val)
 
     @property
@@ -79,11 +81,11 @@ class Container(Object, NamedContent):
     @count_flags.setter
     def count_flags(self, value: int):
         flag = CountFlags(value)
-        if flag & CountFlags.Visits > 0:
+        if flag & CountFlags.Visits:
             self.visits_should_be_counted = True
-        if flag & CountFlags.Turns > 0:
+        if flag & CountFlags.Turns:
             self.turn_index_should_be_counted = True
-        if flag & CountFlags.CountStartOnly > 0:
+        if flag & CountFlags.CountStartOnly:
             self.counting_at_start_only = True
 
     @property
@@ -100,16 +102,16 @@ class Container(Object, NamedContent):
     def internal_path_to_first_leaf_content(self) -> "Path":
         components = []
         container = self
-        while container:
-            if len(container.content) > 0:
-                components.append(Component(0))
-                container = container.content[0]
+        while isinstance(container, Container) and len(container.content) > 0:
+            components.append(Component(0))
+            container = container.content[0]
         return Path(components)
 
     def add_content(self, content_obj: Union[Object, Iterable[Object]]):
-        if isinstance(content_obj, Iterable):
+        if not isinstance(content_obj, Object):
             for content in content_obj:
                 self.add_content(content)
+            return
         self.content.append(content_obj)
         if content_obj.parent:
             raise ValueError("Content is already in " + str(content_obj.parent))
@@ -138,34 +140,49 @@ class Container(Object, NamedContent):
             obj.parent = self
             self.try_add_named_content(obj)
 
+    def named_content_with_name(self, name: str) -> Optional[NamedContent]:
+        named = self.named_content.get(name)
+        if named is None and self.unloaded_named_content and name in self.unloaded_named_content:
+            from .json_serialisation import Json
+
+            named = Json.j_array_to_container(self.unloaded_named_content.pop(name), lazy=True)
+            named.name = name
+            self.add_to_named_content_only(named)
+        return named
+
     def content_with_path_component(self, component: Component) -> Optional[Object]:
         if component.is_index:
-            if 0 < component.index < len(self.content):
+            if 0 <= component.index < len(self.content):
                 return self.content[component.index]
             else:
                 return None
         elif component.is_parent:
             return self.parent
         else:
-            found_content: Object = self.named_content.get(component.name)
-            if found_content:
-                return found_content
-            else:
-                raise StoryException("Content \"" + component.name + "\" not found at path: \"" + self.path + "\"")
+            return self.named_content_with_name(component.name)
+
+    def content_at_path(self, path: Path, partial_path_start: int = 0, partial_path_length: int = -1) -> "SearchResult":
+        from .search_result import SearchResult
 
-    def content_at_path(self, path: Path, partial_path_length: int = -1) -> Object:
         if partial_path_length == -1:
             partial_path_length = path.length
 
+        result = SearchResult(approximate=False)
         current_container = self
         current_obj = self
-        for i in range(partial_path_length):
+        for i in range(partial_path_start, partial_path_length):
             comp = path.get_component(i)
-            if not current_container:
-                raise Exception("Path continued, but previous object wasn't a container: " + str(current_obj))
-            current_obj = current_container.content_with_path_component(comp)
-            current_container = current_obj
-        return current_obj
+            if current_container is None:
+                result.approximate = True
+                break
+            found_obj = current_container.content_with_path_component(comp)
+            if found_obj is None:
+                result.approximate = True
+                break
+            current_obj = found_obj
+            current_container = found_obj if isinstance(found_obj, Container) else None
+        result.obj = current_obj
+        return result
 
     def build_string_of_hierarchy(self, indentation: int = 0, pointed_obj: Object = None) -> str:
         sb = ""
@@ -185,7 +202,7 @@ class Container(Object, NamedContent):
         indentation += 1
         for i, obj in enumerate(self.content):
             if isinstance(obj, Container):
-                sb = obj.build_string_of_hierarchy(indentation, pointed_obj)
+                sb += obj.build_string_of_hierarchy(indentation, pointed_obj)
             else:
                 append_indentation()
                 if isinstance(obj, str):
@@ -210,7 +227,7 @@ class Container(Object, NamedContent):
             sb += "-- named: --\n"
             for key, value in only_named.items():
                 assert isinstance(value, Container), "Can only print out named Containers"
-                sb = value.build_string_of_hierarchy(indentation, pointed_obj)
+                sb += value.build_string_of_hierarchy(indentation, pointed_obj)
                 sb += "\n"
         indentation -= 1
         append_indentation()
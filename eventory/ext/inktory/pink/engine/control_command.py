@@ -4,38 +4,37 @@ from .object import Object
 
 
 class CommandType(IntEnum):
-    NotSet = -1,
-    EvalStart = auto
-    EvalOutput = auto
-    EvalEnd = auto
-    Duplicate = auto
-    PopEvaluatedValue = auto
-    PopFunction = auto
-    PopTunnel = auto
-    BeginString = auto
-    EndString = auto
-    NoOp = auto
-    ChoiceCount = auto
-    TurnsSince = auto
-    ReadCount = auto
-    Random = auto
-    SeedRandom = auto
-    VisitIndex = auto
-    SequenceShuffleIndex = auto
-    StartThread = auto
-    Done = auto
-    End = auto
-    ListFromInt = auto
-    ListRange = auto
-    TOTAL_VALUES = auto
+    NotSet = -1
+    EvalStart = auto()
+    EvalOutput = auto()
+    EvalEnd = auto()
+    Duplicate = auto()
+    PopEvaluatedValue = auto()
+    PopFunction = auto()
+    PopTunnel = auto()
+    BeginString = auto()
+    EndString = auto()
+    NoOp = auto()
+    ChoiceCount = auto()
+    TurnsSince = auto()
+    ReadCount = auto()
+    Random = auto()
+    SeedRandom = auto()
+    VisitIndex = auto()
+    SequenceShuffleIndex = auto()
+    StartThread = auto()
+    Done = auto()
+    End = auto()
+    ListFromInt = auto()
+    ListRange = auto()
+    TOTAL_VALUES = auto()
 
 
 class ControlCommandMeta(type):
     def __getattr__(self, item):
-        if isinstance(item, str):
-            if item in CommandType:
-                return ControlCommand(CommandType[item])
-        raise AttributeError
+        if item in CommandType.__members__:
+            return ControlCommand(CommandType[item])
+        raise AttributeError(item)
 
 
 class ControlCommand(Object, metaclass=ControlCommandMeta):
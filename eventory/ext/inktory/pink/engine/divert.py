@@ -2,6 +2,7 @@ from typing import Optional
 
 from .object import Object
 from .path import Path
+from .pointer import Pointer
 from .push_pop import PushPopType
 
 
@@ -18,9 +19,9 @@ class Divert(Object):
     def __init__(self, stack_push_type: PushPopType = None):
         super().__init__()
         self._target_path = None
-        self._target_content = None
+        self._target_pointer = Pointer.Null
         self.variable_divert_name = ""
-        self.pushes_to_stack = True if stack_push_type else False
+        self.pushes_to_stack = stack_push_type is not None
         self.stack_push_type = stack_push_type
         self.is_external = False
         self.external_args = 0
@@ -67,7 +68,7 @@ class Divert(Object):
     @property
     def target_path(self) -> "Path":
         if self._target_path and self._target_path.is_relative:
-            target_obj = self.target_content
+            target_obj = self.target_pointer.resolve()
             if target_obj:
                 self._target_path = target_obj.path
         return self._target_path
@@ -75,13 +76,17 @@ class Divert(Object):
     @target_path.setter
     def target_path(self, value: "Path"):
         self._target_path = value
-        self._target_content = None
+        self._target_pointer = Pointer.Null
 
     @property
-    def target_content(self) -> Object:
-        if not self._target_content:
-            self._target_content = self.resolve_path(self._target_path)
-        return self._target_content
+    def target_pointer(self) -> Pointer:
+        if self._target_pointer.is_null:
+            target_obj = self.resolve_path(self._target_path).obj
+            if self._target_path.last_component.is_index:
+                self._target_pointer = Pointer(target_obj.parent, self._target_path.last_component.index)
+            else:
+                self._target_pointer = Pointer.start_of(target_obj)
+        return self._target_pointer
 
     @property
     def target_path_string(self) -> Optional[str]:
@@ -16,8 +16,8 @@ class InkListItem:
         if len(args) == 2:
             self.origin_name, self.item_name = args
         elif len(args) == 1:
-            name_parts = args[0].split(".")
-            self.origin_name, self.item_name = name_parts
+            origin_name, _, item_name = args[0].rpartition(".")
+            self.origin_name, self.item_name = origin_name or None, item_name
         else:
             raise ValueError
 
@@ -42,11 +42,11 @@ class InkListItem:
 
     @property
     def is_null(self) -> bool:
-        return self.item_name is self.origin_name is None
+        return self.item_name is None and self.origin_name is None
 
     @property
     def full_name(self) -> str:
-        return self.origin_name or "?" + "." + self.item_name
+        return (self.origin_name or "?") + "." + self.item_name
 
 
 class InkList(UserDict):
@@ -59,29 +59,22 @@ class InkList(UserDict):
         self.origins = []
         self.data = {}
         if isinstance(pri, InkList):
-            self.data = pri.data
-            self._origin_names = pri.origin_names
+            self.data = pri.data.copy()
+            self._origin_names = list(pri.origin_names)
+            self.origins = list(pri.origins)
         elif isinstance(pri, str):
             self.set_initial_origin_name(pri)
-            list_def = sec.list_definitions.get(pri)
+            list_def = sec.list_definitions.try_list_get_definition(pri)
             if list_def:
                 self.origins = [list_def]
             else:
                 raise ValueError("InkList origin could not be found in story when constructing new list: " + str(pri))
-        else:
+        elif pri is not None:
             key, value = pri
             self[key] = value
 
     def __str__(self) -> str:
-        ordered = self.data.items()
-        ordered = sorted(ordered, key=lambda x, y: x)
-
-        sb = ""
-        for i, (key, value) in enumerate(ordered):
-            if i > 0:
-                sb += ", "
-            sb += key.item_name
-        return sb
+        return ", ".join(key.item_name for key, value in self.ordered_items)
 
     def __hash__(self) -> int:
         return sum(map(hash, self.data))
@@ -97,6 +90,10 @@ class InkList(UserDict):
 
         return False
 
+    @property
+    def ordered_items(self) -> List[Tuple[InkListItem, int]]:
+        return sorted(self.items(), key=lambda item: (item[1], item[0].origin_name or ""))
+
     @property
     def origin_of_max_item(self) -> Optional["ListDefinition"]:
         if not self.origins:
@@ -110,29 +107,31 @@ class InkList(UserDict):
     @property
     def origin_names(self) -> List[str]:
         if len(self) > 0:
-            if not self._origin_names:
-                self._origin_names = []
-            else:
-                self._origin_names.clear()
-
-            for key, value in self.items():
-                self._origin_names.append(key.origin_name)
+            self._origin_names = [key.origin_name for key in self]
         return self._origin_names
 
     @property
     def max_item(self) -> Tuple[InkListItem, int]:
-        return max(self.items(), key=lambda key, value: value)
+        max_item = (InkListItem.Null, 0)
+        for key, value in self.items():
+            if max_item[0].is_null or value > max_item[1]:
+                max_item = (key, value)
+        return max_item
 
     @property
     def min_item(self) -> Tuple[InkListItem, int]:
-        return min(self.items(), key=lambda key, value: value)
+        min_item = (InkListItem.Null, 0)
+        for key, value in self.items():
+            if min_item[0].is_null or value < min_item[1]:
+                min_item = (key, value)
+        return min_item
 
     @property
     def inverse(self) -> "InkList":
         ink_list = InkList()
         if self.origins:
             for origin in self.origins:
-                for key, value in origin.items():
+                for key, value in origin.items.items():
                     if key not in self:
                         ink_list[key] = value
         return ink_list
@@ -142,7 +141,7 @@ class InkList(UserDict):
         ink_list = InkList()
         if self.origins:
             for origin in self.origins:
-                for key, value in origin.items():
+                for key, value in origin.items.items():
                     ink_list[key] = value
         return ink_list
 
@@ -153,22 +152,29 @@ class InkList(UserDict):
                 return
             for origin in self.origins:
                 if origin.name == item.origin_name:
-                    int_val = origin.get(item)
-                    if int_val:
+                    int_val = origin.try_get_value_for_item(item)
+                    if int_val is not None:
                         self[item] = int_val
                         return
                     else:
                         raise ValueError(
                             f"Could not add the item {item} to this list because it doesn't exist in the original list definition in ink.")
+            raise ValueError("Failed to add item to list because the item was from a new list definition that wasn't previously known to this list. "
+                             "Only items from previously known lists can be used, so that the int value can be found.")
         else:
             found_list_def = None
             for origin in self.origins:
                 if origin.contains_item_with_name(item):
                     if found_list_def:
                         raise ValueError(
-                            "fCould not add the item {item} to this list because it could come from either " + origin.name + " or " + found_list_def.name)
+                            f"Could not add the item {item} to this list because it could come from either {origin.name} or {found_list_def.name}")
                     else:
                         found_list_def = origin
+            if not found_list_def:
+                raise ValueError(f"Could not add the item {item} to this list because it isn't known to any list definitions previously associated "
+                                 "with this list.")
+            list_item = InkListItem(found_list_def.name, item)
+            self[list_item] = found_list_def.value_for_item(list_item)
 
     def contains_item_named(self, item_name: str) -> bool:
         for key, value in self.items():
@@ -198,7 +204,7 @@ class InkList(UserDict):
     def without(self, list_to_remove: "InkList") -> "InkList":
         result = InkList(self)
         for key, value in list_to_remove.items():
-            result.pop(key)
+            result.pop(key, None)
         return result
 
     def contains(self, other: "InkList") -> bool:
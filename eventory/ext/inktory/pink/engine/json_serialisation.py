@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .choice import Choice
 from .choice_point import ChoicePoint
@@ -22,6 +23,15 @@ from .void import Void
 
 class Json:
     _control_command_names: List[str] = [None] * CommandType.TOTAL_VALUES
+    _string_tokens: Dict[str, Callable[[], Object]]
+    _dict_tokens: Dict[str, Callable[[Dict[str, Any], str], Object]]
+    # (pushes_to_stack, stack_push_type, is_external) of the divert keys
+    _divert_types: Dict[str, Tuple[bool, PushPopType, bool]] = {
+        "->": (False, PushPopType.Function, False),
+        "f()": (True, PushPopType.Function, False),
+        "->t->": (True, PushPopType.Tunnel, False),
+        "x()": (False, PushPopType.Function, True)
+    }
 
     @staticmethod
     def list_to_jarray(serialisables: List[Object]) -> List[Any]:
@@ -68,133 +78,135 @@ class Json:
     def int_dictionary_to_j_object(dictionary: Dict[str, int]) -> Dict[str, Any]:
         """This function is utterly pointless in Python but eh"""
         j_obj = {}
-        for key, value in dictionary:
+        for key, value in dictionary.items():
             j_obj[key] = value
         return j_obj
 
     @staticmethod
     def j_token_to_runtime_object(token: Any) -> Optional[Object]:
-        if isinstance(token, (int, float)):
-            return Value.create(token)
-        if isinstance(token, str):
-            string = token
-            first_char = string[0]
-            if first_char == "^":
-                return StringValue(string[1:])
-            elif first_char == "\n" and len(string) == 1:
-                return StringValue("\n")
-            if str == "<>":
-                return Glue()
-            for i in range(len(Json._control_command_names)):
-                cmd_name = Json._control_command_names[i]
-                if string == cmd_name:
-                    return ControlCommand(CommandType(i))
-            if string == "L^":
-                string = "^"
-            if NativeFunctionCall.CallExistsWithName(string):
-                return NativeFunctionCall.CallWithName(string)
-            if string == "->->":
-                return ControlCommand.PopTunnel
-            elif string == "~ret":
-                return ControlCommand.PopFunction
-            if string == "void":
-                return Void()
-        if isinstance(token, dict):
-            obj = token
-            prop_value = obj.get("^->")
-            if prop_value:
-                return DivertTargetValue(Path(prop_value))
-            prop_value = obj.get("^var")
-            if prop_value:
-                var_ptr = VariablePointerValue(prop_value)
-                prop_value = obj.get("ci")
-                if prop_value:
-                    var_ptr.context_index = int(prop_value)
-                return var_ptr
-
-            is_divert = False
-            pushes_to_stack = False
-            div_push_type = PushPopType.Function
-            external = False
-            if "f()" in obj:
-                prop_value = obj["f()"]
-                is_divert = True
-                pushes_to_stack = True
-                div_push_type = PushPopType.Function
-            elif "->t->" in obj:
-                prop_value = obj["->t->"]
-                is_divert = True
-                pushes_to_stack = True
-                div_push_type = PushPopType.Tunnel
-            elif "x()" in obj:
-                prop_value = obj["x()"]
-                is_divert = True
-                external = True
-                pushes_to_stack = False
-                div_push_type = PushPopType.Function
-            if is_divert:
-                divert = Divert()
-                divert.pushes_to_stack = pushes_to_stack
-                divert.stack_push_type = div_push_type
-                divert.is_external = external
-                target = str(prop_value)
-                if "var" in obj:
-                    divert.variable_divert_name = target
-                else:
-                    divert.target_path_string = target
-                divert.is_conditional = "c" in obj
-                if external:
-                    if "exArgs" in obj:
-                        divert.external_args = int(obj["exArgs"])
-                return divert
-            if "*" in obj:
-                choice = ChoicePoint()
-                choice.path_string_on_choice = str(obj["*"])
-                if "flg" in obj:
-                    choice.flags = int(obj["flg"])
-                return choice
-            if "VAR?" in obj:
-                return VariableReference(str(obj["VAR?"]))
-            elif "CNT?" in obj:
-                read_count_var_ref = VariableReference()
-                read_count_var_ref.path_string_for_count = str(obj["CNT?"])
-                return read_count_var_ref
-
-            is_var_ass = False
-            is_global_var = False
-            if "VAR=" in obj:
-                prop_value = obj["VAR="]
-                is_var_ass = True
-                is_global_var = True
-            elif "temp=" in obj:
-                prop_value = obj["temp="]
-                is_var_ass = True
-                is_global_var = False
-            if is_var_ass:
-                var_name = str(prop_value)
-                is_new_decl = "re" not in obj
-                var_ass = VariableAssignment(var_name, is_new_decl)
-                var_ass.is_global = is_global_var
-                return var_ass
-            if "#" in obj:
-                return Tag(str(obj["#"]))
-            if "list" in obj:
-                list_content = obj["list"]
-                raw_list = InkList()
-                if "origins" in obj:
-                    raw_list.set_initial_origin_names(obj["origins"])
-                for key, value in list_content.items():
-                    item = InkListItem(key)
-                    raw_list[item] = value
-                return ListValue(raw_list)
-            if obj["originalChoicePath"]:
-                return Json.j_object_to_choice(obj)
-        if isinstance(token, list):
+        token_type = type(token)
+        if token_type is str:
+            if token[0] == "^":
+                return StringValue(token[1:])
+            factory = Json._string_tokens.get(token)
+            if factory:
+                return factory()
+        elif token_type is dict:
+            # the first key which is in the table determines the type, the others are its properties
+            for key in token:
+                handler = Json._dict_tokens.get(key)
+                if handler:
+                    return handler(token, key)
+        elif token_type is list:
             return Json.j_array_to_container(token)
-        if token is None:
+        elif token is None:
             return None
+        elif isinstance(token, (int, float)):
+            return Value.create(token)
         raise Exception(f"Failed to convert token to runtime object: {token}")
 
+    @staticmethod
+    def j_object_to_divert_target(obj: Dict[str, Any], key: str) -> DivertTargetValue:
+        return DivertTargetValue(Path(obj[key]))
+
+    @staticmethod
+    def j_object_to_variable_pointer(obj: Dict[str, Any], key: str) -> VariablePointerValue:
+        var_ptr = VariablePointerValue(obj[key])
+        if "ci" in obj:
+            var_ptr.context_index = int(obj["ci"])
+        return var_ptr
+
+    @staticmethod
+    def j_object_to_divert(obj: Dict[str, Any], key: str) -> Divert:
+        pushes_to_stack, div_push_type, external = Json._divert_types[key]
+        divert = Divert()
+        divert.pushes_to_stack = pushes_to_stack
+        divert.stack_push_type = div_push_type
+        divert.is_external = external
+        target = str(obj[key])
+        if "var" in obj:
+            divert.variable_divert_name = target
+        else:
+            divert.target_path_string = target
+        divert.is_conditional = "c" in obj
+        if external:
+            if "exArgs" in obj:
+                divert.external_args = int(obj["exArgs"])
+        return divert
+
+    @staticmethod
+    def j_object_to_choice_point(obj: Dict[str, Any], key: str) -> ChoicePoint:
+        choice = ChoicePoint()
+        choice.path_string_on_choice = str(obj[key])
+        if "flg" in obj:
+            choice.flags = int(obj["flg"])
+        return choice
+
+    @staticmethod
+    def j_object_to_variable_reference(obj: Dict[str, Any], key: str) -> VariableReference:
+        return VariableReference(str(obj[key]))
+
+    @staticmethod
+    def j_object_to_read_count(obj: Dict[str, Any], key: str) -> VariableReference:
+        read_count_var_ref = VariableReference()
+        read_count_var_ref.path_string_for_count = str(obj[key])
+        return read_count_var_ref
+
+    @staticmethod
+    def j_object_to_variable_assignment(obj: Dict[str, Any], key: str) -> VariableAssignment:
+        var_name = str(obj[key])
+        is_new_decl = "re" not in obj
+        var_ass = VariableAssignment(var_name, is_new_decl)
+        var_ass.is_global = key == "VAR="
+        return var_ass
+
+    @staticmethod
+    def j_object_to_tag(obj: Dict[str, Any], key: str) -> Tag:
+        return Tag(str(obj[key]))
+
+    @staticmethod
+    def j_object_to_list(obj: Dict[str, Any], key: str) -> ListValue:
+        list_content = obj[key]
+        raw_list = InkList()
+        if "origins" in obj:
+            raw_list.set_initial_origin_names(obj["origins"])
+        for name, value in list_content.items():
+            item = InkListItem(name)
+            raw_list[item] = value
+        return ListValue(raw_list)
+
+    @staticmethod
+    def build_token_tables():
+        string_tokens = {
+            "\n": partial(StringValue, "\n"),
+            "<>": Glue,
+            "void": Void
+        }
+        for i, name in enumerate(Json._control_command_names):
+            string_tokens[name] = partial(ControlCommand, CommandType(i))
+        NativeFunctionCall.generate_native_functions_if_necessary()
+        for name in NativeFunctionCall._native_functions:
+            # "^" alone would be an empty string
+            string_tokens["L^" if name == "^" else name] = partial(NativeFunctionCall.call_with_name, name)
+        Json._string_tokens = string_tokens
+
+        Json._dict_tokens = {
+            "^->": Json.j_object_to_divert_target,
+            "^var": Json.j_object_to_variable_pointer,
+            "->": Json.j_object_to_divert,
+            "f()": Json.j_object_to_divert,
+            "->t->": Json.j_object_to_divert,
+            "x()": Json.j_object_to_divert,
+            "*": Json.j_object_to_choice_point,
+            "VAR?": Json.j_object_to_variable_reference,
+            "CNT?": Json.j_object_to_read_count,
+            "VAR=": Json.j_object_to_variable_assignment,
+            "temp=": Json.j_object_to_variable_assignment,
+            "#": Json.j_object_to_tag,
+            "list": Json.j_object_to_list,
+            "originalChoicePath": lambda obj, key: Json.j_object_to_choice(obj)
+        }
+
     @staticmethod
     def runtime_object_to_j_token(obj: Object) -> Any:
         if isinstance(obj, Container):
@@ -286,7 +298,7 @@ class Json:
         j_array = Json.list_to_jarray(container.content)
         named_only_content = container.named_only_content
         count_flags = container.count_flags
-        if named_only_content and len(named_only_content) > 0 or count_flags > 0 or container.name:
+        if named_only_content and len(named_only_content) > 0 or container.unloaded_named_content or count_flags > 0 or container.name:
             if named_only_content:
                 terminating_obj = Json.dictionary_runtime_objs_to_j_object(named_only_content)
 
@@ -294,11 +306,13 @@ class Json:
                     if isinstance(value, list):
                         attr_j_obj = value[-1]
                         if isinstance(attr_j_obj, dict):
-                            attr_j_obj.pop("#n")
+                            attr_j_obj.pop("#n", None)
                             if len(attr_j_obj) == 0:
                                 value[-1] = None
             else:
                 terminating_obj = {}
+            if container.unloaded_named_content:
+                terminating_obj.update(container.unloaded_named_content)
             if count_flags > 0:
                 terminating_obj["#f"] = count_flags
             if container.name:
@@ -309,18 +323,27 @@ class Json:
         return j_array
 
     @staticmethod
-    def j_array_to_container(j_array: List[Any]) -> Container:
+    def j_array_to_container(j_array: List[Any], lazy: bool = False) -> Container:
         container = Container()
-        container.content = Json.j_array_to_runtime_obj_list(j_array, skip_last=True)
+        # lazy containers keep their named containers as JSON until Container.named_content_with_name first needs them
+        if lazy:
+            container.content = [Json.j_array_to_container(j_tok, lazy=True) if type(j_tok) is list else Json.j_token_to_runtime_object(j_tok)
+                                 for j_tok in j_array[:-1]]
+        else:
+            container.content = Json.j_array_to_runtime_obj_list(j_array, skip_last=True)
 
         terminating_obj = j_array[-1]
         if isinstance(terminating_obj, dict):
             named_only_content = {}
-            for key, value in terminating_obj:
+            for key, value in terminating_obj.items():
                 if key == "#f":
                     container.count_flags = int(value)
                 elif key == "#n":
                     container.name = str(value)
+                elif lazy and type(value) is list:
+                    if container.unloaded_named_content is None:
+                        container.unloaded_named_content = {}
+                    container.unloaded_named_content[key] = value
                 else:
                     named_content_item = Json.j_token_to_runtime_object(value)
                     if isinstance(named_content_item, Container):
@@ -334,9 +357,9 @@ class Json:
         choice = Choice()
         choice.text = str(j_obj["text"])
         choice.index = int(j_obj["index"])
-        choice.source_path = str(j_obj["original_choice_path"])
-        choice.original_thread_index = int(j_obj["original_thread_index"])
-        choice.path_string_on_choice = str(j_obj["target_path"])
+        choice.source_path = str(j_obj["originalChoicePath"])
+        choice.original_thread_index = int(j_obj["originalThreadIndex"])
+        choice.path_string_on_choice = str(j_obj["targetPath"])
         return choice
 
     @staticmethod
@@ -344,9 +367,9 @@ class Json:
         j_obj = {
             "text": choice.text,
             "index": choice.index,
-            "original_choice_path": choice.source_path,
-            "original_thread_index": choice.original_thread_index,
-            "target_path": choice.path_string_on_choice
+            "originalChoicePath": choice.source_path,
+            "originalThreadIndex": choice.original_thread_index,
+            "targetPath": choice.path_string_on_choice
         }
         return j_obj
 
@@ -407,5 +430,8 @@ class Json:
     _control_command_names[CommandType.ListRange] = "range"
 
     for i in range(CommandType.TOTAL_VALUES):
-        if not _control_command_names:
+        if not _control_command_names[i]:
             raise Exception("Control command not accounted for in serialisation")
+
+
+Json.build_token_tables()
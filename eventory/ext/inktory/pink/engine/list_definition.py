@@ -11,6 +11,7 @@ class ListDefinition:
 
     def __init__(self, name: str, items: Dict[str, int]):
         self._name = name
+        self._items = None
         self._item_name_to_values = items
 
     @property
@@ -19,7 +20,7 @@ class ListDefinition:
 
     @property
     def items(self) -> Dict[InkListItem, int]:
-        if not self._items:
+        if self._items is None:
             self._items = {}
             for key, value in self._item_name_to_values.items():
                 item = InkListItem(self.name, key)
@@ -17,6 +17,7 @@ class ListDefinitionOrigin:
             self._lists[_list.name] = _list
             for key, value in _list.items.items():
                 list_value = ListValue(key, value)
+                list_value.value.origins = [_list]
                 self._all_unambiguous_list_value_cache[key.item_name] = list_value
                 self._all_unambiguous_list_value_cache[key.full_name] = list_value
 
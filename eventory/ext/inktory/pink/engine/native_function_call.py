@@ -1,3 +1,4 @@
+import math
 from typing import Any, Callable, Dict, List
 
 from .ink_list import InkList
@@ -7,6 +8,12 @@ from .value import IntValue, ListValue, Value, ValueType
 from .void import Void
 
 
+def int_divide(x: int, y: int) -> int:
+    # integer division of the ink runtime rounds towards zero
+    quotient = abs(x) // abs(y)
+    return quotient if (x < 0) == (y < 0) else -quotient
+
+
 class NativeFunctionCall(Object):
     Add: str = "+"
     Subtract: str = "-"
@@ -56,12 +63,12 @@ class NativeFunctionCall(Object):
         self._prototype = None
         self._operation_funcs = {}
         if name is not None:
-            self.name = name
             if number_of_parameters is None:
                 self.generate_native_functions_if_necessary()
             else:
                 self._is_prototype = True
                 self.number_of_parameters = number_of_parameters
+            self.name = name
         else:
             self.generate_native_functions_if_necessary()
 
@@ -106,15 +113,15 @@ class NativeFunctionCall(Object):
             cls.add_int_binary_op(cls.Add, lambda x, y: x + y)
             cls.add_int_binary_op(cls.Subtract, lambda x, y: x - y)
             cls.add_int_binary_op(cls.Multiply, lambda x, y: x * y)
-            cls.add_int_binary_op(cls.Divide, lambda x, y: x / y)
-            cls.add_int_binary_op(cls.Mod, lambda x, y: x + y)
+            cls.add_int_binary_op(cls.Divide, lambda x, y: int_divide(x, y))
+            cls.add_int_binary_op(cls.Mod, lambda x, y: x - y * int_divide(x, y))
             cls.add_int_unary_op(cls.Negate, lambda x: -x)
 
             cls.add_int_binary_op(cls.Equal, lambda x, y: int(x == y))
             cls.add_int_binary_op(cls.Greater, lambda x, y: int(x > y))
             cls.add_int_binary_op(cls.Less, lambda x, y: int(x < y))
             cls.add_int_binary_op(cls.GreaterThanOrEquals, lambda x, y: int(x >= y))
-            cls.add_int_binary_op(cls.LessThanOrEquals, lambda x, y: (x <= y))
+            cls.add_int_binary_op(cls.LessThanOrEquals, lambda x, y: int(x <= y))
             cls.add_int_binary_op(cls.NotEquals, lambda x, y: int(x != y))
             cls.add_int_unary_op(cls.Not, lambda x: int(x == 0))
 
@@ -128,7 +135,7 @@ class NativeFunctionCall(Object):
             cls.add_float_binary_op(cls.Subtract, lambda x, y: x - y)
             cls.add_float_binary_op(cls.Multiply, lambda x, y: x * y)
             cls.add_float_binary_op(cls.Divide, lambda x, y: x / y)
-            cls.add_float_binary_op(cls.Mod, lambda x, y: x % y)
+            cls.add_float_binary_op(cls.Mod, lambda x, y: math.fmod(x, y))
             cls.add_float_unary_op(cls.Negate, lambda x: -x)
 
             cls.add_float_binary_op(cls.Equal, lambda x, y: int(x == y))
@@ -149,11 +156,12 @@ class NativeFunctionCall(Object):
             cls.add_string_binary_op(cls.Equal, lambda x, y: int(x == y))
             cls.add_string_binary_op(cls.NotEquals, lambda x, y: int(x != y))
             cls.add_string_binary_op(cls.Has, lambda x, y: int(y in x))
+            cls.add_string_binary_op(cls.Hasnt, lambda x, y: int(y not in x))
 
             cls.add_list_binary_op(cls.Add, lambda x, y: x.union(y))
             cls.add_list_binary_op(cls.Subtract, lambda x, y: x.without(y))
             cls.add_list_binary_op(cls.Has, lambda x, y: int(x.contains(y)))
-            cls.add_list_binary_op(cls.Hasnt, lambda x, y: int(x.contains(y)))
+            cls.add_list_binary_op(cls.Hasnt, lambda x, y: int(not x.contains(y)))
             cls.add_list_binary_op(cls.Intersect, lambda x, y: x.intersect(y))
 
             cls.add_list_binary_op(cls.Equal, lambda x, y: int(x == y))
@@ -176,6 +184,7 @@ class NativeFunctionCall(Object):
             cls.add_list_unary_op(cls.ValueOfList, lambda x: x.max_item[1])
 
             cls.add_op_to_native_func(cls.Equal, 2, ValueType.DivertTarget, lambda d1, d2: int(d1 == d2))
+            cls.add_op_to_native_func(cls.NotEquals, 2, ValueType.DivertTarget, lambda d1, d2: int(d1 != d2))
 
     def call(self, parameters: List[Object]) -> Object:
         if self._prototype:
@@ -232,7 +241,7 @@ class NativeFunctionCall(Object):
             result = int(op(int(v1.is_truthy), int(v2.is_truthy)))
             return IntValue(result)
 
-        if v1.value_type == ValueType.List and v2.valueType == ValueType.List:
+        if v1.value_type == ValueType.List and v2.value_type == ValueType.List:
             return self._call([v1, v2])
 
         raise StoryException(f"Can not call use \"{self.name}\" operation on {v1.value_type} and {v2.value_type}")
@@ -250,9 +259,9 @@ class NativeFunctionCall(Object):
                 if origin.name == key.origin_name:
                     item_origin = origin
                     break
-            if not item_origin:
-                incremented_item = item_origin.get(target_int)
-                if incremented_item:
+            if item_origin:
+                incremented_item = item_origin.try_get_item_with_value(target_int)
+                if not incremented_item.is_null:
                     result_raw_list[incremented_item] = target_int
         return ListValue(result_raw_list)
 
@@ -276,7 +285,7 @@ class NativeFunctionCall(Object):
                     int_val = val.value_object
                     _list = special_case_list.value.origin_of_max_item
                     item = _list.try_get_item_with_value(int_val)
-                    if item:
+                    if not item.is_null:
                         casted_value = ListValue(item, int_val)
                         parameters_out.append(casted_value)
                     else:
@@ -320,7 +329,7 @@ class NativeFunctionCall(Object):
 
     @classmethod
     def add_string_binary_op(cls, name: str, op: Callable[[str, str], Any]):
-        cls.add_op_to_native_func(name, 2, ValueType.Int, op)
+        cls.add_op_to_native_func(name, 2, ValueType.String, op)
 
     @classmethod
     def add_string_unary_op(cls, name: str, op: Callable[[int], Any]):
@@ -1,5 +1,6 @@
 from typing import Optional, TYPE_CHECKING
 
+from .named_content import NamedContent
 from .path import Component, Path
 
 if TYPE_CHECKING:
@@ -55,13 +56,13 @@ class Object:
                 child = self
                 container = child.parent
                 while container:
-                    named_child = child
-                    if named_child and named_child.has_valid_name:
-                        comps.append(Component(named_child.name))
+                    if isinstance(child, NamedContent) and child.has_valid_name:
+                        comps.append(Component(child.name))
                     else:
                         comps.append(Component(container.content.index(child)))
                     child = container
                     container = container.parent
+                comps.reverse()
                 self._path = Path(comps)
         return self._path
 
@@ -77,16 +78,15 @@ class Object:
             return None
         root = self.root_content_container
         if root:
-            target_content = None
-            try:
-                target_content = root.content_at_path(path)
-            finally:
-                if target_content:
-                    dm = target_content.debug_metadata
-                    if dm:
-                        return dm.start_line_number
+            target_content = root.content_at_path(path).obj
+            if target_content:
+                dm = target_content.debug_metadata
+                if dm:
+                    return dm.start_line_number
+        return None
 
     def resolve_path(self, path: Path) -> "SearchResult":
+        from .container import Container
         if path.is_relative:
             nearest_container = self if isinstance(self, Container) else None
             if not nearest_container:
@@ -24,7 +24,7 @@ class Component:  # TODO: Maybe implement default c# Component stuff
 
     def __eq__(self, other) -> bool:
         if isinstance(other, Component):
-            if other.is_index == other.is_index:
+            if self.is_index == other.is_index:
                 if self.is_index:
                     return self.index == other.index
                 else:
@@ -64,7 +64,7 @@ class Path:  # TODO: Maybe implement default c# path stuff
             self._components.extend(sec._components)
         elif isinstance(pri, str) and not sec:
             self.components_string = pri
-        else:
+        elif pri is not None:
             self._components.extend(pri)
             self.is_relative = bool(sec)
 
@@ -130,16 +130,15 @@ class Path:  # TODO: Maybe implement default c# path stuff
     def components_string(self, value):
         self._components.clear()
         self._components_string = value
-        if not self._components_string:
+        if not value:
             return
-        if self._components_string[0] == ".":
+        if value[0] == ".":
             self.is_relative = True
-            self._components_string = self.components_string[1:]
+            value = value[1:]
         else:
             self.is_relative = False
 
-        component_strings = self.components_string.split(".")
-        for component in component_strings:
+        for component in value.split("."):
             if component.isnumeric():
                 self._components.append(Component(int(component)))
             else:
@@ -166,7 +165,7 @@ class Path:  # TODO: Maybe implement default c# path stuff
                 break
         for i in range(len(self._components) - upward_moves):
             p._components.append(self._components[i])
-        for i in range(len(path_to_append._components)):
+        for i in range(upward_moves, len(path_to_append._components)):
             p._components.append(path_to_append._components[i])
         return p
 
@@ -122,12 +122,22 @@ class Profiler:
     _step_total: float
     _curr_step_stack: List[str]
     _curr_step_details: StepDetails
-    _rootNode: ProfileNode
+    _root_node: ProfileNode
     _num_continues: int
     _step_details: List[StepDetails]
 
     def __init__(self):
+        self._continue_watch = Stopwatch()
+        self._step_watch = Stopwatch()
+        self._snap_watch = Stopwatch()
+        self._continue_total = 0
+        self._snap_total = 0
+        self._step_total = 0
+        self._curr_step_stack = None
+        self._curr_step_details = None
         self._root_node = ProfileNode()
+        self._num_continues = 0
+        self._step_details = []
 
     @property
     def root_node(self):
@@ -144,7 +154,7 @@ class Profiler:
         self._continue_watch.reset()
         self._continue_watch.start()
 
-    def post_contine(self):
+    def post_continue(self):
         self._continue_watch.stop()
         self._continue_total += self.millisecs(self._continue_watch)
         self._num_continues += 1
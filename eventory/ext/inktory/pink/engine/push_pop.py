@@ -1,7 +1,7 @@
-from enum import IntEnum, auto
+from enum import IntEnum
 
 
 class PushPopType(IntEnum):
-    Tunnel = auto
-    Function = auto
-    FunctionEvaluationFromGame = auto
+    Tunnel = 0
+    Function = 1
+    FunctionEvaluationFromGame = 2
@@ -10,6 +10,10 @@ class SearchResult:
     obj: "Object"
     approximate: bool
 
+    def __init__(self, obj: "Object" = None, approximate: bool = False):
+        self.obj = obj
+        self.approximate = approximate
+
     @property
     def correct_obj(self) -> "Object":
         return None if self.approximate else self.obj
@@ -1,29 +1,76 @@
-from typing import List, TYPE_CHECKING
-
-from .object import Object
-from .json_serialisation import Json
 import json
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Tuple
+
+from .choice import Choice
+from .choice_point import ChoicePoint
 from .container import Container
+from .control_command import CommandType, ControlCommand
+from .divert import Divert
+from .json_serialisation import Json
+from .list_definition_origin import ListDefinitionOrigin
+from .native_function_call import NativeFunctionCall
+from .object import Object
+from .path import Path
 from .pointer import Pointer
+from .profiler import Profiler
+from .push_pop import PushPopType
+from .story_exception import StoryException
+from .story_state import StoryState
+from .utils import DotNetRandom, to_int32
+from .value import DivertTargetValue, IntValue, ListValue, StringValue, Value, VariablePointerValue
+from .variable_assignment import VariableAssignment
+from .variable_reference import VariableReference
+from .void import Void
 
 if TYPE_CHECKING:
-    from .choice import Choice
-    from .variables_state import VariablesState
-    from .list_definition_origin import ListDefinitionOrigin
-    from .story_state import StoryState
-    from .path import Path
     from .search_result import SearchResult
+    from .variables_state import VariablesState
 
 
 class Story(Object):
     ink_version_current: int = 18
     ink_version_minimum_compatible: int = 18
 
-    def __init__(self):
-        pass
+    _main_content_container: Container
+    _list_definitions: ListDefinitionOrigin
+    _state: StoryState
+    _externals: Dict[str, Callable]
+    _variable_observers: Dict[str, List[Callable]]
+    _prev_containers: List[Container]
+    _profiler: Optional[Profiler]
+    allow_external_function_fallbacks: bool
+
+    def __init__(self, json_string: str, lazy: bool = False):
+        super().__init__()
+        root_object = json.loads(json_string)
+
+        format_from_file = root_object.get("inkVersion")
+        if format_from_file is None:
+            raise StoryException("ink version number not found. Are you sure it's a valid .ink.json file?")
+        format_from_file = int(format_from_file)
+        if format_from_file > self.ink_version_current:
+            raise StoryException("Version of ink used to build story was newer than the current version of the engine")
+        elif format_from_file < self.ink_version_minimum_compatible:
+            raise StoryException("Version of ink used to build story is too old to be loaded by this version of the engine")
+
+        root_token = root_object.get("root")
+        if root_token is None:
+            raise StoryException("Root node for ink not found. Are you sure it's a valid .ink.json file?")
+
+        list_defs = root_object.get("listDefs")
+        self._list_definitions = Json.j_token_to_list_definitions(list_defs) if list_defs else ListDefinitionOrigin([])
+        self._main_content_container = Json.j_array_to_container(root_token, lazy=True) if lazy else Json.j_token_to_runtime_object(root_token)
+
+        self._externals = {}
+        self._variable_observers = {}
+        self._prev_containers = []
+        self._profiler = None
+        self.allow_external_function_fallbacks = False
+
+        self.reset_state()
 
     @property
-    def current_choices(self) -> List["Choice"]:
+    def current_choices(self) -> List[Choice]:
         choices = []
         for c in self._state.current_choices:
             if not c.is_invisible_default:
@@ -60,13 +107,21 @@ class Story(Object):
         return self.state.variables_state
 
     @property
-    def list_definitions(self) -> "ListDefinitionOrigin":
+    def list_definitions(self) -> ListDefinitionOrigin:
         return self._list_definitions
 
     @property
-    def state(self) -> "StoryState":
+    def state(self) -> StoryState:
         return self._state
 
+    @property
+    def main_content_container(self) -> Container:
+        return self._main_content_container
+
+    @property
+    def can_continue(self) -> bool:
+        return self.state.can_continue
+
     def start_profiling(self) -> Profiler:
         self._profiler = Profiler()
         return self._profiler
@@ -79,13 +134,13 @@ class Story(Object):
         root_object = {}
         root_object["inkVersion"] = self.ink_version_current
         root_object["root"] = root_container_json_list
-        if self._list_definitions:
+        if self._list_definitions.lists:
             root_object["listDefs"] = Json.list_definitions_to_j_token(self._list_definitions)
         return json.dumps(root_object)
 
     def reset_state(self):
         self._state = StoryState(self)
-        self._state.variables_state.variable_changed_event # TODO
+        self._state.variables_state.variable_changed_event.listen(self.variable_state_did_change_event)
         self.reset_globals()
 
     def reset_errors(self):
@@ -95,23 +150,838 @@ class Story(Object):
         self._state.force_end()
 
     def reset_globals(self):
-        if "global decl" in self._main_content_container.named_content:
+        if self._main_content_container.named_content_with_name("global decl"):
             original_pointer = self.state.current_pointer
-            self.choose_path_string("global decl", reset_callstack=False)
+            self.choose_path(Path("global decl"), incrementing_turn_index=False)
             self.continue_internal()
             self.state.current_pointer = original_pointer
         self.state.variables_state.snapshot_default_globals()
 
-    def can_continue(self) -> bool:
-        return self.state.can_continue
+    def continue_story(self) -> str:
+        self.continue_internal()
+        return self.current_text
+
+    def continue_maximally(self) -> str:
+        sb = []
+        while self.can_continue:
+            sb.append(self.continue_story())
+        return "".join(sb)
+
+    def continue_internal(self):
+        if self._profiler:
+            self._profiler.pre_continue()
+
+        if not self.can_continue:
+            raise StoryException("Can't continue - should check can_continue before calling continue_story")
+
+        self._state.reset_errors()
+        self._state.reset_output()
+        self._state.did_safe_exit = False
+        self._state.variables_state.batch_observing_variable_changes = True
+
+        try:
+            state_at_last_newline = None
+            # step until the output ends in a newline, then keep going a bit to see whether glue or choices follow it and rewind if not
+            while True:
+                self.step()
+
+                if not self.can_continue:
+                    self.try_follow_default_invisible_choice()
+
+                if not self.state.in_string_evaluation:
+                    if state_at_last_newline is not None:
+                        curr_text = self.current_text
+                        prev_text_length = len(state_at_last_newline.current_text)
+                        prev_tag_count = len(state_at_last_newline.current_tags)
+
+                        if curr_text != state_at_last_newline.current_text or prev_tag_count != len(self.current_tags):
+                            if len(curr_text) >= prev_text_length and curr_text[prev_text_length - 1] == "\n":
+                                self.restore_state_snapshot(state_at_last_newline)
+                                state_at_last_newline = None
+                                break
+                            else:
+                                state_at_last_newline = None
+
+                    if self.state.output_stream_ends_in_newline:
+                        if self.can_continue:
+                            if state_at_last_newline is None:
+                                state_at_last_newline = self.state_snapshot()
+                        else:
+                            state_at_last_newline = None
+
+                if not self.can_continue:
+                    break
+
+            if state_at_last_newline is not None:
+                self.restore_state_snapshot(state_at_last_newline)
+
+            if not self.can_continue:
+                if self.state.call_stack.can_pop_thread:
+                    self.error("Thread available to pop, threads should always be flat by the end of evaluation?")
+
+                if not self.state.generated_choices and not self.state.did_safe_exit:
+                    if self.state.call_stack.can_pop_type(PushPopType.Tunnel):
+                        self.error("unexpectedly reached end of content. Do you need a '->->' to return from a tunnel?")
+                    elif self.state.call_stack.can_pop_type(PushPopType.Function):
+                        self.error("unexpectedly reached end of content. Do you need a '~ return'?")
+                    elif not self.state.call_stack.can_pop:
+                        self.error("ran out of content. Do you need a '-> DONE' or '-> END'?")
+                    else:
+                        self.error("unexpectedly reached end of content for unknown reason. Please debug compiler!")
+        except StoryException as e:
+            self.add_error(str(e), use_end_line_number=e.use_end_line_number)
+        finally:
+            self.state.did_safe_exit = False
+            self._state.variables_state.batch_observing_variable_changes = False
+
+        if self._profiler:
+            self._profiler.post_continue()
+
+        if self.state.has_error:
+            errors = self.state.current_errors
+            raise StoryException(f"Ink had {len(errors)} error{'' if len(errors) == 1 else 's'}. The first issue was: {errors[0]}")
+
+    def state_snapshot(self) -> StoryState:
+        if self._profiler:
+            self._profiler.pre_snapshot()
+        snapshot = self.state.copy()
+        if self._profiler:
+            self._profiler.post_snapshot()
+        return snapshot
+
+    def restore_state_snapshot(self, state: StoryState):
+        self._state = state
+
+    def step(self):
+        if self._profiler:
+            self._profiler.pre_step()
+
+        should_add_to_stream = True
+
+        pointer = self.state.current_pointer
+        if pointer.is_null:
+            return
+
+        # step directly into the first element of content in a container
+        container_to_enter = pointer.resolve()
+        while isinstance(container_to_enter, Container):
+            self.visit_container(container_to_enter, at_start=True)
+            if not container_to_enter.content:
+                break
+            pointer = Pointer.start_of(container_to_enter)
+            container_to_enter = pointer.resolve()
+
+        self.state.current_pointer = pointer
+
+        if self._profiler:
+            self._profiler.step(self.state.call_stack)
+
+        current_content_obj = pointer.resolve()
+        is_logic_or_flow_control = self.perform_logic_and_flow_control(current_content_obj)
+
+        if self.state.current_pointer.is_null:
+            return
+
+        if is_logic_or_flow_control:
+            should_add_to_stream = False
+
+        if isinstance(current_content_obj, ChoicePoint):
+            choice = self.process_choice(current_content_obj)
+            if choice is not None:
+                self.state.generated_choices.append(choice)
+            current_content_obj = None
+            should_add_to_stream = False
+
+        if isinstance(current_content_obj, Container):
+            should_add_to_stream = False
+
+        if should_add_to_stream:
+            # make variable pointers specific to the current context without touching the story's own object
+            if isinstance(current_content_obj, VariablePointerValue) and current_content_obj.context_index == -1:
+                context_idx = self.state.call_stack.context_for_variable_named(current_content_obj.variable_name)
+                current_content_obj = VariablePointerValue(current_content_obj.variable_name, context_idx)
+
+            if self.state.in_expression_evaluation:
+                self.state.push_evaluation_stack(current_content_obj)
+            else:
+                self.state.push_to_output_stream(current_content_obj)
+
+        self.next_content()
+
+        # threads are started after incrementing the pointer so returning from the thread continues after this instruction
+        if isinstance(current_content_obj, ControlCommand) and current_content_obj.command_type == CommandType.StartThread:
+            self.state.call_stack.push_thread()
+
+        if self._profiler:
+            self._profiler.post_step()
+
+    def visit_container(self, container: Container, at_start: bool):
+        if not container.counting_at_start_only or at_start:
+            if container.visits_should_be_counted:
+                self.increment_visit_count_for_container(container)
+            if container.turn_index_should_be_counted:
+                self.record_turn_index_visit_to_container(container)
+
+    def visit_changed_containers_due_to_divert(self):
+        previous_pointer = self.state.previous_pointer
+        pointer = self.state.current_pointer
+
+        # unless we're pointing directly at a piece of content the counting is done by step
+        if pointer.is_null or pointer.index == -1:
+            return
+
+        self._prev_containers.clear()
+        if not previous_pointer.is_null:
+            prev_ancestor = previous_pointer.resolve()
+            if not isinstance(prev_ancestor, Container):
+                prev_ancestor = previous_pointer.container
+            while isinstance(prev_ancestor, Container):
+                self._prev_containers.append(prev_ancestor)
+                prev_ancestor = prev_ancestor.parent
+
+        current_child_of_container = pointer.resolve()
+        if current_child_of_container is None:
+            return
+
+        current_container_ancestor = current_child_of_container.parent
+        while isinstance(current_container_ancestor, Container) and \
+                (current_container_ancestor not in self._prev_containers or current_container_ancestor.counting_at_start_only):
+            entering_at_start = bool(current_container_ancestor.content) and current_child_of_container is current_container_ancestor.content[0]
+            self.visit_container(current_container_ancestor, entering_at_start)
+
+            current_child_of_container = current_container_ancestor
+            current_container_ancestor = current_container_ancestor.parent
+
+    def process_choice(self, choice_point: ChoicePoint) -> Optional[Choice]:
+        show_choice = True
+
+        if choice_point.has_condition:
+            condition_value = self.state.pop_evaluation_stack()
+            if not self.is_truthy(condition_value):
+                show_choice = False
+
+        start_text = ""
+        choice_only_text = ""
+
+        if choice_point.has_choice_only_content:
+            choice_only_text = self.state.pop_evaluation_stack().value
+
+        if choice_point.has_start_content:
+            start_text = self.state.pop_evaluation_stack().value
+
+        if choice_point.once_only:
+            visit_count = self.visit_count_for_container(choice_point.choice_target)
+            if visit_count > 0:
+                show_choice = False
+
+        # the content of the choice has been consumed either way so it doesn't end up in the output stream
+        if not show_choice:
+            return None
+
+        choice = Choice()
+        choice.target_path = choice_point.path_on_choice
+        choice.source_path = str(choice_point.path)
+        choice.is_invisible_default = choice_point.is_invisible_default
+        # the flow may leave the tunnel the choice was generated in before the choice is chosen
+        choice.thread_at_generation = self.state.call_stack.current_thread.copy()
+        choice.text = (start_text + choice_only_text).strip(" \t")
+        return choice
+
+    def is_truthy(self, obj: Object) -> bool:
+        if isinstance(obj, Value):
+            if isinstance(obj, DivertTargetValue):
+                self.error(f"Shouldn't use a divert target (to {obj.target_path}) as a conditional value. Did you intend a function call "
+                           "'likeThis()' or a read count check 'likeThis'? (no arrows)")
+                return False
+            return obj.is_truthy
+        return False
+
+    def perform_logic_and_flow_control(self, content_obj: Object) -> bool:
+        if content_obj is None:
+            return False
+
+        if isinstance(content_obj, Divert):
+            return self.perform_divert(content_obj)
+        elif isinstance(content_obj, ControlCommand):
+            self.perform_control_command(content_obj)
+            return True
+        elif isinstance(content_obj, VariableAssignment):
+            assigned_val = self.state.pop_evaluation_stack()
+            self.state.variables_state.assign(content_obj, assigned_val)
+            return True
+        elif isinstance(content_obj, VariableReference):
+            if content_obj.path_for_count is not None:
+                container = content_obj.container_for_count
+                found_value = IntValue(self.visit_count_for_container(container))
+            else:
+                found_value = self.state.variables_state.get_variable_with_name(content_obj.name)
+                if found_value is None:
+                    default_val = self.state.variables_state.try_get_default_variable_value(content_obj.name)
+                    if default_val is not None:
+                        self.warning(f"Variable not found in save state: '{content_obj.name}', but seems to have been newly created. "
+                                     f"Assigning value from latest ink's declaration: {default_val}")
+                        found_value = default_val
+                        self.state.variables_state.set_global(content_obj.name, found_value)
+                    else:
+                        self.warning(f"Variable not found: '{content_obj.name}'. Using default value of 0 (false). This can happen with temporary "
+                                     "variables if the declaration hasn't yet been hit.")
+                        found_value = IntValue(0)
+            self.state.push_evaluation_stack(found_value)
+            return True
+        elif isinstance(content_obj, NativeFunctionCall):
+            func_params = self.state.pop_evaluation_stack(content_obj.number_of_parameters)
+            result = content_obj.call(func_params)
+            self.state.push_evaluation_stack(result)
+            return True
+
+        return False
+
+    def perform_divert(self, current_divert: Divert) -> bool:
+        if current_divert.is_conditional:
+            condition_value = self.state.pop_evaluation_stack()
+            if not self.is_truthy(condition_value):
+                return True
+
+        if current_divert.has_variable_target:
+            var_name = current_divert.variable_divert_name
+            var_contents = self.state.variables_state.get_variable_with_name(var_name)
+            if var_contents is None:
+                self.error(f"Tried to divert using a target from a variable that could not be found ({var_name})")
+            elif not isinstance(var_contents, DivertTargetValue):
+                error_message = f"Tried to divert to a target from a variable, but the variable ({var_name}) didn't contain a divert target, it "
+                if isinstance(var_contents, IntValue) and var_contents.value == 0:
+                    error_message += "was empty/null (the value 0)."
+                else:
+                    error_message += f"contained '{var_contents}'."
+                self.error(error_message)
+            self.state.diverted_pointer = self.pointer_at_path(var_contents.target_path)
+        elif current_divert.is_external:
+            self.call_external_function(current_divert.target_path_string, current_divert.external_args)
+            return True
+        else:
+            self.state.diverted_pointer = current_divert.target_pointer
+
+        if current_divert.pushes_to_stack:
+            self.state.call_stack.push(current_divert.stack_push_type, output_stream_length_with_pushed=len(self.state.output_stream))
+
+        if self.state.diverted_pointer.is_null and not current_divert.is_external:
+            self.error(f"Divert resolution failed: {current_divert}")
+
+        return True
+
+    def perform_control_command(self, eval_command: ControlCommand):
+        state = self.state
+        command_type = eval_command.command_type
+
+        if command_type == CommandType.EvalStart:
+            self.assert_(not state.in_expression_evaluation, "Already in expression evaluation?")
+            state.in_expression_evaluation = True
+
+        elif command_type == CommandType.EvalEnd:
+            self.assert_(state.in_expression_evaluation, "Not in expression evaluation mode")
+            state.in_expression_evaluation = False
+
+        elif command_type == CommandType.EvalOutput:
+            # an empty expression doesn't leave anything on the stack
+            if state.evaluation_stack:
+                output = state.pop_evaluation_stack()
+                if not isinstance(output, Void):
+                    state.push_to_output_stream(StringValue(str(output)))
+
+        elif command_type == CommandType.NoOp:
+            pass
+
+        elif command_type == CommandType.Duplicate:
+            state.push_evaluation_stack(state.peek_evaluation_stack())
+
+        elif command_type == CommandType.PopEvaluatedValue:
+            state.pop_evaluation_stack()
 
-    def content_at_path(self, path: "Path") -> "SearchResult":
+        elif command_type == CommandType.PopFunction or command_type == CommandType.PopTunnel:
+            pop_type = PushPopType.Function if command_type == CommandType.PopFunction else PushPopType.Tunnel
+
+            # tunnel onwards may override where to go next instead of returning to the caller
+            override_tunnel_return_target = None
+            if pop_type == PushPopType.Tunnel:
+                popped = state.pop_evaluation_stack()
+                if isinstance(popped, DivertTargetValue):
+                    override_tunnel_return_target = popped
+                else:
+                    self.assert_(isinstance(popped, Void), "Expected void if ->-> doesn't override target")
+
+            if state.try_exit_function_evaluation_from_game():
+                return
+            elif state.call_stack.current_element.element_type != pop_type or not state.call_stack.can_pop:
+                names = {
+                    PushPopType.Function: "function return statement (~ return)",
+                    PushPopType.Tunnel: "tunnel onwards statement (->->)"
+                }
+                expected = names.get(state.call_stack.current_element.element_type)
+                if not state.call_stack.can_pop:
+                    expected = "end of flow (-> END or choice)"
+                self.error(f"Found {names[pop_type]}, when expected {expected}")
+            else:
+                state.pop_callstack()
+                if override_tunnel_return_target is not None:
+                    state.diverted_pointer = self.pointer_at_path(override_tunnel_return_target.target_path)
+
+        elif command_type == CommandType.BeginString:
+            state.push_to_output_stream(eval_command)
+            self.assert_(state.in_expression_evaluation, "Expected to be in an expression when evaluating a string")
+            state.in_expression_evaluation = False
+
+        elif command_type == CommandType.EndString:
+            # collect the content since the matching BeginString, it's collected backwards
+            content_stack_for_string = []
+            output_count_consumed = 0
+            for obj in reversed(state.output_stream):
+                output_count_consumed += 1
+                if isinstance(obj, ControlCommand) and obj.command_type == CommandType.BeginString:
+                    break
+                if isinstance(obj, StringValue):
+                    content_stack_for_string.append(obj)
+
+            state.pop_from_output_stream(output_count_consumed)
+
+            text = "".join(str(c) for c in reversed(content_stack_for_string))
+            state.in_expression_evaluation = True
+            state.push_evaluation_stack(StringValue(text))
+
+        elif command_type == CommandType.ChoiceCount:
+            state.push_evaluation_stack(IntValue(len(state.generated_choices)))
+
+        elif command_type == CommandType.TurnsSince or command_type == CommandType.ReadCount:
+            target = state.pop_evaluation_stack()
+            if not isinstance(target, DivertTargetValue):
+                extra_note = ""
+                if isinstance(target, IntValue):
+                    extra_note = ". Did you accidentally pass a read count ('knot_name') instead of a target ('-> knot_name')?"
+                self.error(f"TURNS_SINCE expected a divert target (knot, stitch, label name), but saw {target}{extra_note}")
+                return
+
+            correct_obj = self.content_at_path(target.target_path).correct_obj
+            if isinstance(correct_obj, Container):
+                if command_type == CommandType.TurnsSince:
+                    either_count = self.turns_since_for_container(correct_obj)
+                else:
+                    either_count = self.visit_count_for_container(correct_obj)
+            else:
+                either_count = -1 if command_type == CommandType.TurnsSince else 0
+                self.warning(f"Failed to find container for {eval_command} lookup at {target.target_path}")
+            state.push_evaluation_stack(IntValue(either_count))
+
+        elif command_type == CommandType.Random:
+            max_int = state.pop_evaluation_stack()
+            min_int = state.pop_evaluation_stack()
+            if not isinstance(min_int, IntValue):
+                self.error("Invalid value for minimum parameter of RANDOM(min, max)")
+            if not isinstance(max_int, IntValue):
+                self.error("Invalid value for maximum parameter of RANDOM(min, max)")
+
+            # inclusive of min and max, i.e. RANDOM(1, 6) for a dice roll
+            random_range = max_int.value - min_int.value + 1
+            if random_range > 2147483647:
+                self.error("RANDOM was called with a range that exceeds the size that ink numbers can use.")
+            if random_range <= 0:
+                self.error(f"RANDOM was called with minimum as {min_int.value} and maximum as {max_int.value}. The maximum must be larger")
+
+            result_seed = to_int32(state.story_seed + state.previous_random)
+            next_random = DotNetRandom(result_seed).next()
+            chosen_value = next_random % random_range + min_int.value
+            state.push_evaluation_stack(IntValue(chosen_value))
+
+            # keep the next seed rather than the Random object
+            state.previous_random = next_random
+
+        elif command_type == CommandType.SeedRandom:
+            seed = state.pop_evaluation_stack()
+            if not isinstance(seed, IntValue):
+                self.error("Invalid value passed to SEED_RANDOM")
+
+            # the seed affects both RANDOM and shuffles
+            state.story_seed = seed.value
+            state.previous_random = 0
+            state.push_evaluation_stack(Void())
+
+        elif command_type == CommandType.VisitIndex:
+            count = self.visit_count_for_container(state.current_pointer.container) - 1
+            state.push_evaluation_stack(IntValue(count))
+
+        elif command_type == CommandType.SequenceShuffleIndex:
+            state.push_evaluation_stack(IntValue(self.next_sequence_shuffle_index()))
+
+        elif command_type == CommandType.StartThread:
+            # handled by step
+            pass
+
+        elif command_type == CommandType.Done:
+            # either in the thread that was just started or in the normal flow where DONE is a safe exit
+            if state.call_stack.can_pop_thread:
+                state.call_stack.pop_thread()
+            else:
+                state.did_safe_exit = True
+                state.current_pointer = Pointer.Null
+
+        elif command_type == CommandType.End:
+            state.force_end()
+
+        elif command_type == CommandType.ListFromInt:
+            int_val = state.pop_evaluation_stack()
+            list_name_val = state.pop_evaluation_stack()
+            if not isinstance(int_val, IntValue):
+                raise StoryException("Passed non-integer when creating a list element from a numerical value.")
+
+            generated_list_value = None
+            found_list_def = self.list_definitions.try_list_get_definition(list_name_val.value)
+            if found_list_def is None:
+                raise StoryException(f"Failed to find LIST called {list_name_val.value}")
+            found_item = found_list_def.try_get_item_with_value(int_val.value)
+            if not found_item.is_null:
+                generated_list_value = ListValue(found_item, int_val.value)
+            if generated_list_value is None:
+                generated_list_value = ListValue()
+            state.push_evaluation_stack(generated_list_value)
+
+        elif command_type == CommandType.ListRange:
+            max_bound = state.pop_evaluation_stack()
+            min_bound = state.pop_evaluation_stack()
+            target_list = state.pop_evaluation_stack()
+            if not isinstance(target_list, ListValue) or min_bound is None or max_bound is None:
+                raise StoryException("Expected list, minimum and maximum for LIST_RANGE")
+
+            min_val = self.int_bound(min_bound)
+            max_val = self.int_bound(max_bound)
+            if min_val == -1:
+                self.error(f"Invalid min range bound passed to LIST_VALUE(): {min_bound}")
+            if max_val == -1:
+                self.error(f"Invalid max range bound passed to LIST_VALUE(): {max_bound}")
+
+            result = ListValue()
+            for origin in target_list.value.origins or ():
+                range_from_origin = origin.list_range(min_val, max_val)
+                for key, value in range_from_origin.value.items():
+                    result.value[key] = value
+            state.push_evaluation_stack(result)
+
+        else:
+            self.error(f"unhandled ControlCommand: {eval_command}")
+
+    @staticmethod
+    def int_bound(obj: Object) -> int:
+        # either an int or a list item may be used as the bound of a range
+        if isinstance(obj, ListValue):
+            return obj.value.max_item[1]
+        if isinstance(obj, IntValue):
+            return obj.value
+        return -1
+
+    def next_content(self):
+        # the previous pointer is needed by visit_changed_containers_due_to_divert
+        self.state.previous_pointer = self.state.current_pointer
+
+        if not self.state.diverted_pointer.is_null:
+            self.state.current_pointer = self.state.diverted_pointer
+            self.state.diverted_pointer = Pointer.Null
+
+            self.visit_changed_containers_due_to_divert()
+
+            # a divert may jump to the end of a container, in which case the pointer is incremented as usual
+            if not self.state.current_pointer.is_null:
+                return
+
+        successful_pointer_increment = self.increment_content_pointer()
+
+        # ran out of content, try to return from a function or finish the current thread
+        if not successful_pointer_increment:
+            did_pop = False
+            if self.state.call_stack.can_pop_type(PushPopType.Function):
+                self.state.pop_callstack(PushPopType.Function)
+                # dropping off the end of a function returns nothing, the evaluator still needs a value
+                if self.state.in_expression_evaluation:
+                    self.state.push_evaluation_stack(Void())
+                did_pop = True
+            elif self.state.call_stack.can_pop_thread:
+                self.state.call_stack.pop_thread()
+                did_pop = True
+            else:
+                self.state.try_exit_function_evaluation_from_game()
+
+            # step past the point where we last called out
+            if did_pop and not self.state.current_pointer.is_null:
+                self.next_content()
+
+    def increment_content_pointer(self) -> bool:
+        successful_increment = True
+
+        current_element = self.state.call_stack.current_element
+        container = current_element.current_pointer.container
+        index = current_element.current_pointer.index + 1
+
+        # stepping off the end falls out to the next container as long as we're in indexed content
+        while index >= len(container.content):
+            successful_increment = False
+            next_ancestor = container.parent
+            if not isinstance(next_ancestor, Container):
+                break
+            index_in_ancestor = self._index_of(next_ancestor.content, container)
+            if index_in_ancestor == -1:
+                break
+            container = next_ancestor
+            index = index_in_ancestor + 1
+            successful_increment = True
+
+        current_element.current_pointer = Pointer(container, index) if successful_increment else Pointer.Null
+        return successful_increment
+
+    @staticmethod
+    def _index_of(content: List[Object], obj: Object) -> int:
+        for i, c in enumerate(content):
+            if c is obj:
+                return i
+        return -1
+
+    def try_follow_default_invisible_choice(self) -> bool:
+        all_choices = self._state.current_choices
+
+        # only follow it if the invisible defaults are the only choices
+        invisible_choices = [c for c in all_choices if c.is_invisible_default]
+        if not invisible_choices or len(all_choices) > len(invisible_choices):
+            return False
+
+        choice = invisible_choices[0]
+        self.state.call_stack.current_thread = choice.thread_at_generation
+        self.choose_path(choice.target_path, incrementing_turn_index=False)
+        return True
+
+    def visit_count_for_container(self, container: Container) -> int:
+        if not container.visits_should_be_counted:
+            self.error(f"Read count for target ({container.name} - on {container.debug_metadata}) unknown. The story may need to be compiled "
+                       "with countAllVisits flag (-c).")
+            return 0
+        return self.state.visit_counts.get(str(container.path), 0)
+
+    def increment_visit_count_for_container(self, container: Container):
+        container_path_str = str(container.path)
+        self.state.visit_counts[container_path_str] = self.state.visit_counts.get(container_path_str, 0) + 1
+
+    def record_turn_index_visit_to_container(self, container: Container):
+        self.state.turn_indices[str(container.path)] = self.state.current_turn_index
+
+    def turns_since_for_container(self, container: Container) -> int:
+        if not container.turn_index_should_be_counted:
+            self.error(f"TURNS_SINCE() for target ({container.name} - on {container.debug_metadata}) unknown. The story may need to be compiled "
+                       "with countAllVisits flag (-c).")
+        index = self.state.turn_indices.get(str(container.path))
+        if index is None:
+            return -1
+        return self.state.current_turn_index - index
+
+    def next_sequence_shuffle_index(self) -> int:
+        num_elements_int_val = self.state.pop_evaluation_stack()
+        if not isinstance(num_elements_int_val, IntValue):
+            self.error("expected number of elements in sequence for shuffle index")
+            return 0
+
+        seq_container = self.state.current_pointer.container
+        num_elements = num_elements_int_val.value
+
+        seq_count = self.state.pop_evaluation_stack().value
+        loop_index = seq_count // num_elements
+        iteration_index = seq_count % num_elements
+
+        # the same shuffle is generated every time the sequence is reached during the same loop
+        sequence_hash = sum(map(ord, str(seq_container.path)))
+        random = DotNetRandom(to_int32(sequence_hash + loop_index + self.state.story_seed))
+        unpicked_indices = list(range(num_elements))
+        for i in range(iteration_index + 1):
+            chosen = random.next() % len(unpicked_indices)
+            chosen_index = unpicked_indices.pop(chosen)
+            if i == iteration_index:
+                return chosen_index
+
+        raise StoryException("Should never reach here")
+
+    def choose_path_string(self, path: str, reset_callstack: bool = True, *arguments):
+        if reset_callstack:
+            self.reset_callstack()
+        elif self.state.call_stack.current_element.element_type == PushPopType.Function:
+            # changing the path in the middle of a function is almost certainly a mistake
+            func_detail = ""
+            container = self.state.call_stack.current_element.current_pointer.container
+            if container is not None:
+                func_detail = f"({container.path}) "
+            raise StoryException(f"Story was running a function {func_detail}when you called choose_path_string({path}) - this is almost certainly "
+                                 f"not what you want! Full stack trace: \n{self.state.call_stack.call_stack_trace}")
+
+        self.state.pass_arguments_to_evaluation_stack(*arguments)
+        self.choose_path(Path(path))
+
+    def choose_path(self, p: Path, incrementing_turn_index: bool = True):
+        self.state.set_chosen_path(p, incrementing_turn_index)
+        self.visit_changed_containers_due_to_divert()
+
+    def choose_choice_index(self, choice_idx: int):
+        choices = self.current_choices
+        if not 0 <= choice_idx < len(choices):
+            raise IndexError("choice out of range")
+
+        # the flow continues in the context (i.e. the thread) the choice was generated in
+        choice_to_choose = choices[choice_idx]
+        self.state.call_stack.current_thread = choice_to_choose.thread_at_generation
+        self.choose_path(choice_to_choose.target_path)
+
+    def has_function(self, function_name: str) -> bool:
+        return self.knot_container_with_name(function_name) is not None
+
+    def evaluate_function(self, function_name: str, *arguments) -> Tuple[Any, str]:
+        if not function_name or not function_name.strip():
+            raise ValueError("Function is empty or white space.")
+
+        func_container = self.knot_container_with_name(function_name)
+        if func_container is None:
+            raise StoryException(f"Function doesn't exist: '{function_name}'")
+
+        # the function may be evaluated in the middle of the main story evaluation
+        output_stream_before = list(self.state.output_stream)
+        self._state.reset_output()
+
+        self.state.start_function_evaluation_from_game(func_container, *arguments)
+
+        text_output = []
+        while self.can_continue:
+            text_output.append(self.continue_story())
+
+        self._state.reset_output(output_stream_before)
+
+        result = self.state.complete_function_evaluation_from_game()
+        return result, "".join(text_output)
+
+    def call_external_function(self, func_name: str, number_of_arguments: int):
+        func = self._externals.get(func_name)
+        if func is None:
+            if self.allow_external_function_fallbacks:
+                fallback_function_container = self.knot_container_with_name(func_name)
+                if fallback_function_container is None:
+                    self.error(f"Trying to call EXTERNAL function '{func_name}' which has not been bound, and fallback ink function could not be found.")
+
+                # divert directly into the fallback function
+                self.state.call_stack.push(PushPopType.Function, output_stream_length_with_pushed=len(self.state.output_stream))
+                self.state.diverted_pointer = Pointer.start_of(fallback_function_container)
+                return
+            else:
+                self.error(f"Trying to call EXTERNAL function '{func_name}' which has not been bound (and ink fallbacks disabled).")
+
+        arguments = [self.state.pop_evaluation_stack().value_object for _ in range(number_of_arguments)]
+        arguments.reverse()
+
+        func_result = func(*arguments)
+
+        if func_result is not None:
+            return_obj = Value.create(func_result)
+            if return_obj is None:
+                self.error(f"Could not create ink value from returned object of type {type(func_result).__name__}")
+        else:
+            return_obj = Void()
+
+        self.state.push_evaluation_stack(return_obj)
+
+    def bind_external_function(self, func_name: str, func: Callable):
+        if func_name in self._externals:
+            raise ValueError(f"Function '{func_name}' has already been bound.")
+        self._externals[func_name] = func
+
+    def unbind_external_function(self, func_name: str):
+        if func_name not in self._externals:
+            raise ValueError(f"Function '{func_name}' has not been bound.")
+        del self._externals[func_name]
+
+    def observe_variable(self, variable_name: str, observer: Callable[[str, Any], None]):
+        if variable_name not in self.state.variables_state:
+            raise StoryException(f"Cannot observe variable '{variable_name}' because it wasn't declared in the ink story.")
+        self._variable_observers.setdefault(variable_name, []).append(observer)
+
+    def remove_variable_observer(self, observer: Callable[[str, Any], None] = None, specific_variable_name: str = None):
+        if specific_variable_name is not None:
+            observers = self._variable_observers.get(specific_variable_name)
+            if observers is not None:
+                if observer is None:
+                    del self._variable_observers[specific_variable_name]
+                elif observer in observers:
+                    observers.remove(observer)
+        elif observer is not None:
+            for observers in self._variable_observers.values():
+                if observer in observers:
+                    observers.remove(observer)
+
+    def variable_state_did_change_event(self, variable_name: str, new_value_obj: Object):
+        observers = self._variable_observers.get(variable_name)
+        if observers:
+            if not isinstance(new_value_obj, Value):
+                raise StoryException("Tried to get the value of a variable that isn't a standard type")
+            for observer in observers:
+                observer(variable_name, new_value_obj.value_object)
+
+    def content_at_path(self, path: Path) -> "SearchResult":
         return self.main_content_container.content_at_path(path)
 
-    def knot_container_with_name(self, name:str) -> Optional[Container]:
-        named_container = self.main_content_container.named_content.get(name)
+    def knot_container_with_name(self, name: str) -> Optional[Container]:
+        named_container = self.main_content_container.named_content_with_name(name)
         return named_container if isinstance(named_container, Container) else None
 
-    def pointer_at_path(self, path: "Path") -> "Pointer":
+    def pointer_at_path(self, path: Path) -> Pointer:
         if path.length == 0:
-            return Pointer.Null
\ No newline at end of file
+            return Pointer.Null
+
+        if path.last_component.is_index:
+            path_length_to_use = path.length - 1
+            result = self.main_content_container.content_at_path(path, partial_path_length=path_length_to_use)
+            pointer = Pointer(result.container, path.last_component.index)
+        else:
+            path_length_to_use = path.length
+            result = self.main_content_container.content_at_path(path)
+            pointer = Pointer(result.container, -1)
+
+        if result.obj is None or (result.obj is self.main_content_container and path_length_to_use > 0):
+            self.error(f"Failed to find content at path '{path}', and no approximation of it was possible.")
+        elif result.approximate:
+            self.warning(f"Failed to find content at path '{path}', so it was approximated to: '{result.obj.path}'.")
+
+        return pointer
+
+    def assert_(self, condition: bool, message: str = None):
+        if not condition:
+            raise StoryException(f"Internal story error: {message or 'Story assert'}")
+
+    def error(self, message: str, use_end_line_number: bool = False):
+        e = StoryException(message)
+        e.use_end_line_number = use_end_line_number
+        raise e
+
+    def warning(self, message: str):
+        self.add_error(message, is_warning=True)
+
+    def add_error(self, message: str, is_warning: bool = False, use_end_line_number: bool = False):
+        dm = self.current_debug_metadata
+        error_type_str = "WARNING" if is_warning else "ERROR"
+        if dm is not None:
+            line_num = dm.end_line_number if use_end_line_number else dm.start_line_number
+            message = f"RUNTIME {error_type_str}: '{dm.file_name}' line {line_num}: {message}"
+        elif not self.state.current_pointer.is_null:
+            message = f"RUNTIME {error_type_str}: ({self.state.current_pointer.path}): {message}"
+        else:
+            message = f"RUNTIME {error_type_str}: {message}"
+
+        self.state.add_error(message, is_warning)
+
+        # errors stop the flow, warnings don't
+        if not is_warning:
+            self.state.force_end()
+
+    @property
+    def current_debug_metadata(self):
+        pointer = self.state.current_pointer
+        if not pointer.is_null:
+            obj = pointer.resolve()
+            if obj is not None and obj.debug_metadata is not None:
+                return obj.debug_metadata
+        return None
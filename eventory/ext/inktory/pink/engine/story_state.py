@@ -1,6 +1,6 @@
 import json
 import random
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
 
 from .call_stack import CallStack, Thread
 from .choice import Choice
@@ -14,12 +14,13 @@ from .pointer import Pointer
 from .push_pop import PushPopType
 from .story_exception import StoryException
 from .tag import Tag
-from .utils import late_import_from, remove_range_from_list
+from .utils import remove_range_from_list
 from .value import ListValue, StringValue, Value, ValueType
 from .variables_state import VariablesState
 from .void import Void
 
-Story = late_import_from(".story", "Story")
+if TYPE_CHECKING:
+    from .story import Story
 
 
 class StoryState:
@@ -44,15 +45,15 @@ class StoryState:
     story_seed: int
     previous_random: int
     did_safe_exit: bool
-    story: Story
+    story: "Story"
 
-    def __init__(self, story: Story):
+    def __init__(self, story: "Story"):
         self._current_text = None
         self._current_tags = []
         self._output_stream = []
         self.current_errors = []
         self.current_warnings = []
-        self.diverted_pointer = None
+        self.diverted_pointer = Pointer.Null
         self.did_safe_exit = False
 
         self.story = story
@@ -61,7 +62,7 @@ class StoryState:
 
         self.evaluation_stack = []
 
-        self.call_stack = CallStack(story.root_content_container)
+        self.call_stack = CallStack(story.main_content_container)
         self.variables_state = VariablesState(self.call_stack, story.list_definitions)
 
         self.visit_counts = {}
@@ -122,23 +123,39 @@ class StoryState:
 
     @property
     def has_error(self) -> bool:
-        return self.current_errors and len(self.current_errors) > 0
+        return bool(self.current_errors)
 
     @property
     def has_warning(self) -> bool:
-        return self.current_warnings and len(self.current_warnings) > 0
+        return bool(self.current_warnings)
 
     @property
     def current_text(self) -> str:
         if self._output_stream_text_dirty:
-            sb = ""
-            for output_obj in self._output_stream:
-                if isinstance(output_obj, StringValue):
-                    sb += output_obj.value
-            self._current_text = sb
-            self._output_stream_dirty = False
+            text = "".join(output_obj.value for output_obj in self._output_stream if isinstance(output_obj, StringValue))
+            self._current_text = self.clean_output_whitespace(text)
+            self._output_stream_text_dirty = False
         return self._current_text
 
+    @staticmethod
+    def clean_output_whitespace(text: str) -> str:
+        # collapse runs of inline whitespace and remove it from the start and end of lines
+        sb = []
+        current_whitespace_start = -1
+        start_of_line = 0
+        for i, c in enumerate(text):
+            is_inline_whitespace = c == " " or c == "\t"
+            if is_inline_whitespace and current_whitespace_start == -1:
+                current_whitespace_start = i
+            if not is_inline_whitespace:
+                if c != "\n" and current_whitespace_start > 0 and current_whitespace_start != start_of_line:
+                    sb.append(" ")
+                current_whitespace_start = -1
+                sb.append(c)
+            if c == "\n":
+                start_of_line = i + 1
+        return "".join(sb)
+
     @property
     def current_tags(self) -> List[str]:
         if self._output_stream_tags_dirty:
@@ -298,7 +315,7 @@ class StoryState:
         self._output_stream.clear()
         if objs:
             self._output_stream.extend(objs)
-            self.output_stream_dirty()
+        self.output_stream_dirty()
 
     def push_to_output_stream(self, obj: Object):
         if isinstance(obj, StringValue):
@@ -331,7 +348,7 @@ class StoryState:
                 break
         tail_last_newline_idx = -1
         tail_first_newline_idx = -1
-        for i in range(len(string)):
+        for i in range(len(string) - 1, -1, -1):
             c = string[i]
             if c == "\n":
                 if tail_last_newline_idx == -1:
@@ -375,7 +392,8 @@ class StoryState:
             if curr_el.element_type == PushPopType.Function:
                 function_trim_index = curr_el.function_start_in_output_stream
             glue_trim_index = -1
-            for i, o in enumerate(reversed(self._output_stream)):
+            for i in range(len(self._output_stream) - 1, -1, -1):
+                o = self._output_stream[i]
                 if isinstance(o, Glue):
                     glue_trim_index = i
                     break
@@ -431,9 +449,10 @@ class StoryState:
         self.output_stream_dirty()
 
     def remove_existing_glue(self):
-        for obj in reversed(self._output_stream):
+        for i in range(len(self._output_stream) - 1, -1, -1):
+            obj = self._output_stream[i]
             if isinstance(obj, Glue):
-                self._output_stream.remove(obj)
+                self._output_stream.pop(i)
             elif isinstance(obj, ControlCommand):
                 break
         self.output_stream_dirty()
@@ -474,10 +493,10 @@ class StoryState:
             self.call_stack.pop_thread()
         while self.call_stack.can_pop:
             self.pop_callstack()
-            self._current_choices.clear()
-            self.current_pointer = Pointer.Null
-            self.previous_pointer = Pointer.Null
-            self.did_safe_exit = True
+        self._current_choices.clear()
+        self.current_pointer = Pointer.Null
+        self.previous_pointer = Pointer.Null
+        self.did_safe_exit = True
 
     def trim_whitespace_from_function_end(self):
         assert self.call_stack.current_element.element_type == PushPopType.Function
@@ -486,7 +505,7 @@ class StoryState:
         if function_start_point == -1:
             function_start_point = 0
 
-        for i in range(len(self.output_stream) - 1, function_start_point, -1):
+        for i in range(len(self._output_stream) - 1, function_start_point - 1, -1):
             obj = self._output_stream[i]
             if not isinstance(obj, StringValue):
                 continue
@@ -503,18 +522,19 @@ class StoryState:
             self.trim_whitespace_from_function_end()
         self.call_stack.pop(pop_type)
 
-    def set_chosen_path(self, path: Path):
+    def set_chosen_path(self, path: Path, incrementing_turn_index: bool = True):
         self._current_choices.clear()
         new_pointer = self.story.pointer_at_path(path)
         if not new_pointer.is_null and new_pointer.index == -1:
-            new_pointer.index = 0
+            new_pointer = Pointer(new_pointer.container, 0)
         self.current_pointer = new_pointer
-        self.current_turn_index += 1
+        if incrementing_turn_index:
+            self.current_turn_index += 1
 
     def start_function_evaluation_from_game(self, func_container: Container, *arguments):
         self.call_stack.push(PushPopType.FunctionEvaluationFromGame, len(self.evaluation_stack))
         self.call_stack.current_element.current_pointer = Pointer.start_of(func_container)
-        self.pass_arguments_to_evaluation_stack(arguments)
+        self.pass_arguments_to_evaluation_stack(*arguments)
 
     def pass_arguments_to_evaluation_stack(self, *arguments):
         if arguments:
@@ -531,16 +551,16 @@ class StoryState:
         return False
 
     def complete_function_evaluation_from_game(self) -> Any:
-        if self.call_stack.current_element != PushPopType.FunctionEvaluationFromGame:
+        if self.call_stack.current_element.element_type != PushPopType.FunctionEvaluationFromGame:
             raise StoryException(f"Expected external function evaluation to be complete. Stack trace: {self.call_stack.call_stack}")
         original_evaluation_stack_height = self.call_stack.current_element.evaluation_stack_height_when_pushed
         returned_obj = None
         while len(self.evaluation_stack) > original_evaluation_stack_height:
             popped_obj = self.pop_evaluation_stack()
-            if not returned_obj:
+            if returned_obj is None:
                 returned_obj = popped_obj
         self.pop_callstack(PushPopType.FunctionEvaluationFromGame)
-        if returned_obj:
+        if returned_obj is not None:
             if isinstance(returned_obj, Void):
                 return None
             if isinstance(returned_obj, Value):
@@ -549,7 +569,7 @@ class StoryState:
                 return returned_obj.value_object
         return None
 
-    def add_error(self, message: str, is_warning: bool):
+    def add_error(self, message: str, is_warning: bool = False):
         if not is_warning:
             if not self.current_errors:
                 self.current_errors = []
@@ -26,3 +26,52 @@ def groupby(l: Iterable[T], key: Callable[[T], I]) -> List[Tuple[I, List[T]]]:
     for item in l:
         d[key(item)].append(item)
     return list(d.items())
+
+
+def to_int32(value: int) -> int:
+    # wrap around like the 32 bit integers of the C# runtime
+    return (value + 0x80000000) % 0x100000000 - 0x80000000
+
+
+class DotNetRandom:
+    # port of System.Random so RANDOM and shuffles produce the same results as the .NET runtime
+    MBIG = 2147483647
+    MSEED = 161803398
+
+    def __init__(self, seed: int):
+        self._seed_array = seed_array = [0] * 56
+        subtraction = self.MBIG if seed == -2147483648 else abs(seed)
+        mj = self.MSEED - subtraction
+        seed_array[55] = mj
+        mk = 1
+        for i in range(1, 55):
+            ii = (21 * i) % 55
+            seed_array[ii] = mk
+            mk = to_int32(mj - mk)
+            if mk < 0:
+                mk += self.MBIG
+            mj = seed_array[ii]
+        for _ in range(1, 5):
+            for i in range(1, 56):
+                seed_array[i] = to_int32(seed_array[i] - seed_array[1 + (i + 30) % 55])
+                if seed_array[i] < 0:
+                    seed_array[i] += self.MBIG
+        self._inext = 0
+        self._inextp = 21
+
+    def next(self) -> int:
+        inext = self._inext + 1
+        if inext >= 56:
+            inext = 1
+        inextp = self._inextp + 1
+        if inextp >= 56:
+            inextp = 1
+        ret_val = to_int32(self._seed_array[inext] - self._seed_array[inextp])
+        if ret_val == self.MBIG:
+            ret_val -= 1
+        if ret_val < 0:
+            ret_val += self.MBIG
+        self._seed_array[inext] = ret_val
+        self._inext = inext
+        self._inextp = inextp
+        return ret_val
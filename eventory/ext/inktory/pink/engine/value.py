@@ -1,4 +1,4 @@
-from enum import IntEnum, auto
+from enum import IntEnum
 from typing import Any, Optional, TYPE_CHECKING, Tuple
 
 from .ink_list import InkList
@@ -11,13 +11,21 @@ if TYPE_CHECKING:
 
 
 class ValueType(IntEnum):
-    Int = auto
-    Float = auto
-    List = auto
-    String = auto
+    # the order is used for coercion
+    Int = 0
+    Float = 1
+    List = 2
+    String = 3
 
-    DivertTarget = auto
-    VariablePointer = auto
+    DivertTarget = 4
+    VariablePointer = 5
+
+
+def format_float(value: float) -> str:
+    # floats are printed like the single precision floats of the ink runtime
+    if value.is_integer():
+        return str(int(value))
+    return f"{value:.7g}"
 
 
 class Value(Object):
@@ -101,10 +109,13 @@ class FloatValue(Value):
         if new_type == ValueType.Int:
             return IntValue(int(self.value))
         if new_type == ValueType.String:
-            return StringValue(str(self.value))
+            return StringValue(format_float(self.value))
 
         raise self.bad_cast_exception(new_type)
 
+    def __str__(self) -> str:
+        return format_float(self.value)
+
 
 class StringValue(Value):
     value_type: ValueType = ValueType.String
@@ -133,9 +144,9 @@ class StringValue(Value):
         if new_type == self.value_type:
             return self
         if new_type == ValueType.Int:
-            if self.value.isnumeric():
+            try:
                 return IntValue(int(self.value))
-            else:
+            except ValueError:
                 return None
         if new_type == ValueType.Float:
             try:
@@ -222,14 +233,11 @@ class ListValue(Value):
         elif len(args) == 1:
             super().__init__(InkList(args[0]))
         else:
-            super().__init__(None)
+            super().__init__(InkList())
 
     @property
     def is_truthy(self) -> bool:
-        for key, value in self.value.items():
-            if value != 0:
-                return True
-        return False
+        return len(self.value) > 0
 
     def cast(self, new_type: ValueType) -> Value:
         if new_type == self.value_type:
@@ -251,7 +259,7 @@ class ListValue(Value):
             if key.is_null:
                 return StringValue("")
             else:
-                return StringValue(str(value))
+                return StringValue(str(key))
 
         raise self.bad_cast_exception(new_type)
 
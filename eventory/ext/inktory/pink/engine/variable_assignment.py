@@ -7,6 +7,7 @@ class VariableAssignment(Object):
     is_global: bool
 
     def __init__(self, variable_name: str = None, is_new_declaration: bool = False):
+        super().__init__()
         self.variable_name = variable_name
         self.is_new_declaration = is_new_declaration
         self.is_global = False
@@ -10,7 +10,7 @@ from .variable_assignment import VariableAssignment
 
 
 class Event:
-    _listeners: Set(Callable)
+    _listeners: Set[Callable]
 
     def __init__(self):
         self._listeners = set()
@@ -37,6 +37,9 @@ class VariablesState:
 
     def __init__(self, call_stack: CallStack, list_defs_origin: ListDefinitionOrigin):
         self._global_variables = {}
+        self._default_global_variables = {}
+        self._batch_observing_variable_changes = False
+        self._changed_variables = None
         self._list_defs_origin = list_defs_origin
         self.call_stack = call_stack
         self.variable_changed_event = Event()
@@ -46,8 +49,9 @@ class VariablesState:
 
     def __getitem__(self, item: str):
         value = self._global_variables.get(item)
-        value = self._default_global_variables.get(value, value)
-        return value
+        if value is None:
+            value = self._default_global_variables.get(item)
+        return value.value_object if isinstance(value, Value) else None
 
     def __setitem__(self, key, value):
         if key not in self._default_global_variables:
@@ -115,11 +119,12 @@ class VariablesState:
     def get_raw_variable_with_name(self, name: str, context_index: int) -> Object:
         if context_index == 0 or context_index == -1:
             var_value = self._global_variables.get(name)
-            if var_value:
+            if var_value is not None:
                 return var_value
-            list_item_value = self._list_defs_origin.find_single_item_list_with_name(name)
-            if list_item_value:
-                return list_item_value
+            if self._list_defs_origin:
+                list_item_value = self._list_defs_origin.find_single_item_list_with_name(name)
+                if list_item_value is not None:
+                    return list_item_value
         var_value = self.call_stack.get_temporary_variable_with_name(name, context_index)
         return var_value
 
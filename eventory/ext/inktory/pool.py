@@ -0,0 +1,80 @@
+"""Pool of ready to use Stories.
+
+Creating a Story parses the entire compiled ink which is by far the most expensive part of starting an ink Eventory. Instead of creating a new
+Story for every session, Stories which are no longer used are reset and handed to the next session.
+
+Attributes:
+    DEFAULT_POOL_SIZE (int): Default amount of unused Stories a pool keeps
+"""
+
+import logging
+import threading
+from typing import Any, Callable
+
+DEFAULT_POOL_SIZE = 8
+
+log = logging.getLogger(__name__)
+
+
+class StoryPool:
+    """A pool of Stories of the same compiled ink.
+
+    Stories are reset using Story.ResetState when they're released so they're ready to be used by the time they're acquired again.
+
+    Args:
+        factory: Callable creating a new Story
+        max_size: Amount of unused Stories the pool keeps. Stories released while the pool is full are discarded.
+
+    Attributes:
+        factory (Callable[[], Story]): Callable creating a new Story
+        max_size (int): Amount of unused Stories the pool keeps
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_size: int = DEFAULT_POOL_SIZE):
+        self.factory = factory
+        self.max_size = max_size
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<StoryPool {len(self._idle)}/{self.max_size} idle>"
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def acquire(self) -> Any:
+        """Get a Story in its initial state.
+
+        Returns:
+            Story: Unused Story from the pool or a new one if the pool is empty
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        log.debug(f"{self} empty, creating new Story")
+        return self.factory()
+
+    def release(self, story: Any):
+        """Return a Story to the pool.
+
+        The Story mustn't be used after it has been released.
+
+        Args:
+            story: Story acquired from this pool
+        """
+        with self._lock:
+            if len(self._idle) >= self.max_size:
+                return
+        try:
+            story.ResetState()
+        except Exception:
+            log.exception(f"{self} couldn't reset {story}, discarding it")
+            return
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(story)
+
+    def clear(self):
+        """Discard all unused Stories."""
+        with self._lock:
+            self._idle.clear()
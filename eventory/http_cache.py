@@ -0,0 +1,113 @@
+"""On-disk cache for Eventories downloaded over HTTP.
+
+The cache keeps the last response of every url together with its validators (the "ETag" and "Last-Modified" headers). When the url is
+requested again the validators are sent along so the server can answer with "304 Not Modified" instead of sending the entire Eventory again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from os import path
+from typing import Dict, Optional
+
+from .utils import atomic_open
+
+_ENTRY_SUFFIX = ".json"
+
+log = logging.getLogger(__name__)
+
+
+class HTTPCache:
+    """A cache for HTTP responses which can be revalidated.
+
+    Every entry is a JSON file in the directory of the cache containing the url, the validators and the body of the response.
+
+    Args:
+        directory: Directory to store the responses in. It's created when the first entry is stored.
+
+    Attributes:
+        directory (str): Directory to store the responses in
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def __repr__(self) -> str:
+        return f"<HTTPCache {self.directory}>"
+
+    def __contains__(self, url: str) -> bool:
+        return path.isfile(self._path(url))
+
+    def _path(self, url: str) -> str:
+        return path.join(self.directory, hashlib.sha256(str(url).encode("utf-8")).hexdigest() + _ENTRY_SUFFIX)
+
+    def get(self, url: str) -> Optional[dict]:
+        """Get the cached response for a url.
+
+        Args:
+            url: Url to look up
+
+        Returns:
+            Optional[dict]: Entry containing the url, the validators (etag and last_modified) and the data or None if the url isn't cached
+        """
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            log.warning(f"{self} entry for {url} is corrupted, ignoring it")
+            return None
+        if entry.get("url") != str(url):
+            return None
+        return entry
+
+    def set(self, url: str, data: str, *, etag: str = None, last_modified: str = None):
+        """Store a response.
+
+        Responses without any validators can't be revalidated so they aren't stored (and an existing entry is removed).
+
+        Args:
+            url: Url the response belongs to
+            data: Body of the response
+            etag: Value of the "ETag" header
+            last_modified: Value of the "Last-Modified" header
+        """
+        if not (etag or last_modified):
+            self.remove(url)
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        entry = dict(url=str(url), etag=etag, last_modified=last_modified, data=data)
+        with atomic_open(self._path(url), "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        log.debug(f"{self} stored response for {url}")
+
+    def remove(self, url: str):
+        """Remove the cached response for a url.
+
+        Args:
+            url: Url to remove
+        """
+        try:
+            os.remove(self._path(url))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> Dict[str, str]:
+        """Get the headers to revalidate a cached response.
+
+        Args:
+            entry: Entry returned by get
+
+        Returns:
+            Dict[str, str]: "If-None-Match" and "If-Modified-Since" headers (empty if there's no entry)
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
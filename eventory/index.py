@@ -0,0 +1,209 @@
+"""This module contains the index used by Eventorials to look up Eventories.
+
+Attributes:
+    NGRAM_SIZE (int): Length of the n-grams used for fuzzy lookups
+    FUZZY_THRESHOLD (float): Minimum similarity (between 0 and 1) of a fuzzy match
+"""
+
+import bisect
+from collections import Counter, defaultdict
+from typing import Iterable, List, Optional, Set, Tuple
+
+NGRAM_SIZE = 3
+FUZZY_THRESHOLD = .4
+
+
+def ngrams(key: str, n: int = NGRAM_SIZE) -> Set[str]:
+    """Get the n-grams of a key.
+
+    The key is padded with spaces so that short keys and the beginning and end of a key are represented as well.
+
+    Args:
+        key: Key to split
+        n: Length of the n-grams
+
+    Returns:
+        Set[str]: All n-grams of the key
+    """
+    padded = f" {key} "
+    return {padded[i:i + n] for i in range(max(len(padded) - n + 1, 1))}
+
+
+class EventoryIndex:
+    """An index mapping keys (titles, filenames and aliases) to names.
+
+    The index doesn't normalise the keys, they should be sanitised before they're added or looked up. Besides exact lookups the index supports
+    prefix lookups using a sorted list of all keys and typo-tolerant lookups using an n-gram index. The n-gram index contains the keys as well
+    as their individual words so that short queries can match a single word of a long title.
+
+    The first key of a name is its primary key. Primary keys take precedence over other keys, when a key is already taken by another name it's
+    only replaced if it's the primary key of the new name.
+    """
+
+    def __init__(self):
+        self._names = {}
+        self._keys = {}
+        self._sorted = []
+        self._terms = defaultdict(set)
+        self._ngrams = defaultdict(set)
+        self._ngram_counts = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def _add_key(self, key: str, name: str):
+        previous = self._keys.get(key)
+        if previous is not None:
+            self._names[previous].discard(key)
+        else:
+            bisect.insort(self._sorted, key)
+            for term in {key, *key.split()}:
+                if term not in self._terms:
+                    term_ngrams = ngrams(term)
+                    for ngram in term_ngrams:
+                        self._ngrams[ngram].add(term)
+                    self._ngram_counts[term] = len(term_ngrams)
+                self._terms[term].add(key)
+        self._keys[key] = name
+        self._names[name].add(key)
+
+    def _remove_key(self, key: str):
+        del self._keys[key]
+        del self._sorted[bisect.bisect_left(self._sorted, key)]
+        for term in {key, *key.split()}:
+            keys = self._terms[term]
+            keys.discard(key)
+            if keys:
+                continue
+            del self._terms[term]
+            del self._ngram_counts[term]
+            for ngram in ngrams(term):
+                terms = self._ngrams[ngram]
+                terms.discard(term)
+                if not terms:
+                    del self._ngrams[ngram]
+
+    def copy(self) -> "EventoryIndex":
+        """Create a copy of the index.
+
+        Changing the copy doesn't affect the original which allows building a new version of the index while the old one is still in use.
+
+        Returns:
+            EventoryIndex: Independent copy of the index
+        """
+        index = EventoryIndex()
+        index._names = {name: set(keys) for name, keys in self._names.items()}
+        index._keys = dict(self._keys)
+        index._sorted = list(self._sorted)
+        index._terms = defaultdict(set, ((term, set(keys)) for term, keys in self._terms.items()))
+        index._ngrams = defaultdict(set, ((ngram, set(terms)) for ngram, terms in self._ngrams.items()))
+        index._ngram_counts = dict(self._ngram_counts)
+        return index
+
+    def add(self, name: str, keys: Iterable[str]):
+        """Add a name to the index.
+
+        Args:
+            name: Name to add
+            keys: Keys which should map to the name. The first one is the primary key.
+        """
+        self._names.setdefault(name, set())
+        for i, key in enumerate(keys):
+            if not key or self._keys.get(key) == name:
+                continue
+            if i == 0 or key not in self._keys:
+                self._add_key(key, name)
+
+    def remove(self, name: str):
+        """Remove a name and all its keys from the index.
+
+        Args:
+            name: Name to remove
+
+        Raises:
+            KeyError: If the name isn't in the index
+        """
+        for key in self._names.pop(name):
+            self._remove_key(key)
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a key.
+
+        Args:
+            key: Key to look up
+
+        Returns:
+            Optional[str]: Name the key maps to or None if there's no such key
+        """
+        return self._keys.get(key)
+
+    def prefix(self, prefix: str) -> List[str]:
+        """Find all names with a key starting with prefix.
+
+        Args:
+            prefix: Prefix to look for
+
+        Returns:
+            List[str]: Names in the order of their keys
+        """
+        names = []
+        for i in range(bisect.bisect_left(self._sorted, prefix), len(self._sorted)):
+            key = self._sorted[i]
+            if not key.startswith(prefix):
+                break
+            name = self._keys[key]
+            if name not in names:
+                names.append(name)
+        return names
+
+    def fuzzy(self, query: str, *, threshold: float = FUZZY_THRESHOLD) -> List[Tuple[str, float]]:
+        """Find names with keys similar to query.
+
+        The similarity is the Dice coefficient of the n-grams of the query and the key (or one of its words).
+
+        Args:
+            query: Query to look for
+            threshold: Minimum similarity of a match
+
+        Returns:
+            List[Tuple[str, float]]: Names and their similarity, most similar first
+        """
+        query_ngrams = ngrams(query)
+        shared = Counter()
+        for ngram in query_ngrams:
+            shared.update(self._ngrams.get(ngram, ()))
+
+        scores = {}
+        for term, count in shared.items():
+            score = 2 * count / (len(query_ngrams) + self._ngram_counts[term])
+            if score < threshold:
+                continue
+            for key in self._terms[term]:
+                name = self._keys[key]
+                if score > scores.get(name, 0):
+                    scores[name] = score
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def search(self, query: str, limit: int = None) -> List[str]:
+        """Search for names.
+
+        Exact matches come first, then matches by prefix and finally fuzzy matches.
+
+        Args:
+            query: Query to search for
+            limit: Maximum amount of names to return
+
+        Returns:
+            List[str]: Names matching the query
+        """
+        results = []
+        exact = self.get(query)
+        if exact is not None:
+            results.append(exact)
+        results.extend(name for name in self.prefix(query) if name not in results)
+        if limit is None or len(results) < limit:
+            results.extend(name for name, _ in self.fuzzy(query) if name not in results)
+        return results[:limit]
@@ -3,9 +3,13 @@
 import asyncio
 import logging
 from asyncio import AbstractEventLoop
-from concurrent.futures import Executor, ThreadPoolExecutor
-from copy import deepcopy
-from typing import Any, TYPE_CHECKING
+from concurrent.futures import Executor
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+from .executor import ExecutorSession, FairExecutor, get_shared_executor
+from .requirements import get_resolved, resolve_requirements
+from .snapshots import SnapshotStore
+from .store import CopyOnWriteDict
 
 if TYPE_CHECKING:
     from .eventory import Eventory
@@ -22,24 +26,35 @@ class Eventructor:
     Args:
         eventory: Eventory to play
         narrator: Eventarrator to play to
-        executor: Specify if you wish to use a special kind of executor.
+        executor: Specify if you wish to use a special kind of executor. If not provided the executor shared by the process is used (see
+            get_shared_executor). When using a FairExecutor the Eventructor gets its own session.
+        snapshots: Store to save snapshots of the state in (see checkpoint)
+        session_id: Key of the snapshots of this session. Required when snapshots is provided.
         loop: Loop to use for async operations
 
     Attributes:
         eventory (Eventory): Eventory to play
         narrator (Eventarrator): Eventarrator to play to
-        executor (Executor): Specify if you wish to use a special kind of executor.
+        executor (Executor): Executor the Eventructor runs blocking operations in
+        snapshots (Optional[SnapshotStore]): Store to save snapshots of the state in
+        session_id (Optional[str]): Key of the snapshots of this session
         loop (AbstractEventLoop): Loop to use for async operations
     """
 
-    def __init__(self, eventory: "Eventory", narrator: "Eventarrator", *, executor: Executor = None, loop: AbstractEventLoop = None):
+    def __init__(self, eventory: "Eventory", narrator: "Eventarrator", *, executor: Executor = None, snapshots: SnapshotStore = None,
+                 session_id: str = None, loop: AbstractEventLoop = None):
+        if snapshots is not None and session_id is None:
+            raise ValueError("session_id is required to save snapshots")
         self.eventory = eventory
         self.narrator = narrator
+        self.snapshots = snapshots
+        self.session_id = session_id
 
-        self.store = deepcopy(eventory.store)
+        self.store = CopyOnWriteDict(eventory.store)
 
         self.loop = loop or asyncio.get_event_loop()
-        self.executor = executor or ThreadPoolExecutor(3, f"Eventory \"{self.title}\"")
+        executor = executor or get_shared_executor()
+        self.executor = executor.session(self) if isinstance(executor, FairExecutor) else executor
         self.init()
 
     def __getattr__(self, item):
@@ -50,6 +65,16 @@ class Eventructor:
         """Indication whether the Eventory is still running."""
         return getattr(self, "_stopped", False)
 
+    def stop(self):
+        """Stop the Eventructor.
+
+        Work the Eventructor submitted to its executor session which hasn't started yet is cancelled.
+        """
+        self._stopped = True
+        if isinstance(self.executor, ExecutorSession):
+            self.executor.shutdown(wait=False)
+        log.debug(f"{self} stopped")
+
     def init(self):
         """This method is called right after initialisation.
 
@@ -60,11 +85,40 @@ class Eventructor:
     def serialise(self) -> str:
         """Serialise the current state of the Eventructor.
 
+        The state has to be a JSON object in order to be saved in a SnapshotStore.
+
         Returns:
             str: Current state
         """
         raise NotImplementedError
 
+    def resume(self, state: str):
+        """Restore a state returned by serialise.
+
+        This has to be called before the Eventory is played.
+
+        Args:
+            state: State to restore
+        """
+        raise NotImplementedError
+
+    def checkpoint(self) -> Optional[asyncio.Future]:
+        """Save a snapshot of the current state to the snapshots store.
+
+        The snapshot is written asynchronously, there's no need to wait for it.
+
+        Returns:
+            Optional[asyncio.Future]: Future which is done when the snapshot has been written or None if there's no snapshots store
+        """
+        if self.snapshots is None:
+            return None
+        return self.snapshots.save(self.session_id, self.serialise())
+
+    async def discard_snapshot(self):
+        """Remove the snapshot of this session (i.e. because the Eventory is over)."""
+        if self.snapshots is not None:
+            await self.snapshots.remove(self.session_id)
+
     @classmethod
     def serialise_content(cls, content: Any) -> str:
         """Serialise the content of an Eventory.
@@ -77,18 +131,32 @@ class Eventructor:
         """
         return str(content)
 
+    @classmethod
+    def bundle_content(cls, content: Any) -> Dict[str, bytes]:
+        """Get the sections to store the content of an Eventory in a bundle.
+
+        The sections are turned back into the content by EventoryParser.unbundle_content.
+
+        Args:
+            content: Content to bundle
+
+        Returns:
+            Dict[str, bytes]: Data of the sections by their name. By default this is just the serialised content in the "content" section.
+        """
+        return {"content": cls.serialise_content(content).encode("utf-8")}
+
     async def ensure_requirements(self):
-        """Makes sure that all requirements are present and loaded."""
+        """Makes sure that all requirements are present and loaded.
+
+        The requirements are resolved together (see resolve_requirements) and only once per process.
+        """
         if self.global_store.get("_requirements_met"):
             log.debug("requirements already met (\"_requirements_met\" flag is set)")
             return
 
-        tasks = []
-        for requirement in self.requirements:
-            fut = self.loop.run_in_executor(self.executor, requirement.get)
-            task = asyncio.ensure_future(fut)
-            tasks.append(task)
-        modules = await asyncio.gather(*tasks, loop=self.loop)
+        modules = get_resolved(self.requirements)
+        if modules is None:
+            modules = await self.loop.run_in_executor(self.executor, resolve_requirements, self.requirements)
         for module in modules:
             self.global_store[module.__name__] = module
 
@@ -3,10 +3,96 @@
 import abc
 import sys
 from io import TextIOBase
+from typing import List, Optional
+
+
+class Turn:
+    """The output of an Eventory up to the next input.
+
+    When a turn is too long (see Eventarrator.max_turn_length) or takes too long to produce (see Eventarrator.max_turn_delay) it's split into
+    multiple parts. Lines which are too long on their own are split as well (see split_text). The choices are part of the last part unless they
+    don't fit, in which case they're spread over the last parts (using first_choice to keep the numbering). A choice which is too long on its
+    own is output as lines.
+
+    Args:
+        lines: Lines of text
+        tags: Tags of the lines
+        choices: Text of the choices the user can make
+        complete: Whether this is the last part of the turn
+        first_choice: Number of the first choice
+
+    Attributes:
+        lines (List[str]): Lines of text
+        tags (List[str]): Tags of the lines
+        choices (List[str]): Text of the choices the user can make
+        complete (bool): Whether this is the last part of the turn
+        first_choice (int): Number of the first choice
+    """
+
+    def __init__(self, lines: List[str] = None, tags: List[str] = None, choices: List[str] = None, *, complete: bool = True,
+                 first_choice: int = 1):
+        self.lines = lines or []
+        self.tags = tags or []
+        self.choices = choices or []
+        self.complete = complete
+        self.first_choice = first_choice
+
+    def __repr__(self) -> str:
+        return f"<Turn {len(self.lines)} line(s), {len(self.choices)} choice(s){'' if self.complete else ', incomplete'}>"
+
+    def __str__(self) -> str:
+        return self.text + self.choices_text
+
+    def __bool__(self) -> bool:
+        return bool(self.lines or self.choices)
+
+    @property
+    def text(self) -> str:
+        """All lines joined together."""
+        return "".join(self.lines)
+
+    @property
+    def choices_text(self) -> str:
+        """Numbered list of the choices."""
+        if not self.choices:
+            return ""
+        return "\n".join(f"{i}. {choice}" for i, choice in enumerate(self.choices, self.first_choice)) + "\n"
+
+
+def split_text(text: str, max_length: int) -> List[str]:
+    """Split text into parts which are at most max_length characters long.
+
+    The text is split after the last whitespace which fits into a part. Words longer than max_length are split wherever they have to.
+
+    Args:
+        text: Text to split
+        max_length: Maximum amount of characters of a part
+
+    Returns:
+        List[str]: Parts which joined together are the text
+    """
+    parts = []
+    while len(text) > max_length:
+        cut = max(text.rfind(" ", 0, max_length), text.rfind("\n", 0, max_length), text.rfind("\t", 0, max_length)) + 1 or max_length
+        parts.append(text[:cut])
+        text = text[cut:]
+    if text:
+        parts.append(text)
+    return parts
 
 
 class Eventarrator(metaclass=abc.ABCMeta):
-    """An Eventarrator is the output and input of an Eventructor."""
+    """An Eventarrator is the output and input of an Eventructor.
+
+    Eventructors which support it output an entire turn at once using output_turn. The thresholds below decide when a turn is split up.
+
+    Attributes:
+        max_turn_length (Optional[int]): Maximum amount of characters of a turn. None means no limit.
+        max_turn_delay (Optional[float]): Maximum amount of seconds output may be held back to be sent with the rest of its turn. None means
+            no limit.
+    """
+    max_turn_length: Optional[int] = None
+    max_turn_delay: Optional[float] = None
 
     @abc.abstractmethod
     async def output(self, out: str):
@@ -17,6 +103,18 @@ class Eventarrator(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    async def output_turn(self, turn: Turn):
+        """Output a turn.
+
+        By default the turn is output as one string using output. Override this to present the parts of a turn differently.
+
+        Args:
+            turn: Turn to output
+        """
+        out = str(turn)
+        if out:
+            await self.output(out)
+
     @abc.abstractmethod
     async def input(self) -> str:
         """Method to receive input from the user.
@@ -3,26 +3,36 @@
 Attributes:
     HEAD_DELIMITER (Pattern): Regex to separate head from content
     PARSER_MAP (List[Tuple[Type[EventoryParser], Sequence[str]]]: A list of tuples of parsers and their aliases used by the find_parser function.
+    HEAD_DECODERS (List[Tuple[Callable[[str], Any], Callable[[str], bool]]]): A list of tuples of head decoders and the checks deciding whether
+        they should be used. Used by the decode_head function before falling back to YAML.
+    YAML_LOADER (Type[yaml.BaseLoader]): Loader used to decode YAML heads. This is the C implementation if libyaml is available.
 """
 
 import abc
-import importlib
+import asyncio
+import inspect
+import json
 import logging
 import re
-import subprocess
-from io import TextIOBase
+from asyncio import AbstractEventLoop
+from functools import partial
+from io import BufferedIOBase, RawIOBase, TextIOBase
 from types import ModuleType
-from typing import Any, Dict, Mapping, Sequence, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Type, Union
 
 import yaml
 
+from .bundle import Bundle
 from .eventory import Eventory, EventoryMeta
 from .exceptions import EventoryNoParserFound, EventoryParserHeadError, EventoryParserKeyError, EventoryParserValueError, MalformattedEventory
 from .instructor import Eventructor
+from .requirements import resolve_requirements
 
 _DEFAULT = object()
 HEAD_DELIMITER = re.compile(r"^-{3,}$", re.MULTILINE)
 PARSER_MAP = []
+HEAD_DECODERS = []
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 log = logging.getLogger(__name__)
 
@@ -66,6 +76,51 @@ def find_parser(targets: Union[str, Sequence[str]], default=_DEFAULT) -> "Evento
         raise EventoryNoParserFound(f"Couldn't find a parser for \"{targets}\"")
 
 
+def register_head_decoder(decoder: Callable[[str], Any], check: Callable[[str], bool]):
+    """Register a decoder for the head of Eventories.
+
+    The decoders are tried in reverse order of registration. A decoder is only used if check returns True for the raw head and if it raises a
+    ValueError the next one is tried. When no decoder could decode the head it's parsed as YAML.
+
+    Args:
+        decoder: Function taking the raw head and returning the decoded head
+        check: Function taking the raw head and returning whether the decoder should be used
+    """
+    HEAD_DECODERS.insert(0, (decoder, check))
+    log.info(f"registered head decoder {decoder}")
+
+
+def decode_head(head: str) -> Any:
+    """Decode the raw head of an Eventory.
+
+    Uses the first fitting decoder in HEAD_DECODERS and falls back to YAML (using YAML_LOADER).
+
+    Args:
+        head: Raw head
+
+    Returns:
+        Any: Decoded head
+
+    Raises:
+        yaml.YAMLError: When the head couldn't be parsed as YAML
+    """
+    for decoder, check in HEAD_DECODERS:
+        if check(head):
+            try:
+                return decoder(head)
+            except ValueError:
+                log.debug(f"{decoder} couldn't decode head, trying the next one")
+    return yaml.load(head, Loader=YAML_LOADER)
+
+
+def _is_json_object(head: str) -> bool:
+    return head.lstrip().startswith("{")
+
+
+# JSON is valid YAML but much faster to decode
+register_head_decoder(json.loads, _is_json_object)
+
+
 class Eventoriment:
     """Wraps a requirement for an Eventory.
 
@@ -85,32 +140,42 @@ class Eventoriment:
     def __repr__(self) -> str:
         return f"<Eventoriment \"{self.package}\""
 
+    @classmethod
+    def from_dict(cls, data: Union[str, Mapping[str, Any]]) -> "Eventoriment":
+        """Create an Eventoriment from its dictionary representation.
+
+        Args:
+            data: Either the name of the package or a dictionary as returned by to_dict
+
+        Returns:
+            Eventoriment
+        """
+        if isinstance(data, Mapping):
+            return cls(**data)
+        else:
+            return cls(data)
+
     def to_dict(self) -> Union[str, Dict[str, Any]]:
         """Get a dictionary representation for this Eventoriment.
 
         Returns:
             Union[str, Dict[str, Any]]: If the source is the same as the package it just returns the package, otherwise it returns both.
         """
-        if self.package is not self.source:
-            return vars(self)
+        if self.package != self.source:
+            return dict(vars(self))
         else:
             return self.package
 
     def get(self) -> ModuleType:
         """Get this module.
 
-        If it's not already installed, the package is installed using pip.
+        If it's not already installed, the package is installed using pip. Use resolve_requirements (requirements module) to resolve multiple
+        requirements at once.
 
         Returns:
             ModuleType: The module specified
         """
-        try:
-            return importlib.import_module(self.package)
-        except ModuleNotFoundError:
-            log.debug(f"{self} not installed, installing...")
-            subprocess.run(["pip", "install", self.source], check=True)
-            log.debug(f"installed {self}!")
-            return importlib.import_module(self.package)
+        return resolve_requirements([self])[0]
 
 
 class EventoryParser(metaclass=abc.ABCMeta):
@@ -159,33 +224,58 @@ class EventoryParser(metaclass=abc.ABCMeta):
                 "description": meta.get("description", None),
                 "author": meta.get("author", None),
                 "version": int(meta.get("version", 1)),
-                "requirements": [Eventoriment(requirement) for requirement in meta.get("requirements", [])]
+                "requirements": [Eventoriment.from_dict(requirement) for requirement in meta.get("requirements", [])]
             }
         except KeyError as e:
             raise EventoryParserKeyError(e.args[0])
         except ValueError:
             raise EventoryParserValueError("version", meta["version"])
-        else:
-            return data
 
-    def parse_head(self, head: str) -> Tuple[EventoryMeta, dict]:
+        aliases = meta.get("aliases") or []
+        if isinstance(aliases, str):
+            aliases = [aliases]
+        elif not isinstance(aliases, Sequence):
+            raise EventoryParserValueError("aliases", aliases, "Aliases need to be a list!")
+        data["aliases"] = [str(alias) for alias in aliases]
+        return data
+
+    @classmethod
+    def decode_head(cls, head: str) -> Mapping:
+        """Decode the raw head of an Eventory file.
+
+        Args:
+            head: Raw head
+
+        Returns:
+            Mapping: Decoded head
+
+        Raises:
+            EventoryParserHeadError: When the head couldn't be parsed or isn't a mapping
+        """
+        try:
+            data = decode_head(head)
+        except yaml.YAMLError as e:
+            raise EventoryParserHeadError("Couldn't parse Eventory head!") from e
+        if not isinstance(data, Mapping):
+            raise EventoryParserHeadError("Eventory head needs to be an Object!")
+        return data
+
+    def parse_head(self, head: Union[str, Mapping]) -> Tuple[EventoryMeta, dict]:
         """Parse the raw head of an Eventory file.
 
         Args:
-            head: Head part of the
+            head: Head part of the Eventory. Either the raw text or the already decoded mapping.
 
         Returns:
-            Tuple[EventoryMeta, dict]:
+            Tuple[EventoryMeta, dict]: The meta and the keyword arguments for the Eventory (parser, store, global_store and options)
 
         Raises:
             EventoryParserHeadError: When the head couldn't be parsed as YAML
             EventoryParserKeyError: When the head doesn't contain a meta tag
             EventoryParserValueError: When the meta key doesn't contain the correct value
         """
-        try:
-            head = yaml.load(head)
-        except yaml.YAMLError as e:
-            raise EventoryParserHeadError("Couldn't parse Eventory head!") from e
+        if isinstance(head, str):
+            head = self.decode_head(head)
 
         raw_meta = head.get("meta")
         if not raw_meta:
@@ -194,9 +284,11 @@ class EventoryParser(metaclass=abc.ABCMeta):
             raise EventoryParserValueError("meta", raw_meta, "Meta needs to be an Object!")
 
         meta = EventoryMeta(**self.extend_meta(raw_meta))
+        parser = head.get("parser") or type(self).__name__
         store = head.get("store")
         global_store = head.get("global_store")
-        return meta, dict(store=store, global_store=global_store)
+        options = head.get("options")
+        return meta, dict(parser=parser, store=store, global_store=global_store, options=options)
 
     @staticmethod
     @abc.abstractmethod
@@ -204,11 +296,64 @@ class EventoryParser(metaclass=abc.ABCMeta):
         """Parse the raw content into a form usable by the Eventructor."""
         raise NotImplementedError
 
+    async def parse_content_async(self, content: Any, *, loop: AbstractEventLoop = None) -> Any:
+        """Parse the raw content without blocking the loop.
+
+        By default this runs parse_content in the default executor of the loop. Parsers which need to do I/O (like running external programs)
+        should override this method.
+
+        Args:
+            content: Raw content to parse
+            loop: Loop to use. Uses asyncio.get_event_loop() if not specified.
+
+        Returns:
+            Any: Content usable by the Eventructor
+        """
+        loop = loop or asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.parse_content, content)
+
+    def unbundle_content(self, sections: Mapping[str, bytes]) -> Any:
+        """Turn the sections of a bundle back into the content.
+
+        This is the counterpart to Eventructor.bundle_content. By default the "content" section is parsed using parse_content. Parsers
+        whose Eventructor stores the already parsed content should override this method so the content isn't parsed again.
+
+        Args:
+            sections: Data of the sections by their name
+
+        Returns:
+            Any: Content usable by the Eventructor
+        """
+        return self.parse_content(sections["content"].decode("utf-8"))
+
+    def parse_contents(self, contents: Sequence[Any], *, return_exceptions: bool = False) -> List[Any]:
+        """Parse multiple raw contents at once.
+
+        By default this just calls parse_content for every content. Parsers which can handle many contents more efficiently in one go (for
+        example by compiling them together) should override this method.
+
+        Args:
+            contents: Raw contents to parse
+            return_exceptions: If True exceptions are returned in place of the content that caused them instead of being raised
+
+        Returns:
+            List[Any]: Parsed contents in the same order as contents
+        """
+        results = []
+        for content in contents:
+            try:
+                results.append(self.parse_content(content))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
     @classmethod
     def preload(cls, stream: Union[str, TextIOBase]) -> Tuple[str, str]:
         """Read data from stream and split into head, content.
 
-        This is just a wrapper around split.
+        Strings are split using split, streams are read using read_head so the head is found without searching through the entire content.
 
         Args:
             stream: Stream to read data from
@@ -217,13 +362,45 @@ class EventoryParser(metaclass=abc.ABCMeta):
             Tuple[str, str]: Head and content separated.
 
         Raises:
-            TODO
+            MalformattedEventory: When the data can't be split into head and content
         """
         if isinstance(stream, TextIOBase):
-            data = stream.read()
+            head, content = read_head(stream)
+            return head, content + stream.read()
         else:
-            data = stream
-        return cls.split(data)
+            return cls.split(stream)
+
+    def build(self, head: Union[str, Mapping], content: Any, instructor: Type[Eventructor] = None) -> Eventory:
+        """Create an Eventory from its head and raw content.
+
+        Args:
+            head: Head of the Eventory. Either the raw text or the already decoded mapping.
+            content: Raw content of the Eventory
+            instructor: Override the default instructor chosen by the EventoryParser
+
+        Returns:
+            Eventory: Final Eventory
+        """
+        meta, kwargs = self.parse_head(head)
+        content = self.parse_content(content)
+        return Eventory(meta, content, instructor or self.instructor, **kwargs)
+
+    async def build_async(self, head: Union[str, Mapping], content: Any, instructor: Type[Eventructor] = None, *,
+                          loop: AbstractEventLoop = None) -> Eventory:
+        """Asynchronous version of build which uses parse_content_async to parse the content.
+
+        Args:
+            head: Head of the Eventory. Either the raw text or the already decoded mapping.
+            content: Raw content of the Eventory
+            instructor: Override the default instructor chosen by the EventoryParser
+            loop: Loop to use. Uses asyncio.get_event_loop() if not specified.
+
+        Returns:
+            Eventory: Final Eventory
+        """
+        meta, kwargs = self.parse_head(head)
+        content = await self.parse_content_async(content, loop=loop)
+        return Eventory(meta, content, instructor or self.instructor, **kwargs)
 
     def load(self, stream: Union[str, TextIOBase], instructor: Type[Eventructor] = None) -> Eventory:
         """Load data from the stream and parse it into an Eventory.
@@ -239,9 +416,128 @@ class EventoryParser(metaclass=abc.ABCMeta):
             TODO
         """
         head, content = self.preload(stream)
-        meta, kwargs = self.parse_head(head)
-        content = self.parse_content(content)
-        return Eventory(meta, content, instructor or self.instructor, **kwargs)
+        return self.build(head, content, instructor)
+
+    async def load_async(self, stream: Union[str, TextIOBase], instructor: Type[Eventructor] = None, *,
+                         loop: AbstractEventLoop = None) -> Eventory:
+        """Asynchronous version of load which uses parse_content_async to parse the content.
+
+        Args:
+            stream: Stream to load from
+            instructor: Override the default instructor chosen by the EventoryParser
+            loop: Loop to use. Uses asyncio.get_event_loop() if not specified.
+
+        Returns:
+            Eventory: Final Eventory
+        """
+        head, content = self.preload(stream)
+        return await self.build_async(head, content, instructor, loop=loop)
+
+
+def read_head(stream: TextIOBase) -> Tuple[str, str]:
+    """Read the head of an Eventory from a stream.
+
+    The stream is only read up to the line closing the head so the content can be read afterwards (or not at all). If the head isn't enclosed
+    by two delimiters, everything before the only delimiter is the head and the stream is read until the end.
+
+    Args:
+        stream: Stream to read from
+
+    Returns:
+        Tuple[str, str]: The head and the part of the content that has already been read from the stream
+
+    Raises:
+        MalformattedEventory: When there's no head delimiter in the stream
+    """
+    before = []
+    line = stream.readline()
+    while line:
+        match = HEAD_DELIMITER.match(line)
+        if match:
+            break
+        before.append(line)
+        line = stream.readline()
+    else:
+        raise MalformattedEventory("Can't split into head and content parts!")
+
+    head = [line[match.end():]]
+    line = stream.readline()
+    while line:
+        match = HEAD_DELIMITER.match(line)
+        if match:
+            return "".join(head), line[match.end():]
+        head.append(line)
+        line = stream.readline()
+    return "".join(before), "".join(head)
+
+
+def _accepted_options(cls: Type[EventoryParser]) -> Optional[Set[str]]:
+    if cls.__init__ is object.__init__:
+        return set()
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    if any(parameter.kind == parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    return {parameter.name for parameter in parameters if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)}
+
+
+def parser_options(cls: Type[EventoryParser], head: Mapping, kwargs: Mapping[str, Any]) -> Dict[str, Any]:
+    """Get the keyword arguments to create a parser for an Eventory with.
+
+    The options stored in the head of the Eventory (see Eventory.options) are combined with kwargs, which take precedence. Only the options the
+    parser accepts are kept so options meant for other parsers (i.e. when loading Eventories of different parsers at once) are ignored.
+
+    Args:
+        cls: Class of the parser
+        head: Decoded head of the Eventory
+        kwargs: Keyword arguments the Eventory is loaded with
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for the parser
+    """
+    options = {**(head.get("options") or {}), **kwargs}
+    accepted = _accepted_options(cls)
+    if accepted is not None:
+        ignored = [key for key in options if key not in accepted]
+        if ignored:
+            log.debug(f"{cls} doesn't accept the option(s) {ignored}, ignoring them")
+            options = {key: value for key, value in options.items() if key in accepted}
+    return options
+
+
+def _with_options(head: Mapping, options: Mapping[str, Any]) -> Mapping:
+    head = dict(head)
+    if options:
+        head["options"] = dict(options)
+    else:
+        head.pop("options", None)
+    return head
+
+
+def create_parser(cls: Type[EventoryParser], head: Mapping, **kwargs) -> Tuple[EventoryParser, Mapping]:
+    """Create a parser for an Eventory using the options in its head (see parser_options).
+
+    Args:
+        cls: Class of the parser
+        head: Decoded head of the Eventory
+        **kwargs: Keyword arguments the Eventory is loaded with
+
+    Returns:
+        Tuple[EventoryParser, Mapping]: The parser and the head containing the options it was created with, so they're stored with the Eventory
+    """
+    options = parser_options(cls, head, kwargs)
+    return cls(**options), _with_options(head, options)
+
+
+def _prepare(stream: Union[str, TextIOBase], parser: Type[EventoryParser] = None) -> Tuple[Type[EventoryParser], Mapping, str]:
+    head, content = EventoryParser.preload(stream)
+    head = EventoryParser.decode_head(head)
+    if not parser:
+        parser = find_parser(head.get("parser"))
+    return parser, head, content
+
+
+def _is_binary(stream: Any) -> bool:
+    return isinstance(stream, (bytes, bytearray, memoryview, BufferedIOBase, RawIOBase))
 
 
 def load_data(stream: Union[str, TextIOBase]) -> str:
@@ -278,11 +574,190 @@ def load(stream: Union[str, TextIOBase], *, parser: Type[EventoryParser] = None,
     Raises:
         TODO
     """
-    data = load_data(stream)
+    if _is_binary(stream):
+        return load_bundle(stream, parser=parser, instructor=instructor, **kwargs)
+    parser, head, content = _prepare(stream, parser)
+    instance, head = create_parser(parser, head, **kwargs)
+    return instance.build(head, content, instructor)
+
+
+def load_content(location: str, parser: EventoryParser) -> Any:
+    """Load only the content of an Eventory file.
+
+    Args:
+        location: Path to the file to load
+        parser: Parser used to parse the content
+
+    Returns:
+        Any: Parsed content
+    """
+    with open(location, "r", encoding="utf-8") as f:
+        _, content = parser.preload(f)
+    return parser.parse_content(content)
+
+
+def load_lazy(location: str, *, parser: Type[EventoryParser] = None, instructor: Type[Eventructor] = None, head: Mapping = None,
+              **kwargs) -> Eventory:
+    """Load a lazy Eventory from a file.
+
+    Only the head of the Eventory is read and parsed. The content is read from the file and parsed the first time it's accessed.
+
+    Args:
+        location: Path to the file to load
+        parser: Override the parser used to parse the data. If not provided the function tries to determine the correct parser based on the head of
+            the Eventory.
+        instructor: Specify to override the instructor specified by the parser
+        head: The already decoded head of the file. If provided the file isn't opened until the content is needed.
+
+    Returns:
+        Eventory: Lazy Eventory
+    """
+    if head is None:
+        with open(location, "r", encoding="utf-8") as f:
+            head, _ = read_head(f)
+        head = EventoryParser.decode_head(head)
 
     if not parser:
-        head, content = EventoryParser.preload(data)
-        head = yaml.load(head)
         parser = find_parser(head.get("parser"))
 
-    return parser(**kwargs).load(data, instructor)
+    instance, head = create_parser(parser, head, **kwargs)
+    meta, head_kwargs = instance.parse_head(head)
+    return Eventory(meta, None, instructor or instance.instructor, content_loader=partial(load_content, location, instance), **head_kwargs)
+
+
+def load_bundle_content(location: str, parser: EventoryParser) -> Any:
+    """Load only the content of a bundle file.
+
+    Args:
+        location: Path to the bundle
+        parser: Parser used to unbundle the content
+
+    Returns:
+        Any: Content
+    """
+    with Bundle.open(location) as bundle:
+        return parser.unbundle_content(bundle.read_all())
+
+
+def load_bundle(source: Union[str, bytes, BufferedIOBase], *, parser: Type[EventoryParser] = None, instructor: Type[Eventructor] = None,
+                lazy: bool = False, head: Mapping = None, **kwargs) -> Eventory:
+    """Load an Eventory from a binary bundle.
+
+    Args:
+        source: Path to the bundle, the data of the bundle or a binary stream to read it from. Files are memory-mapped.
+        parser: Override the parser used to unbundle the content. If not provided the function uses the parser stored in the bundle.
+        instructor: Specify to override the instructor specified by the parser
+        lazy: Only read the head of the bundle and load the content the first time it's accessed. Only possible if source is a path.
+        head: The already decoded head of the bundle. If provided (and lazy is True) the file isn't opened until the content is needed.
+
+    Returns:
+        Eventory: Eventory loaded from the bundle
+
+    Raises:
+        MalformattedEventory: When the source isn't a valid bundle
+    """
+    if isinstance(source, str):
+        if lazy and head is not None:
+            bundle = None
+        else:
+            bundle = Bundle.open(source)
+    else:
+        if isinstance(source, (BufferedIOBase, RawIOBase)):
+            source = source.read()
+        bundle = Bundle(source)
+        lazy = False
+
+    try:
+        if head is None:
+            head = bundle.head
+        if not parser:
+            parser = find_parser(head.get("parser"))
+        instance, head = create_parser(parser, head, **kwargs)
+        meta, head_kwargs = instance.parse_head(head)
+        if lazy:
+            return Eventory(meta, None, instructor or instance.instructor, content_loader=partial(load_bundle_content, source, instance),
+                            **head_kwargs)
+        content = instance.unbundle_content(bundle.read_all())
+        return Eventory(meta, content, instructor or instance.instructor, **head_kwargs)
+    finally:
+        if bundle is not None:
+            bundle.close()
+
+
+def load_many(streams: Sequence[Union[str, TextIOBase]], *, parser: Type[EventoryParser] = None, instructor: Type[Eventructor] = None,
+              return_exceptions: bool = False, **kwargs) -> List[Union[Eventory, Exception]]:
+    """Load multiple Eventories at once.
+
+    The Eventories are grouped by their parser (and its options) and the contents of each group are parsed together using
+    EventoryParser.parse_contents. This allows parsers to do expensive work (like compiling) in bulk. The keyword arguments are only passed to
+    the parsers which accept them (see parser_options).
+
+    Args:
+        streams: Streams to read from
+        parser: Override the parser used to parse the data. If not provided the function tries to determine the correct parser based on the head of
+            each Eventory.
+        instructor: Specify to override the instructor specified by the parser
+        return_exceptions: If True exceptions are returned in place of the Eventory that caused them instead of being raised
+
+    Returns:
+        List[Union[Eventory, Exception]]: Eventories in the same order as streams
+    """
+    results = [None] * len(streams)
+    groups = {}
+    for i, stream in enumerate(streams):
+        try:
+            if _is_binary(stream):
+                results[i] = load_bundle(stream, parser=parser, instructor=instructor, **kwargs)
+                continue
+            cls, head, content = _prepare(stream, parser)
+            options = parser_options(cls, head, kwargs)
+            # Eventories are only parsed together if their parsers have the same options
+            key = (cls, json.dumps(options, sort_keys=True, default=repr))
+            if key not in groups:
+                groups[key] = (cls(**options), [])
+            instance, entries = groups[key]
+            meta, head_kwargs = instance.parse_head(_with_options(head, options))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results[i] = e
+        else:
+            entries.append((i, meta, head_kwargs, content))
+
+    for instance, entries in groups.values():
+        contents = instance.parse_contents([content for *_, content in entries], return_exceptions=return_exceptions)
+        for (i, meta, head_kwargs, _), content in zip(entries, contents):
+            if isinstance(content, Exception):
+                results[i] = content
+            else:
+                results[i] = Eventory(meta, content, instructor or instance.instructor, **head_kwargs)
+    return results
+
+
+async def load_async(stream: Union[str, TextIOBase], *, parser: Type[EventoryParser] = None, instructor: Type[Eventructor] = None,
+                     loop: AbstractEventLoop = None, head: Mapping = None, **kwargs) -> Eventory:
+    """Asynchronous version of load.
+
+    The content is parsed using EventoryParser.load_async so that expensive operations (like compiling) don't block the loop.
+
+    Args:
+        stream: Stream to read from
+        parser: Override the parser used to parse the data. If not provided the function tries to determine the correct parser based on the head of
+            the Eventory.
+        instructor: Specify to override the instructor specified by the parser
+        loop: Loop to use. Uses asyncio.get_event_loop() if not specified.
+        head: The already decoded head of the Eventory. If provided the stream only contains the content.
+
+    Returns:
+        Eventory: Eventory loaded from the stream
+    """
+    if _is_binary(stream):
+        loop = loop or asyncio.get_event_loop()
+        return await loop.run_in_executor(None, partial(load_bundle, stream, parser=parser, instructor=instructor, **kwargs))
+    if head is None:
+        parser, head, content = _prepare(stream, parser)
+    else:
+        content = load_data(stream)
+        parser = parser or find_parser(head.get("parser"))
+    instance, head = create_parser(parser, head, **kwargs)
+    return await instance.build_async(head, content, instructor, loop=loop)
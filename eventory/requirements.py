@@ -0,0 +1,96 @@
+"""This module resolves the requirements (Eventoriments) of Eventories.
+
+Requirements are checked using importlib.util.find_spec which doesn't import anything. All missing packages are installed using a single
+invocation of pip and every requirement is only resolved once per process.
+
+Attributes:
+    RESOLVED_REQUIREMENTS (Dict[str, ModuleType]): Modules of the requirements which have already been resolved by their package name
+    PIP_CMD (List[str]): Command used to run pip
+"""
+
+import importlib
+import importlib.util
+import logging
+import subprocess
+import sys
+import threading
+from types import ModuleType
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .parser import Eventoriment
+
+RESOLVED_REQUIREMENTS = {}
+PIP_CMD = [sys.executable, "-m", "pip"]
+_resolve_lock = threading.Lock()
+
+log = logging.getLogger(__name__)
+
+
+def is_available(package: str) -> bool:
+    """Check whether a package can be imported without importing it.
+
+    Args:
+        package: Name of the package (may be dotted)
+
+    Returns:
+        bool: True if the package is available
+    """
+    if package in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        # find_spec imports the parent of dotted names which might not exist
+        return False
+
+
+def get_resolved(requirements: Sequence["Eventoriment"]) -> Optional[List[ModuleType]]:
+    """Get the modules of requirements if all of them have already been resolved.
+
+    Args:
+        requirements: Requirements to look up
+
+    Returns:
+        Optional[List[ModuleType]]: The modules in the same order as requirements or None if at least one of them hasn't been resolved yet
+    """
+    modules = []
+    for requirement in requirements:
+        module = RESOLVED_REQUIREMENTS.get(requirement.package)
+        if module is None:
+            return None
+        modules.append(module)
+    return modules
+
+
+def resolve_requirements(requirements: Sequence["Eventoriment"]) -> List[ModuleType]:
+    """Make sure requirements are installed and import them.
+
+    Missing packages are installed using one pip invocation. The result is stored in RESOLVED_REQUIREMENTS so the work isn't repeated.
+
+    Args:
+        requirements: Requirements to resolve
+
+    Returns:
+        List[ModuleType]: The modules in the same order as requirements
+
+    Raises:
+        subprocess.CalledProcessError: When pip couldn't install the missing packages
+    """
+    modules = get_resolved(requirements)
+    if modules is not None:
+        return modules
+
+    with _resolve_lock:
+        pending = [requirement for requirement in requirements if requirement.package not in RESOLVED_REQUIREMENTS]
+        missing = [requirement for requirement in pending if not is_available(requirement.package)]
+        if missing:
+            sources = list(dict.fromkeys(requirement.source for requirement in missing))
+            log.debug(f"installing {len(sources)} missing requirement(s): {sources}")
+            subprocess.run([*PIP_CMD, "install", *sources], check=True)
+            importlib.invalidate_caches()
+            log.debug(f"installed {sources}!")
+        for requirement in pending:
+            RESOLVED_REQUIREMENTS[requirement.package] = importlib.import_module(requirement.package)
+
+    return [RESOLVED_REQUIREMENTS[requirement.package] for requirement in requirements]
@@ -0,0 +1,258 @@
+"""This module contains the store used to persist the state of running Eventructors.
+
+A snapshot is the serialised state of an Eventructor (see Eventructor.serialise) which must be a JSON object. The first snapshot of a session is
+written in full. While the last full snapshot is recent, the following snapshots only append the parts which changed to the journal of the
+session. Once the full snapshot is too old or the journal too long, a new full snapshot replaces both of them.
+
+Snapshots are written in an executor. A session never has more than one write in progress, when a session saves a new snapshot while the previous
+one is still being written, only the newest snapshot is written afterwards.
+
+Attributes:
+    SNAPSHOT_SUFFIX (str): File ending of full snapshots
+    JOURNAL_SUFFIX (str): File ending of the journals containing the changes since the last full snapshot
+    FULL_SNAPSHOT_INTERVAL (float): Seconds after which a full snapshot is written instead of only the changes
+    MAX_JOURNAL_ENTRIES (int): Amount of changes a journal may contain before a full snapshot is written
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import Executor
+from os import path
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import quote, unquote
+
+from .utils import atomic_open
+
+SNAPSHOT_SUFFIX = ".snapshot"
+JOURNAL_SUFFIX = ".journal"
+FULL_SNAPSHOT_INTERVAL = 60
+MAX_JOURNAL_ENTRIES = 50
+
+log = logging.getLogger(__name__)
+
+
+def _diff(old: dict, new: dict, keys: tuple, changes: list, removals: list):
+    for key, value in new.items():
+        if key not in old:
+            changes.append([[*keys, key], value])
+            continue
+        previous = old[key]
+        if isinstance(previous, dict) and isinstance(value, dict):
+            _diff(previous, value, (*keys, key), changes, removals)
+        elif type(previous) is not type(value) or previous != value:
+            changes.append([[*keys, key], value])
+    for key in old:
+        if key not in new:
+            removals.append([*keys, key])
+
+
+def diff(old: Dict[str, Any], new: Dict[str, Any]) -> Optional[Dict[str, list]]:
+    """Get the changes between two JSON objects.
+
+    Nested objects are compared key by key, all other values are replaced entirely when they differ.
+
+    Args:
+        old: Previous version
+        new: Current version
+
+    Returns:
+        Optional[Dict[str, list]]: The changes which turn old into new (see patch) or None if they're equal
+    """
+    changes, removals = [], []
+    _diff(old, new, (), changes, removals)
+    if not (changes or removals):
+        return None
+    return {"set": changes, "del": removals}
+
+
+def _walk(data: dict, keys: Sequence[str]) -> dict:
+    for key in keys:
+        data = data.setdefault(key, {})
+    return data
+
+
+def patch(data: Dict[str, Any], delta: Dict[str, list]) -> Dict[str, Any]:
+    """Apply changes returned by diff.
+
+    Args:
+        data: JSON object to change in place
+        delta: Changes to apply
+
+    Returns:
+        Dict[str, Any]: data
+    """
+    for keys in delta.get("del", ()):
+        _walk(data, keys[:-1]).pop(keys[-1], None)
+    for keys, value in delta.get("set", ()):
+        _walk(data, keys[:-1])[keys[-1]] = value
+    return data
+
+
+class _Saved:
+    __slots__ = ("data", "written_at", "entries")
+
+    def __init__(self, data: dict, written_at: float):
+        self.data = data
+        self.written_at = written_at
+        self.entries = 0
+
+
+class SnapshotStore:
+    """Stores the snapshots of Eventructors in a directory.
+
+    Example:
+        Saving and resuming a session::
+
+            instructor = eventory.narrate(narrator, snapshots=snapshots, session_id="some id")
+            ...
+            # after a restart
+            state = snapshots.load("some id")
+            instructor = eventory.narrate(narrator, snapshots=snapshots, session_id="some id")
+            instructor.resume(state)
+
+    Args:
+        directory: Directory to store the snapshots in. It's created if it doesn't exist.
+        executor: Executor to write the snapshots in. Uses the default executor of the loop if not provided.
+        full_interval: Seconds after which a full snapshot is written instead of only the changes
+        max_journal_entries: Amount of changes a journal may contain before a full snapshot is written
+        loop: Loop to use for async operations
+
+    Attributes:
+        directory (str): Directory to store the snapshots in
+        executor (Optional[Executor]): Executor to write the snapshots in
+        full_interval (float): Seconds after which a full snapshot is written instead of only the changes
+        max_journal_entries (int): Amount of changes a journal may contain before a full snapshot is written
+        loop (AbstractEventLoop): Loop to use for async operations
+    """
+
+    def __init__(self, directory: str, *, executor: Executor = None, full_interval: float = FULL_SNAPSHOT_INTERVAL,
+                 max_journal_entries: int = MAX_JOURNAL_ENTRIES, loop=None):
+        self.directory = directory
+        self.executor = executor
+        self.full_interval = full_interval
+        self.max_journal_entries = max_journal_entries
+        self.loop = loop or asyncio.get_event_loop()
+        os.makedirs(directory, exist_ok=True)
+
+        self._saved = {}
+        self._pending = {}
+        self._writers = {}
+
+    def __repr__(self) -> str:
+        return f"<SnapshotStore {self.directory}>"
+
+    def _path(self, key: str, suffix: str) -> str:
+        return path.join(self.directory, quote(key, safe="") + suffix)
+
+    def keys(self) -> List[str]:
+        """Get the keys of all sessions with a snapshot.
+
+        Returns:
+            List[str]: Keys of the sessions
+        """
+        return [unquote(filename[:-len(SNAPSHOT_SUFFIX)]) for filename in os.listdir(self.directory) if filename.endswith(SNAPSHOT_SUFFIX)]
+
+    def save(self, key: str, state: str) -> asyncio.Future:
+        """Save a snapshot of a session without waiting for it to be written.
+
+        Args:
+            key: Key of the session
+            state: Serialised state of the session (a JSON object)
+
+        Returns:
+            asyncio.Future: Future which is done when the snapshot has been written
+        """
+        self._pending[key] = state
+        writer = self._writers.get(key)
+        if writer is None or writer.done():
+            writer = self._writers[key] = asyncio.ensure_future(self._write_pending(key), loop=self.loop)
+        return writer
+
+    async def _write_pending(self, key: str):
+        while key in self._pending:
+            state = self._pending.pop(key)
+            try:
+                await self.loop.run_in_executor(self.executor, self._write, key, state)
+            except Exception:
+                log.exception(f"{self} couldn't write snapshot of {key}")
+
+    def _write(self, key: str, state: str):
+        data = json.loads(state)
+        saved = self._saved.get(key)
+        now = time.monotonic()
+        if saved is None or saved.entries >= self.max_journal_entries or now - saved.written_at >= self.full_interval:
+            # the journal only applies to the previous snapshot, it has to be gone before the new one is in place
+            try:
+                os.remove(self._path(key, JOURNAL_SUFFIX))
+            except FileNotFoundError:
+                pass
+            with atomic_open(self._path(key, SNAPSHOT_SUFFIX), encoding="utf-8") as f:
+                f.write(state)
+            self._saved[key] = _Saved(data, now)
+            log.debug(f"{self} wrote full snapshot of {key}")
+            return
+
+        delta = diff(saved.data, data)
+        if delta is None:
+            return
+        with open(self._path(key, JOURNAL_SUFFIX), "a", encoding="utf-8") as f:
+            f.write(json.dumps(delta, separators=(",", ":")) + "\n")
+        saved.data = data
+        saved.entries += 1
+
+    def load(self, key: str) -> Optional[str]:
+        """Load the latest snapshot of a session.
+
+        A change which was only partially written (i.e. because the process died) is ignored.
+
+        Args:
+            key: Key of the session
+
+        Returns:
+            Optional[str]: Serialised state of the session or None if there's no snapshot
+        """
+        try:
+            with open(self._path(key, SNAPSHOT_SUFFIX), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        try:
+            with open(self._path(key, JOURNAL_SUFFIX), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        delta = json.loads(line)
+                    except json.JSONDecodeError:
+                        log.warning(f"{self} ignoring incomplete change in the journal of {key}")
+                        break
+                    patch(data, delta)
+        except FileNotFoundError:
+            pass
+        return json.dumps(data)
+
+    async def remove(self, key: str):
+        """Remove the snapshot of a session.
+
+        Waits for the write in progress (if any) to finish first.
+
+        Args:
+            key: Key of the session
+        """
+        self._pending.pop(key, None)
+        writer = self._writers.pop(key, None)
+        if writer is not None:
+            await writer
+        self._saved.pop(key, None)
+        for suffix in (SNAPSHOT_SUFFIX, JOURNAL_SUFFIX):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+
+    async def flush(self):
+        """Wait until all saved snapshots have been written."""
+        writers = [writer for writer in self._writers.values() if not writer.done()]
+        if writers:
+            await asyncio.wait(writers)
@@ -0,0 +1,208 @@
+"""This module contains the SQLite storage Eventorials can use instead of a directory.
+
+Multiple processes (or machines sharing a local disk) can use the same database. The database is used in WAL mode so readers don't block the
+writer and vice versa. Every change is given a new revision so an Eventorial can fetch the changes made by others since it last looked without
+reading the entire database.
+
+Eventories are stored as bundles (see the bundle module) which means that their content is stored in its parsed form.
+
+Attributes:
+    SCHEMA_VERSION (int): Version of the database schema
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from functools import partial
+from io import BytesIO
+from typing import Any, List, Optional
+
+from .bundle import Bundle
+from .eventory import Eventory
+from .exceptions import EventorialException
+from .parser import EventoryParser, create_parser, find_parser
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS eventories (
+    title TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    head TEXT,
+    hash TEXT,
+    content BLOB,
+    revision INTEGER NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS eventories_revision ON eventories (revision);
+"""
+
+log = logging.getLogger(__name__)
+
+
+class SQLiteStorage:
+    """Stores Eventories in a SQLite database.
+
+    Each thread uses its own connection to the database.
+
+    Args:
+        location: Path to the database. It's created if it doesn't exist.
+        timeout: Seconds to wait for another connection to release its lock
+
+    Attributes:
+        location (str): Path to the database
+        timeout (float): Seconds to wait for another connection to release its lock
+
+    Raises:
+        EventorialException: When the database uses a different schema version
+    """
+
+    def __init__(self, location: str, *, timeout: float = 30):
+        self.location = location
+        self.timeout = timeout
+        self._local = threading.local()
+
+        connection = self.connection
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise EventorialException(f"{location} uses schema version {version} (expected {SCHEMA_VERSION})")
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def __repr__(self) -> str:
+        return f"<SQLiteStorage {self.location}>"
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection of the current thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.location, timeout=self.timeout, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        """Close the connection of the current thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    @property
+    def revision(self) -> int:
+        """Latest revision in the database."""
+        return self.connection.execute("SELECT IFNULL(MAX(revision), 0) FROM eventories").fetchone()[0]
+
+    def put(self, title: str, eventory: Eventory, filename: str = None) -> Optional[int]:
+        """Store an Eventory.
+
+        Args:
+            title: Sanitised title of the Eventory
+            eventory: Eventory to store
+            filename: Filename of the Eventory (used to look it up). Defaults to the filename of the Eventory.
+
+        Returns:
+            Optional[int]: Revision of the change or None if the database already contained the same Eventory
+        """
+        fp = BytesIO()
+        eventory.save_bundle(fp)
+        content = fp.getvalue()
+        digest = hashlib.sha256(content).hexdigest()
+        head = json.dumps(eventory.get_head())
+
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute("SELECT hash, deleted FROM eventories WHERE title = ?", (title,)).fetchone()
+            if row and row["hash"] == digest and not row["deleted"]:
+                connection.execute("ROLLBACK")
+                log.debug(f"{self} {title} didn't change, not writing it")
+                return None
+            revision = connection.execute("SELECT IFNULL(MAX(revision), 0) + 1 FROM eventories").fetchone()[0]
+            connection.execute("INSERT OR REPLACE INTO eventories (title, filename, head, hash, content, revision, deleted) "
+                               "VALUES (?, ?, ?, ?, ?, ?, 0)", (title, filename or eventory.filename, head, digest, content, revision))
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        log.debug(f"{self} stored {title} (revision {revision})")
+        return revision
+
+    def remove(self, title: str) -> Optional[int]:
+        """Remove an Eventory.
+
+        The row is kept (without its content) so other Eventorials notice the removal.
+
+        Args:
+            title: Sanitised title of the Eventory
+
+        Returns:
+            Optional[int]: Revision of the change or None if there was no such Eventory
+        """
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            revision = connection.execute("SELECT IFNULL(MAX(revision), 0) + 1 FROM eventories").fetchone()[0]
+            cursor = connection.execute("UPDATE eventories SET head = NULL, hash = NULL, content = NULL, revision = ?, deleted = 1 "
+                                        "WHERE title = ? AND deleted = 0", (revision, title))
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return revision if cursor.rowcount else None
+
+    def changes(self, since: int = 0) -> List[sqlite3.Row]:
+        """Get the changes after a revision.
+
+        Args:
+            since: Revision to start after
+
+        Returns:
+            List[sqlite3.Row]: Rows (title, filename, head, hash, revision and deleted) ordered by revision
+        """
+        return self.connection.execute("SELECT title, filename, head, hash, revision, deleted FROM eventories WHERE revision > ? "
+                                       "ORDER BY revision", (since,)).fetchall()
+
+    def load(self, row: sqlite3.Row, **kwargs) -> Eventory:
+        """Load an Eventory from a row returned by changes.
+
+        The content is only read from the database the first time it's accessed.
+
+        Args:
+            row: Row to load
+            **kwargs: Keyword arguments passed to the parser
+
+        Returns:
+            Eventory: Lazy Eventory
+        """
+        head = json.loads(row["head"])
+        instance, head = create_parser(find_parser(head.get("parser")), head, **kwargs)
+        meta, head_kwargs = instance.parse_head(head)
+        loader = partial(self.load_content, row["title"], row["hash"], instance)
+        return Eventory(meta, None, instance.instructor, content_loader=loader, **head_kwargs)
+
+    def load_content(self, title: str, digest: str, parser: EventoryParser) -> Any:
+        """Load the content of an Eventory.
+
+        Args:
+            title: Sanitised title of the Eventory
+            digest: Hash of the version of the Eventory
+            parser: Parser used to unbundle the content
+
+        Returns:
+            Any: Content
+
+        Raises:
+            EventorialException: When the Eventory was changed or removed in the meantime
+        """
+        row = self.connection.execute("SELECT content FROM eventories WHERE title = ? AND hash = ?", (title, digest)).fetchone()
+        if row is None:
+            raise EventorialException(f"{title} was changed or removed")
+        with Bundle(row["content"]) as bundle:
+            return parser.unbundle_content(bundle.read_all())
@@ -0,0 +1,97 @@
+"""This module contains the copy-on-write mapping used for the stores of Eventructors."""
+
+from collections.abc import Mapping, MutableMapping
+from copy import deepcopy
+from typing import Any, Iterator
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), frozenset)
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+class CopyOnWriteDict(MutableMapping):
+    """A mapping which shares the data of its base until it's changed.
+
+    Creating a CopyOnWriteDict doesn't copy anything and the base is never modified. Reading a nested mapping returns a CopyOnWriteDict on top
+    of it so only the parts which are actually changed are copied. Other mutable values (like lists) are copied the first time they're read.
+
+    Args:
+        base: Mapping to share the data of
+    """
+    __slots__ = ("_base", "_changes", "_deleted")
+
+    def __init__(self, base: Mapping = None):
+        self._base = {} if base is None else base
+        self._changes = {}
+        self._deleted = set()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._changes[key]
+        except KeyError:
+            pass
+        if key in self._deleted:
+            raise KeyError(key)
+        value = self._base[key]
+        if not _is_immutable(value):
+            # the value could be changed in place, from now on this mapping has its own version
+            value = CopyOnWriteDict(value) if isinstance(value, Mapping) else deepcopy(value)
+            self._changes[key] = value
+        return value
+
+    def __setitem__(self, key: Any, value: Any):
+        self._changes[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: Any):
+        if key not in self:
+            raise KeyError(key)
+        self._changes.pop(key, None)
+        if key in self._base:
+            self._deleted.add(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._changes or (key not in self._deleted and key in self._base)
+
+    def __iter__(self) -> Iterator:
+        for key in self._base:
+            if key not in self._deleted:
+                yield key
+        for key in self._changes:
+            if key not in self._base:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._base) - len(self._deleted) + sum(1 for key in self._changes if key not in self._base)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return self.to_dict()
+
+    @property
+    def changed(self) -> bool:
+        """Whether this mapping differs from its base (values which were only read count as changed)."""
+        return bool(self._changes or self._deleted)
+
+    def to_dict(self) -> dict:
+        """Get an independent dict with the contents of this mapping.
+
+        Returns:
+            dict: Deep copy of the contents
+        """
+        data = {}
+        for key in self:
+            if key in self._changes:
+                value = self._changes[key]
+                data[key] = value.to_dict() if isinstance(value, CopyOnWriteDict) else deepcopy(value)
+            else:
+                data[key] = deepcopy(self._base[key])
+        return data
@@ -0,0 +1,40 @@
+"""Utility functions used throughout Eventory."""
+
+import os
+from contextlib import contextmanager
+from os import path
+from tempfile import NamedTemporaryFile
+from typing import IO, Iterator
+
+
+@contextmanager
+def atomic_open(location: str, mode: str = "w", **kwargs) -> Iterator[IO]:
+    """Open a file for writing so that it's replaced atomically.
+
+    Everything is written to a temporary file in the same directory which replaces the file at location once the context is left without an
+    exception. This means that the file is never left half-written even if the process dies while writing. Afterwards the name of the yielded
+    file is location.
+
+    Args:
+        location: Path of the file to write
+        mode: Mode to open the temporary file with. Must be a writing mode.
+        **kwargs: Additional arguments passed to NamedTemporaryFile (i.e. encoding)
+
+    Yields:
+        IO: The temporary file to write to
+    """
+    directory, filename = path.split(path.abspath(location))
+    f = NamedTemporaryFile(mode, dir=directory, prefix=f".{filename}.", suffix=".tmp", delete=False, **kwargs)
+    try:
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f.name, location)
+        f.name = location
+    except BaseException:
+        try:
+            os.remove(f.name)
+        except FileNotFoundError:
+            pass
+        raise
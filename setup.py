@@ -17,7 +17,8 @@ dependency_links = [
 
 extras_require = {
     "ink": ["pythonnet"],
-    "discord": ["discord.py"]
+    "discord": ["discord.py"],
+    "watch": ["inotify_simple"]
 }
 
 about = {}
@@ -32,7 +33,7 @@ setup(
     author=about["__author__"],
     author_email=about["__author_email__"],
     license=about["__license__"],
-    packages=["eventory", "eventory.ext", "eventory.ext.discord", "eventory.ext.inktory"],
+    packages=["eventory", "eventory.ext", "eventory.ext.discord", "eventory.ext.inktory", "eventory.ext.inktory.pink", "eventory.ext.inktory.pink.engine"],
     install_requires=requires,
     extras_require=extras_require,
     dependency_links=dependency_links,
@@ -1,10 +1,14 @@
+import asyncio
+import os
 from os import path
 import shutil
 
 import pytest
+from aiohttp import web
 
 import eventory
-from eventory import Eventorial
+from eventory import Eventorial, constants
+from eventory import eventorial as eventorial_module
 from tempfile import TemporaryDirectory
 
 eventory.load_ext("inktory")
@@ -27,4 +31,297 @@ async def test_preload():
     with TemporaryDirectory() as directory:
         shutil.copy("tests/crime_scene.evory", path.join(directory, "crime_scene.evory"))
         eventorial = Eventorial(directory)
-        assert eventorial["Crime Scene"]
\ No newline at end of file
+        assert eventorial["Crime Scene"]
+
+@pytest.mark.asyncio
+async def test_lazy_preload():
+    with TemporaryDirectory() as directory:
+        shutil.copy("tests/crime_scene.evory", path.join(directory, "crime_scene.evory"))
+        eventorial = Eventorial(directory, lazy=True)
+        story = eventorial["Crime Scene"]
+        assert not story.loaded
+        assert story.content.compiled
+        assert story.loaded
+
+
+@pytest.mark.asyncio
+async def test_lazy_unicode():
+    with open("tests/compiled.evory", "r", encoding="utf-8") as f:
+        text = f.read()
+    with TemporaryDirectory() as directory:
+        with open(path.join(directory, "compiled.evory"), "w", encoding="utf-8") as f:
+            f.write(text.replace("title: Compiled", "title: Compiled \u00e9"))
+        eventorial = Eventorial(directory, lazy=True, use_catalog=False)
+        story = eventorial["Compiled \u00e9"]
+        assert not story.loaded
+        assert story.content.compiled == eventory.load(text).content.compiled
+
+
+@pytest.mark.asyncio
+async def test_catalog():
+    with TemporaryDirectory() as directory:
+        shutil.copy("tests/crime_scene.evory", path.join(directory, "crime_scene.evory"))
+        Eventorial(directory)
+        assert path.isfile(path.join(directory, constants.CATALOG_FILENAME))
+        eventorial = Eventorial(directory, lazy=True)
+        assert eventorial.catalog["crime_scene.evory"]["title"] == "crime scene"
+        assert eventorial["Crime Scene"].content.compiled
+
+
+@pytest.mark.asyncio
+async def test_eager_catalog(monkeypatch):
+    with TemporaryDirectory() as directory:
+        shutil.copy("tests/compiled.evory", path.join(directory, "compiled.evory"))
+        digest = Eventorial(directory).catalog["compiled.evory"]["hash"]
+        hashed = []
+        sha256 = eventorial_module.hashlib.sha256
+        monkeypatch.setattr(eventorial_module.hashlib, "sha256", lambda *args: hashed.append(args) or sha256(*args))
+        eventorial = Eventorial(directory)
+        # the file is unchanged so the digest is taken from the catalog
+        assert not hashed
+        assert eventorial.catalog["compiled.evory"]["hash"] == digest
+        assert eventorial["Compiled"].loaded
+
+
+@pytest.mark.asyncio
+async def test_parallel_preload():
+    with TemporaryDirectory() as directory:
+        shutil.copy("tests/crime_scene.evory", path.join(directory, "crime_scene.evory"))
+        shutil.copy("tests/cloak_of_darkness.evory", path.join(directory, "cloak_of_darkness.evory"))
+        eventorial = Eventorial(directory, processes=2)
+        assert eventorial["Crime Scene"]
+        assert eventorial["Cloak of Darkness"]
+
+
+@pytest.mark.asyncio
+async def test_no_resave():
+    with TemporaryDirectory() as directory:
+        location = path.join(directory, "crime_scene.evory")
+        shutil.copy("tests/crime_scene.evory", location)
+        mtime = os.stat(location).st_mtime_ns
+        eventorial = Eventorial(directory)
+        assert os.stat(location).st_mtime_ns == mtime
+        story = eventorial["Crime Scene"]
+        eventorial.remove(story)
+        eventorial.add(story)
+        mtime = os.stat(location).st_mtime_ns
+        Eventorial(directory)
+        assert os.stat(location).st_mtime_ns == mtime
+        assert sorted(os.listdir(directory)) == [constants.CATALOG_FILENAME, "crime_scene.evory"]
+
+
+@pytest.mark.asyncio
+async def test_http_cache():
+    with open("tests/crime_scene.evory", "r", encoding="utf-8") as f:
+        text = f.read()
+    requests = []
+
+    async def handler(request):
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == "\"crime\"":
+            return web.Response(status=304)
+        return web.Response(text=text, headers={"ETag": "\"crime\""})
+
+    app = web.Application()
+    app.router.add_get("/crime_scene.evory", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/crime_scene.evory"
+    try:
+        with TemporaryDirectory() as directory:
+            eventorial = Eventorial(directory)
+            story = await eventorial.load(url)
+            assert url in eventorial.http_cache
+            assert await eventorial.load(url) is story
+            assert requests == [None, "\"crime\""]
+
+            eventorial = Eventorial(directory, use_catalog=False)
+            eventorial.remove(eventorial["Crime Scene"])
+            story = await eventorial.load(url)
+            assert story.title == "Crime Scene"
+            assert requests[-1] == "\"crime\""
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_http_cache_source():
+    with open("tests/compiled.evory", "r", encoding="utf-8") as f:
+        text = f.read()
+
+    async def handler(request):
+        if request.headers.get("If-None-Match") == "\"compiled\"":
+            return web.Response(status=304)
+        return web.Response(text=text, headers={"ETag": "\"compiled\""})
+
+    app = web.Application()
+    app.router.add_get("/compiled.evory", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/compiled.evory"
+    try:
+        with TemporaryDirectory() as directory:
+            eventorial = Eventorial(directory, use_catalog=False)
+            story = await eventorial.load(url)
+            assert await eventorial.load(url) is story
+
+            # an Eventory with the same title from another source isn't mistaken for the downloaded one
+            eventorial.remove(story)
+            with open(path.join(directory, "local.evory"), "w", encoding="utf-8") as f:
+                f.write(text.replace("author: Eventory", "author: Somebody"))
+            local = await eventorial.load("local.evory")
+            with pytest.raises(eventory.EventoryAlreadyLoaded):
+                await eventorial.load(url)
+            assert eventorial["Compiled"] is local
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_load_many():
+    eventorial = Eventorial()
+    with open("tests/crime_scene.evory", "r", encoding="utf-8") as crime_scene, \
+            open("tests/cloak_of_darkness.evory", "r", encoding="utf-8") as cloak_of_darkness:
+        results = await eventorial.load_many([crime_scene, "missing.evory", cloak_of_darkness], concurrency=2)
+    assert results[0] is eventorial["Crime Scene"]
+    assert isinstance(results[1], FileNotFoundError)
+    assert results[2] is eventorial["Cloak of Darkness"]
+
+
+@pytest.mark.asyncio
+async def test_download_limits():
+    sent = []
+
+    async def large(request):
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        for _ in range(64):
+            await resp.write(b"x" * 1024)
+            sent.append(1024)
+        return resp
+
+    async def unknown_parser(request):
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        await resp.write(b"---\nparser: Unknown\nmeta:\n  title: Unknown\n---\n")
+        sent.append(1)
+        await asyncio.sleep(3)
+        return resp
+
+    app = web.Application()
+    app.router.add_get("/large", large)
+    app.router.add_get("/unknown", unknown_parser)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    try:
+        eventorial = Eventorial(max_download_size=16 * 1024, download_timeout=1)
+        with pytest.raises(eventory.EventoryTooLarge):
+            await eventorial.load(url + "/large")
+        with pytest.raises(eventory.EventoryNoParserFound):
+            await eventorial.load(url + "/unknown")
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_streamed_head(monkeypatch):
+    with open("tests/compiled.evory", "r", encoding="utf-8") as f:
+        text = f.read()
+    compiled = eventory.load(text).content.compiled
+    decoded = []
+    decode_head = eventory.EventoryParser.decode_head
+    monkeypatch.setattr(eventory.EventoryParser, "decode_head", staticmethod(lambda head: decoded.append(head) or decode_head(head)))
+
+    async def handler(request):
+        return web.Response(text=text)
+
+    app = web.Application()
+    app.router.add_get("/compiled.evory", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        with TemporaryDirectory() as directory:
+            eventorial = Eventorial(directory, use_catalog=False)
+            story = await eventorial.load(f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/compiled.evory")
+            assert story.title == "Compiled"
+            assert story.content.compiled == compiled
+            # the head decoded while downloading is used to load the Eventory
+            assert len(decoded) == 1
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_reload():
+    with TemporaryDirectory() as directory:
+        location = path.join(directory, "crime_scene.evory")
+        shutil.copy("tests/crime_scene.evory", location)
+        eventorial = Eventorial(directory)
+        story = eventorial["Crime Scene"]
+        assert await eventorial.reload() == []
+
+        with open(location, "r", encoding="utf-8") as f:
+            text = f.read()
+        with open(location, "w", encoding="utf-8") as f:
+            f.write(text.replace("version: 1", "version: 2"))
+        shutil.copy("tests/cloak_of_darkness.evory", path.join(directory, "cloak_of_darkness.evory"))
+        assert await eventorial.reload() == ["cloak_of_darkness.evory", "crime_scene.evory"]
+        assert eventorial["Crime Scene"].version == 2
+        assert story.version == 1
+        assert "Cloak of Darkness" in eventorial
+
+        os.remove(location)
+        assert await eventorial.reload() == ["crime_scene.evory"]
+        assert "Crime Scene" not in eventorial
+
+
+@pytest.mark.asyncio
+async def test_reload_collision():
+    with open("tests/compiled.evory", "r", encoding="utf-8") as f:
+        text = f.read()
+    with TemporaryDirectory() as directory:
+        with open(path.join(directory, "compiled.evory"), "w", encoding="utf-8") as f:
+            f.write(text)
+        with open(path.join(directory, "other.evory"), "w", encoding="utf-8") as f:
+            f.write(text.replace("title: Compiled", "title: Other"))
+        eventorial = Eventorial(directory)
+        index = eventorial.index
+        with open(path.join(directory, "other.evory"), "w", encoding="utf-8") as f:
+            f.write(text.replace("title: Compiled", "title: Other").replace("author: Eventory", "author: Somebody"))
+        with open(path.join(directory, "compiled.evory"), "w", encoding="utf-8") as f:
+            f.write(text.replace("title: Compiled", "title: Other"))
+        # the new version of compiled.evory would take the title of other.evory
+        assert await eventorial.reload() == ["other.evory"]
+        assert eventorial["Compiled"].title == "Compiled"
+        assert eventorial["Other"].author == "Somebody"
+        assert eventorial.index is not index
+        assert index.get("other") == "other"
+
+
+@pytest.mark.asyncio
+async def test_storage():
+    with TemporaryDirectory() as directory:
+        location = path.join(directory, "eventories.db")
+        first = Eventorial(storage=location)
+        second = Eventorial(storage=location)
+        with open("tests/crime_scene.evory", "r", encoding="utf-8") as f:
+            first.add(f)
+        story = second["Crime Scene"]
+        assert not story.loaded
+        assert story.content.compiled
+        assert second.sync() == []
+
+        first.remove(first["Crime Scene"])
+        assert second.sync() == ["crime scene"]
+        assert "Crime Scene" not in second
+        assert "Crime Scene" not in Eventorial(storage=location)
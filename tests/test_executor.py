@@ -0,0 +1,38 @@
+import threading
+
+from eventory.executor import FairExecutor
+
+
+def test_fair_scheduling():
+    executor = FairExecutor(1)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def block():
+        started.set()
+        release.wait()
+
+    executor.submit(block)
+    started.wait()
+    first, second = executor.session("first"), executor.session("second")
+    futures = [first.submit(order.append, f"first {i}") for i in range(3)]
+    futures.append(second.submit(order.append, "second 0"))
+    release.set()
+    for future in futures:
+        future.result()
+    assert order == ["first 0", "second 0", "first 1", "first 2"]
+    executor.shutdown()
+
+
+def test_session_shutdown():
+    executor = FairExecutor(1)
+    release = threading.Event()
+    executor.submit(release.wait)
+    session = executor.session()
+    future = session.submit(print, "never")
+    session.shutdown()
+    assert future.cancelled()
+    release.set()
+    executor.shutdown()
+    assert not any(thread.is_alive() for thread in executor._threads)
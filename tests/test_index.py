@@ -0,0 +1,46 @@
+from eventory.index import EventoryIndex
+
+
+def test_index():
+    index = EventoryIndex()
+    index.add("crime scene", ["crime scene", "crime_scene", "murder"])
+    index.add("cloak of darkness", ["cloak of darkness", "the cloak"])
+    index.add("the intercept", ["the intercept"])
+
+    assert index.get("murder") == "crime scene"
+    assert index.get("crime") is None
+    assert index.prefix("cr") == ["crime scene"]
+    assert index.prefix("the") == ["cloak of darkness", "the intercept"]
+    assert index.fuzzy("crime scnee")[0][0] == "crime scene"
+    assert index.search("the intercpt", limit=1) == ["the intercept"]
+    assert index.search("darknes") == ["cloak of darkness"]
+
+    index.remove("crime scene")
+    assert index.get("murder") is None
+    assert not index.prefix("cr")
+    assert not index.fuzzy("crime scene")
+
+
+def test_primary_key():
+    index = EventoryIndex()
+    index.add("a", ["a", "b"])
+    index.add("b", ["b"])
+    index.add("c", ["c", "a"])
+    assert index.get("a") == "a"
+    assert index.get("b") == "b"
+    index.remove("b")
+    assert index.get("b") is None
+    assert len(index) == 2
+
+
+def test_copy():
+    index = EventoryIndex()
+    index.add("crime scene", ["crime scene", "murder"])
+    copy = index.copy()
+    copy.remove("crime scene")
+    copy.add("cloak of darkness", ["cloak of darkness"])
+    assert index.get("murder") == "crime scene"
+    assert index.fuzzy("crime scnee")[0][0] == "crime scene"
+    assert not index.fuzzy("cloak of darknes")
+    assert copy.search("darknes") == ["cloak of darkness"]
+    assert not copy.fuzzy("crime scene")
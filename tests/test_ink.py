@@ -1,6 +1,41 @@
+import asyncio
+import io
+import sys
+
 import pytest
 
 import eventory
+from eventory import Eventarrator
+from eventory.bundle import Bundle, write_bundle
+
+
+class TurnEventarrator(Eventarrator):
+    def __init__(self):
+        self.outputs = []
+        self.turns = []
+
+    async def output(self, out):
+        self.outputs.append(out)
+
+    async def output_turn(self, turn):
+        self.turns.append(turn)
+        await super().output_turn(turn)
+
+    async def input(self):
+        raise NotImplementedError
+
+
+def load_compiled():
+    eventory.load_ext("inktory")
+    with open("tests/compiled.evory", "r", encoding="utf-8") as f:
+        return eventory.load(f, backend="pink")
+
+
+def play_lines(story) -> list:
+    lines = []
+    while story.canContinue:
+        lines.append(story.Continue())
+    return lines
 
 
 @pytest.mark.asyncio
@@ -9,3 +44,172 @@ async def test__intercept():
     with open("tests/the_intercept.evory", "r") as f:
         story = eventory.load(f)
     assert story.title == "The Intercept"
+
+
+def test_compile_cache(tmpdir):
+    eventory.load_ext("inktory")
+    from eventory.ext.inktory.cache import InkCompileCache
+    cache = InkCompileCache(str(tmpdir), max_size=10, version="test")
+    assert cache.get("raw") is None
+    cache.set("raw", "compiled")
+    assert "raw" in cache
+    assert cache.get("raw") == "compiled"
+    cache.set("other raw", "compiled again")
+    assert "raw" not in cache
+    assert cache.size <= 10
+
+
+def test_bundle(tmpdir):
+    eventory.load_ext("inktory")
+    with open("tests/the_intercept.evory", "r") as f:
+        story = eventory.load(f)
+    location = story.save_bundle(str(tmpdir.join("{filename}"))).name
+    with open(location, "rb") as f:
+        bundled = eventory.load(f)
+    assert bundled.title == story.title
+    assert bundled.content.compiled == story.content.compiled
+    lazy = eventory.load_bundle(location, lazy=True)
+    assert not lazy.loaded
+    assert lazy.content.raw == story.content.raw
+
+
+def test_malformed_bundle(tmpdir):
+    buffer = io.BytesIO()
+    write_bundle(buffer, {"parser": "Ink", "meta": {"title": "Bundle"}}, {"compiled": b"{}", "raw": b"raw ink"})
+    data = buffer.getvalue()
+    header_end = min(section["offset"] for section in Bundle(data).sections.values())
+    broken = (b"", data[:10], b"NOBUNDLE" + data[8:], data[:header_end - 1], data[:-1], data[:header_end].replace(b"head", b"hewd"))
+    for i, broken_data in enumerate(broken):
+        location = str(tmpdir.join(f"broken_{i}.evoryb"))
+        with open(location, "wb") as f:
+            f.write(broken_data)
+        with pytest.raises(eventory.MalformattedEventory):
+            Bundle.open(location)
+        with pytest.raises(eventory.MalformattedEventory):
+            eventory.load_bundle(location)
+
+
+def test_story_pool():
+    eventory.load_ext("inktory")
+    with open("tests/the_intercept.evory", "r") as f:
+        story = eventory.load(f)
+    pool = story.content.pool
+    first = pool.acquire()
+    text = first.Continue()
+    pool.release(first)
+    assert len(pool) == 1
+    again = pool.acquire()
+    assert again is first
+    assert again.Continue() == text
+
+
+@pytest.mark.asyncio
+async def test_turn_length():
+    narrator = TurnEventarrator()
+    narrator.max_turn_length = 16
+    instructor = load_compiled().narrate(narrator)
+    await instructor.output_turn()
+    assert all(len(str(turn)) <= 16 for turn in narrator.turns)
+    assert [turn.complete for turn in narrator.turns] == [False] * (len(narrator.turns) - 1) + [True]
+    assert "".join(narrator.outputs) == "".join(play_lines(load_compiled().content.pool.acquire())) + "1. Thread choice\n2. Main choice\n"
+    assert [choice for turn in narrator.turns for choice in turn.choices] == ["Main choice"]
+
+
+@pytest.mark.asyncio
+async def test_turn_delay():
+    narrator = TurnEventarrator()
+    narrator.max_turn_delay = 0
+    instructor = load_compiled().narrate(narrator)
+    await instructor.output_turn()
+    assert [turn.lines for turn in narrator.turns[:-1]] == [[line] for line in play_lines(load_compiled().content.pool.acquire())]
+    assert narrator.turns[-1].choices == ["Thread choice", "Main choice"]
+
+
+def play_first_choices(story, max_turns: int = 200) -> list:
+    played = []
+    for _ in range(max_turns):
+        while story.canContinue:
+            played.append(story.Continue())
+        choices = [choice.text for choice in story.currentChoices]
+        if not choices:
+            break
+        played.append(choices)
+        story.ChooseChoiceIndex(0)
+    return played
+
+
+@pytest.mark.parametrize("filename", ["the_intercept.evory", "crime_scene.evory", "cloak_of_darkness.evory"])
+def test_backend_playthrough(filename):
+    eventory.load_ext("inktory")
+    from eventory.ext import inktory
+    if not inktory.INKLECATE_VERSION:
+        pytest.skip("\"inklecate.exe\" is needed to compile the story")
+    with open(f"tests/{filename}", "r", encoding="utf-8") as f:
+        text = f.read()
+
+    played = {}
+    for backend in inktory.BACKENDS:
+        try:
+            inktory.get_story_class(backend)
+        except (ImportError, FileNotFoundError):
+            assert backend != "pink"
+            continue
+        story = eventory.load(text, backend=backend).content.pool.acquire()
+        played[backend] = play_first_choices(story)
+        assert played[backend]
+    # where both backends are available they have to tell the same story
+    if len(played) > 1:
+        assert played["pink"] == played["dotnet"]
+
+
+def fake_inklecate(monkeypatch, code):
+    eventory.load_ext("inktory")
+    from eventory.ext import inktory
+    monkeypatch.setattr(inktory, "compile_cache", None)
+    monkeypatch.setattr(inktory, "INKLECATE_CMD", [sys.executable, "-c", code])
+    return inktory
+
+
+@pytest.mark.asyncio
+async def test_compile_async(monkeypatch):
+    inktory = fake_inklecate(monkeypatch, "import sys; open(sys.argv[1] + '.json', 'w').write(open(sys.argv[1]).read().upper())")
+    assert await inktory.EventoryInkParser.compile_async("raw ink") == "RAW INK"
+
+
+@pytest.mark.asyncio
+async def test_compile_async_cancelled(monkeypatch):
+    inktory = fake_inklecate(monkeypatch, "import time; time.sleep(30)")
+    processes = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def create(*args, **kwargs):
+        process = await create_subprocess_exec(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", create)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(inktory.EventoryInkParser.compile_async("raw ink"), .5)
+    assert processes[0].returncode is not None
+
+
+def test_compile_many(monkeypatch):
+    inktory = fake_inklecate(monkeypatch, "")
+    compiled = []
+
+    def compile_file(location):
+        with open(location, "r") as f:
+            ink = f.read()
+        compiled.append(ink)
+        if ink == "broken":
+            raise ValueError(ink)
+        return ink.upper()
+
+    monkeypatch.setattr(inktory, "_compile_file", compile_file)
+    results = inktory.EventoryInkParser.compile_many(["a", "broken", "a", "b"], return_exceptions=True)
+    assert results[0] == results[2] == "A"
+    assert isinstance(results[1], ValueError)
+    assert results[3] == "B"
+    assert sorted(compiled) == ["a", "b", "broken"]
+    with pytest.raises(ValueError):
+        inktory.EventoryInkParser.compile_many(["broken"])
@@ -0,0 +1,37 @@
+import pytest
+
+from eventory import Eventarrator, Turn, split_text
+
+
+class ListEventarrator(Eventarrator):
+    def __init__(self):
+        self.outputs = []
+
+    async def output(self, out):
+        self.outputs.append(out)
+
+    async def input(self):
+        raise NotImplementedError
+
+
+def test_split_text():
+    assert split_text("short", 10) == ["short"]
+    assert split_text("split at the spaces\n", 10) == ["split at ", "the ", "spaces\n"]
+    assert split_text("unbreakable", 4) == ["unbr", "eaka", "ble"]
+    assert "".join(split_text("a text\nwith\tall kinds of whitespace", 7)) == "a text\nwith\tall kinds of whitespace"
+
+
+def test_turn():
+    turn = Turn(["A line.\n", "Another line.\n"], choices=["Left", "Right"])
+    assert turn.text == "A line.\nAnother line.\n"
+    assert str(turn) == "A line.\nAnother line.\n1. Left\n2. Right\n"
+    assert Turn(choices=["Right"], first_choice=2, complete=False).choices_text == "2. Right\n"
+    assert not Turn()
+
+
+@pytest.mark.asyncio
+async def test_output_turn():
+    narrator = ListEventarrator()
+    await narrator.output_turn(Turn(["A line.\n"], choices=["Left"]))
+    await narrator.output_turn(Turn())
+    assert narrator.outputs == ["A line.\n1. Left\n"]
@@ -0,0 +1,47 @@
+from io import StringIO
+
+from eventory.parser import EventoryParser, Eventoriment, read_head
+
+
+class TextParser(EventoryParser):
+    @staticmethod
+    def parse_content(content):
+        return content
+
+
+def test_read_head():
+    with open("tests/the_intercept.evory", "r") as f:
+        text = f.read()
+    stream = StringIO(text)
+    head, content = read_head(stream)
+    assert "The Intercept" in head
+    assert (head, content + stream.read()) == EventoryParser.split(text)
+
+
+def test_json_head():
+    parser = TextParser()
+    meta, kwargs = parser.parse_head('{"parser": "Ink", "meta": {"title": "JSON", "version": 2}, "store": {"a": 1}}')
+    assert meta.title == "JSON"
+    assert meta.version == 2
+    assert kwargs["store"] == {"a": 1}
+
+
+def test_resolve_requirements(monkeypatch, tmpdir):
+    from eventory import requirements
+
+    calls = []
+
+    def pip(cmd, **_):
+        calls.append(cmd)
+        for package in ("missing_a", "missing_b"):
+            tmpdir.join(f"{package}.py").write("")
+
+    monkeypatch.syspath_prepend(str(tmpdir))
+    monkeypatch.setattr(requirements.subprocess, "run", pip)
+    monkeypatch.setattr(requirements, "RESOLVED_REQUIREMENTS", {})
+    reqs = [Eventoriment("json"), Eventoriment("missing_a", "git+missing-a"), Eventoriment("missing_b")]
+    modules = requirements.resolve_requirements(reqs)
+    assert [module.__name__ for module in modules] == ["json", "missing_a", "missing_b"]
+    assert calls == [[*requirements.PIP_CMD, "install", "git+missing-a", "missing_b"]]
+    assert requirements.resolve_requirements(reqs[1:]) == modules[1:]
+    assert len(calls) == 1
@@ -0,0 +1,293 @@
+import json
+
+import pytest
+
+import eventory
+from eventory import Eventarrator
+from eventory.ext.inktory.pink.engine.choice_point import ChoicePoint
+from eventory.ext.inktory.pink.engine.control_command import CommandType, ControlCommand
+from eventory.ext.inktory.pink.engine.divert import Divert
+from eventory.ext.inktory.pink.engine.glue import Glue
+from eventory.ext.inktory.pink.engine.ink_list import InkList, InkListItem
+from eventory.ext.inktory.pink.engine.json_serialisation import Json
+from eventory.ext.inktory.pink.engine.native_function_call import NativeFunctionCall
+from eventory.ext.inktory.pink.engine.object import Object
+from eventory.ext.inktory.pink.engine.path import Path
+from eventory.ext.inktory.pink.engine.push_pop import PushPopType
+from eventory.ext.inktory.pink.engine.tag import Tag
+from eventory.ext.inktory.pink.engine.value import DivertTargetValue, ListValue, StringValue, Value, VariablePointerValue
+from eventory.ext.inktory.pink.engine.variable_assignment import VariableAssignment
+from eventory.ext.inktory.pink.engine.variable_reference import VariableReference
+from eventory.ext.inktory.pink.engine.void import Void
+
+
+class ListEventarrator(Eventarrator):
+    def __init__(self, inputs=()):
+        self.outputs = []
+        self.inputs = list(inputs)
+
+    async def output(self, out):
+        self.outputs.append(out)
+
+    async def input(self):
+        return self.inputs.pop(0)
+
+
+def load_compiled(**kwargs):
+    eventory.load_ext("inktory")
+    kwargs.setdefault("backend", "pink")
+    with open("tests/compiled.evory", "r") as f:
+        return eventory.load(f, **kwargs)
+
+
+def play_lines(story) -> list:
+    lines = []
+    while story.canContinue:
+        lines.append(story.Continue())
+    return lines
+
+
+def test_playthrough():
+    story = load_compiled().content.pool.acquire()
+    assert play_lines(story) == ["Start\n", "5\n", "In tunnel.\n", "green\n", "blue\n", "red, green, blue\n", "3 -1 3.5\n"]
+    assert [choice.text for choice in story.currentChoices] == ["Thread choice", "Main choice"]
+    story.ChooseChoiceIndex(1)
+    assert play_lines(story) == ["Took main.\n", "After 1\n", "Fell through.\n"]
+    assert story.currentChoices.Count == 0
+
+
+def test_save_and_load():
+    content = load_compiled().content
+    story = content.pool.acquire()
+    play_lines(story)
+    state = story.state.ToJson()
+    assert json.loads(state)["inkSaveVersion"] == 8
+
+    other = content.pool.acquire()
+    other.state.LoadJson(state)
+    assert [choice.text for choice in other.currentChoices] == ["Thread choice", "Main choice"]
+    other.ChooseChoiceIndex(0)
+    assert play_lines(other) == ["Took thread.\n", "After 1\n", "Fell through.\n"]
+
+
+def test_lazy():
+    from eventory.ext.inktory.pink import PinkStory
+
+    story = PinkStory(load_compiled().content.compiled, lazy=True)
+    root = story.story.main_content_container
+    unloaded = set(root.unloaded_named_content)
+    assert unloaded
+    assert play_lines(story) == ["Start\n", "5\n", "In tunnel.\n", "green\n", "blue\n", "red, green, blue\n", "3 -1 3.5\n"]
+    assert set(root.unloaded_named_content) < unloaded
+    story.ChooseChoiceIndex(1)
+    assert play_lines(story) == ["Took main.\n", "After 1\n", "Fell through.\n"]
+
+
+def test_backend_persisted(tmpdir):
+    story = load_compiled()
+    assert story.options == {"backend": "pink"}
+    with open(story.save(str(tmpdir.join("{filename}"))).name, "r", encoding="utf-8") as f:
+        assert eventory.load(f).content.backend == "pink"
+    with open(story.save_bundle(str(tmpdir.join("{filename}"))).name, "rb") as f:
+        assert eventory.load(f).content.backend == "pink"
+
+
+class PlainParser(eventory.EventoryParser):
+    @staticmethod
+    def parse_content(content):
+        return content.strip()
+
+
+def test_load_many_options():
+    eventory.register_parser(PlainParser, ())
+    with open("tests/compiled.evory", "r") as f:
+        text = f.read()
+    ink, plain = eventory.load_many([text, "---\nparser: PlainParser\nmeta:\n  title: Text\n---\nplain"], backend="pink")
+    assert ink.content.backend == "pink"
+    assert plain.content == "plain"
+    assert plain.options == {}
+
+
+def test_ink_version():
+    from eventory.ext.inktory.pink.engine.story import Story
+    from eventory.ext.inktory.pink.engine.story_exception import StoryException
+
+    compiled = json.loads(load_compiled().content.compiled)
+    assert compiled["inkVersion"] == Story.ink_version_minimum_compatible
+    compiled["inkVersion"] = 17
+    with pytest.raises(StoryException):
+        Story(json.dumps(compiled))
+
+
+@pytest.mark.asyncio
+async def test_lazy_knots():
+    outputs = []
+    for lazy_knots in (False, True):
+        story = load_compiled(lazy_knots=lazy_knots)
+        assert story.options.get("lazy_knots", False) is lazy_knots
+        narrator = ListEventarrator(["2"])
+        instructor = story.narrate(narrator)
+        assert bool(instructor.story.story.main_content_container.unloaded_named_content) is lazy_knots
+        await instructor.play()
+        outputs.append(narrator.outputs)
+    assert outputs[0] == outputs[1]
+    with pytest.raises(ValueError):
+        load_compiled(backend="dotnet", lazy_knots=True)
+
+
+def chain_token_to_runtime_object(token):
+    # the chain of checks Json.j_token_to_runtime_object used before it was replaced by lookup tables
+    if isinstance(token, (int, float)):
+        return Value.create(token)
+    if isinstance(token, str):
+        string = token
+        first_char = string[0]
+        if first_char == "^":
+            return StringValue(string[1:])
+        elif first_char == "\n" and len(string) == 1:
+            return StringValue("\n")
+        if string == "<>":
+            return Glue()
+        for i in range(len(Json._control_command_names)):
+            cmd_name = Json._control_command_names[i]
+            if string == cmd_name:
+                return ControlCommand(CommandType(i))
+        if string == "L^":
+            string = "^"
+        if NativeFunctionCall.call_exists_with_name(string):
+            return NativeFunctionCall.call_with_name(string)
+        if string == "->->":
+            return ControlCommand(CommandType.PopTunnel)
+        elif string == "~ret":
+            return ControlCommand(CommandType.PopFunction)
+        if string == "void":
+            return Void()
+    if isinstance(token, dict):
+        obj = token
+        if "^->" in obj:
+            return DivertTargetValue(Path(obj["^->"]))
+        if "^var" in obj:
+            var_ptr = VariablePointerValue(obj["^var"])
+            if "ci" in obj:
+                var_ptr.context_index = int(obj["ci"])
+            return var_ptr
+
+        is_divert = False
+        pushes_to_stack = False
+        div_push_type = PushPopType.Function
+        external = False
+        if "->" in obj:
+            prop_value = obj["->"]
+            is_divert = True
+        elif "f()" in obj:
+            prop_value = obj["f()"]
+            is_divert = True
+            pushes_to_stack = True
+            div_push_type = PushPopType.Function
+        elif "->t->" in obj:
+            prop_value = obj["->t->"]
+            is_divert = True
+            pushes_to_stack = True
+            div_push_type = PushPopType.Tunnel
+        elif "x()" in obj:
+            prop_value = obj["x()"]
+            is_divert = True
+            external = True
+            pushes_to_stack = False
+            div_push_type = PushPopType.Function
+        if is_divert:
+            divert = Divert()
+            divert.pushes_to_stack = pushes_to_stack
+            divert.stack_push_type = div_push_type
+            divert.is_external = external
+            target = str(prop_value)
+            if "var" in obj:
+                divert.variable_divert_name = target
+            else:
+                divert.target_path_string = target
+            divert.is_conditional = "c" in obj
+            if external:
+                if "exArgs" in obj:
+                    divert.external_args = int(obj["exArgs"])
+            return divert
+        if "*" in obj:
+            choice = ChoicePoint()
+            choice.path_string_on_choice = str(obj["*"])
+            if "flg" in obj:
+                choice.flags = int(obj["flg"])
+            return choice
+        if "VAR?" in obj:
+            return VariableReference(str(obj["VAR?"]))
+        elif "CNT?" in obj:
+            read_count_var_ref = VariableReference()
+            read_count_var_ref.path_string_for_count = str(obj["CNT?"])
+            return read_count_var_ref
+
+        is_var_ass = False
+        is_global_var = False
+        if "VAR=" in obj:
+            prop_value = obj["VAR="]
+            is_var_ass = True
+            is_global_var = True
+        elif "temp=" in obj:
+            prop_value = obj["temp="]
+            is_var_ass = True
+            is_global_var = False
+        if is_var_ass:
+            var_name = str(prop_value)
+            is_new_decl = "re" not in obj
+            var_ass = VariableAssignment(var_name, is_new_decl)
+            var_ass.is_global = is_global_var
+            return var_ass
+        if "#" in obj:
+            return Tag(str(obj["#"]))
+        if "list" in obj:
+            list_content = obj["list"]
+            raw_list = InkList()
+            if "origins" in obj:
+                raw_list.set_initial_origin_names(obj["origins"])
+            for key, value in list_content.items():
+                item = InkListItem(key)
+                raw_list[item] = value
+            return ListValue(raw_list)
+        if "originalChoicePath" in obj:
+            return Json.j_object_to_choice(obj)
+    if isinstance(token, list):
+        return Json.j_array_to_container(token)
+    if token is None:
+        return None
+    raise Exception(f"Failed to convert token to runtime object: {token}")
+
+
+def describe(obj):
+    if isinstance(obj, Object):
+        return type(obj), {key: describe(value) for key, value in vars(obj).items()}
+    if isinstance(obj, InkList):
+        return type(obj), sorted((item.full_name, value) for item, value in obj.items()), obj.origin_names
+    if isinstance(obj, Path):
+        return type(obj), str(obj)
+    if isinstance(obj, dict):
+        return {key: describe(value) for key, value in obj.items()}
+    return obj
+
+
+NativeFunctionCall.generate_native_functions_if_necessary()
+TOKENS = [
+    *Json._control_command_names,
+    *NativeFunctionCall._native_functions, "L^",
+    "^", "^Hello world", "^ev", "\n", "<>", "void", 0, 5, -3, 2.5,
+    {"^->": "knot.stitch"}, {"^var": "x", "ci": 2}, {"^var": "y"},
+    {"->": "knot"}, {"->": ".^.s", "c": True}, {"->": "target", "var": True}, {"f()": "function"}, {"->t->": "tunnel"},
+    {"x()": "external", "exArgs": 2}, {"x()": "external"},
+    {"*": "0.c-0", "flg": 18}, {"*": "0.c-1"},
+    {"VAR?": "x"}, {"CNT?": "knot.stitch"}, {"VAR=": "x"}, {"VAR=": "x", "re": True}, {"temp=": "y"},
+    {"#": "a tag"},
+    {"list": {}}, {"list": {"colours.red": 1, "colours.blue": 3}}, {"list": {}, "origins": ["colours"]},
+    {"originalChoicePath": "0.c-0", "text": "A choice", "index": 1, "originalThreadIndex": 0, "targetPath": "0.c-0.0"},
+    None
+]
+
+
+@pytest.mark.parametrize("token", TOKENS, ids=repr)
+def test_token_table_parity(token):
+    assert describe(Json.j_token_to_runtime_object(token)) == describe(chain_token_to_runtime_object(token))
@@ -0,0 +1,73 @@
+import json
+import os
+
+import pytest
+
+import eventory
+from eventory import Eventarrator
+from eventory.snapshots import JOURNAL_SUFFIX, SnapshotStore, diff, patch
+
+
+class ListEventarrator(Eventarrator):
+    def __init__(self, inputs=()):
+        self.outputs = []
+        self.inputs = list(inputs)
+
+    async def output(self, out):
+        self.outputs.append(out)
+
+    async def input(self):
+        return self.inputs.pop(0)
+
+
+def test_diff():
+    old = {"a": 1, "nested": {"b": [1, 2], "c": True}, "gone": None}
+    new = {"a": 1, "nested": {"b": [1, 2, 3], "c": 1}, "new": "value"}
+    delta = diff(old, new)
+    assert delta == {"set": [[["nested", "b"], [1, 2, 3]], [["nested", "c"], 1], [["new"], "value"]], "del": [["gone"]]}
+    assert patch(old, delta) == new
+    assert diff(new, new) is None
+
+
+@pytest.mark.asyncio
+async def test_snapshots(tmpdir):
+    snapshots = SnapshotStore(str(tmpdir))
+    state = {"title": "Test", "state": {"turn": 0, "visits": {"start": 1}}}
+    await snapshots.save("channel/1", json.dumps(state))
+    for turn in range(1, 4):
+        state["state"]["turn"] = turn
+        snapshots.save("channel/1", json.dumps(state))
+    await snapshots.flush()
+
+    assert snapshots.keys() == ["channel/1"]
+    assert json.loads(snapshots.load("channel/1")) == state
+    assert os.path.isfile(snapshots._path("channel/1", JOURNAL_SUFFIX))
+
+    await snapshots.remove("channel/1")
+    assert snapshots.load("channel/1") is None
+    assert snapshots.keys() == []
+
+
+@pytest.mark.asyncio
+async def test_checkpoint(tmpdir):
+    eventory.load_ext("inktory")
+    with open("tests/compiled.evory", "r", encoding="utf-8") as f:
+        story = eventory.load(f, backend="pink")
+    snapshots = SnapshotStore(str(tmpdir))
+    instructor = story.narrate(ListEventarrator(), snapshots=snapshots, session_id="session")
+    await instructor.output_turn()
+    instructor.store["visited"] = True
+    await instructor.checkpoint()
+    state = snapshots.load("session")
+    assert json.loads(state) == json.loads(instructor.serialise())
+    instructor.stop()
+
+    narrator = ListEventarrator(["2"])
+    resumed = story.narrate(narrator, snapshots=snapshots, session_id="session")
+    resumed.resume(state)
+    assert resumed.store["visited"] is True
+    assert [choice.text for choice in resumed.story.currentChoices] == ["Thread choice", "Main choice"]
+    await resumed.play()
+    # the resumed session shows the choices it's waiting for again
+    assert narrator.outputs == ["1. Thread choice\n2. Main choice\n", "Took main.\nAfter 1\nFell through.\n"]
+    assert snapshots.load("session") is None
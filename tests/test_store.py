@@ -0,0 +1,24 @@
+from eventory.store import CopyOnWriteDict
+
+
+def test_copy_on_write():
+    base = {"counter": 0, "flags": {"door": False, "nested": {"key": "value"}}, "items": ["cloak"], "untouched": {"a": 1}}
+    store = CopyOnWriteDict(base)
+    assert store == base
+
+    store["counter"] += 1
+    store["flags"]["door"] = True
+    store["flags"]["nested"]["key"] = "other"
+    store["items"].append("hook")
+    del store["untouched"]
+    store["new"] = 1
+
+    assert base == {"counter": 0, "flags": {"door": False, "nested": {"key": "value"}}, "items": ["cloak"], "untouched": {"a": 1}}
+    assert store.to_dict() == {"counter": 1, "flags": {"door": True, "nested": {"key": "other"}}, "items": ["cloak", "hook"], "new": 1}
+    assert list(store) == ["counter", "flags", "items", "new"]
+    assert len(store) == 4
+    assert "untouched" not in store
+
+    other = CopyOnWriteDict(base)
+    assert other["flags"]["door"] is False
+    assert other["untouched"] == {"a": 1}